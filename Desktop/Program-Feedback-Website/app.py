@@ -1,102 +1,25 @@
 import streamlit as st
 import pandas as pd
-from pyairtable import Api
-from PIL import Image
-import plotly.express as px
-import plotly.graph_objects as go
+import os
+import json
+import time
 from collections import defaultdict
-import numpy as np
-import re
-import streamlit.components.v1 as components
-
-# === Manual ID → Startup Name mapping ===
-id_to_name = {
-    "2": "Heuristik",
-    "3": "Metly",
-    "6": "Skor",
-    "7": "Robopedics",
-    "9": "Quix",
-    "10": "Calliope",
-    "12": "Nidus Lab",
-    "13": "Vivra",
-    "14": "Lowerton",
-    "15": "Chemometric Brain",
-    "16": "Stamp",
-    "17": "SheerMe",
-    "18": "Zell",
-    "19": "Anyformat",
-    "21": "Valerdat",
-    "22": "Kestrix Ltd.",
-    "23": "LingLoop (Menorca)",
-    "24": "Stand Up (Menorca)",
-    "26": "Gaddex",
-    "27": "Sheldonn",
-    "28": "Vixiees",
-    "29": "IKI Health Group sL",
-    "30" : "ByteHide"
-}
-
-# === Manual mapping of Airtable record ID to founder names ===
-founder_id_to_name = {
-    "reckEp7yXcc5kUzw4": "Joan Jover",
-    "recc1YJvKk9y9sNre": "Lluis Jover Vilafranca",
-    "recjj5TVqlQ73gIml": "Artem Loginov",
-    "recSj5tMjcNT787Gp": "Dmitry Zaets",
-    "rec9qQtBw86jdfo0x": "Paula Camps",
-    "recOv4tuPs1ZJQeLB": "Nil Rodas",
-    "recmdeZCzXI2DyfDk": "Juan Alberto España Garcia",
-    "recJs9xDdf3GHhhbJ": "Alejandro Fernández Rodríguez",
-    "recq1vn95maYO1AFF": "Diego Pérez Sastre",
-    "recAwUcK4UwYCQ8Nb": "Juan Huguet",
-    "recogcsAZibIk4OPH": "Joaquin Diez",
-    "rec60NVqarI2s48u3": "Rafael Casuso",
-    "recsOZlQNZsFDSqtw": "Henrik Stamm Kristensen",
-    "recAjgqqnSqgN6v8r": "Jacob Kristensen Illán",
-    "recChH7IwT6LQOyv7": "Alejandro Paloma",
-    "recLQijSLzobSCODd": "Víctor Vicente Sánchez",
-    "recmhid6dQCAYG88A": "Antxon Caballero",
-    "recUAQITJFLdtUYIz": "Thomas Carson",
-    "recSrfVzDvKFjILAx": "Patricia Puiggros",
-    "rec9Jv3VH5N3S2H7c": "Silvia Fernandez Mulero",
-    "recD4WlvpZsevcIHT": "Lucy Lyons",
-    "recTqg6QXDwmjKLmg": "Gorka Muñecas",
-    "recW3rDeBmB5tq2Kz": "Anna Torrents",
-    "recvQEIoPUFehzmeJ": "Graeme Harris",
-    "recYcgQh2VU8KcrgU": "Lydia Taranilla",
-    "recb5zUyj1wWDjkgT": "Ana Lozano Portillo",
-    "reclX7It1sxtNFHOW": "Ignacio Barrea",
-    "recqudxt04FlAgcKy": "Santiago Gomez",
-    "recYjsxu2q09VddMK": "Dionís Guzmán",
-    "recR7t8yYqGhlIc3C": "Iván Martínez",
-    "rec7zMyfjA5RSDGmm": "Marc Serra",
-    "rec26pQKXNolvda2P": "Miguel Alves Ribeiro",
-    "recTf976Q3xY0zWnH": "Shakil Satar",
-    "recoyqN8ST1jUO58Y": "Francisco Alejandro Jurado Pérez",
-    "recDBB7bHPU1q397X": "Giorgio Fidei",
-    "recKFc88VGjI7xpJn": "Aditya  Malhotra",
-    "reccZ0ZCEPj48DZ1h": "Carlos Moreno Martín",
-    "recpb9EYIYYU8jrpq": "Abel Navajas",
-    "recxzCofGUvIuTJaM": "Javier Castrillo",
-    "recr0MHr9fQReJy2m": "Eduard  Aran Calonja",
-    "recy3oVDwgLtha2MV": "Carlos  Arboleya",
-    "recWPSZTxNWOvbL4d": "Carlos Saro",
-    "recjVjpczDp5CbYsU": "Alex Sanchez",
-    "rec842iG1sXEsgmf1": "Pablo Pascual",
-    "recGik3FBuGqYbZN5": "Alberto Garagnani",
-    "recuT12JFw2AZIEGX": "Moritz Beck"
-}
-
-def normalize_list(value):
-    """Return a list no matter what Airtable gives back."""
-    if isinstance(value, list):
-        return value
-    if isinstance(value, str):
-        return [value]
-    return [] if value is None or (isinstance(value, float) and pd.isna(value)) else [str(value)]
-
-def get_founder_id(val):
-    """Handle Airtable linked-record objects or plain IDs."""
-    return val.get("id") if isinstance(val, dict) else val
+from datetime import datetime, timezone
+
+from feedback_core import perf, pipeline
+from feedback_core.charts import HUMAN_COLOR, RISK_REWARD_COLOR, cohort_matrix, cohort_pie, score_bars
+from feedback_core.cohorts import COHORT_COLUMN, combine_cohorts
+from feedback_core.config import load_settings
+from feedback_core.fetch import AirtableError
+from feedback_core.flags import CATS
+# build_report only imports reportlab when a PDF is asked for
+from feedback_core.report import MIME as REPORT_MIME, build_report, make_report
+from feedback_core.records import StartupDetails
+from feedback_core.schema import INDIVIDUAL_COLUMNS, REWARD_COLUMNS, RISK_COLUMNS, TEAM_COLUMNS
+from feedback_core.search import SOURCE_CALL, build_search_index
+from feedback_core.view_model import FLAG_COLORS, build_mentor_feedback
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # === Streamlit page config ===
 st.set_page_config(
@@ -104,35 +27,87 @@ st.set_page_config(
     page_icon=".streamlit/static/favicon.png",  # or "🚀", or "📊", or a path to a .png
     layout="wide"
 )
-st.image("https://images.squarespace-cdn.com/content/v1/67811e8fe702fd5553c65249/749161ba-4abb-4514-9642-edc82c1c9c9d/Decelera-Logo.png?format=1500w", width=500)
+st.image(os.path.join(APP_DIR, "decelera_old_logo.png"), width=500)
 
 # === Airtable Config ===
-AIRTABLE_PAT = st.secrets["airtable"]["api_key"]
-BASE_ID = st.secrets["airtable"]["base_id"]
-TABLE_ID = st.secrets["airtable"]["table_id"]
-
-# === Airtable Connection ===
-api = Api(AIRTABLE_PAT)
-table = api.table(BASE_ID, TABLE_ID)
-records = table.all()
-
-# === Convert to DataFrame ===
-df = pd.DataFrame([r["fields"] for r in records])
-
-# === Fix {'specialValue': 'NaN'} values ===
-def fix_cell(val):
-    if isinstance(val, dict) and "specialValue" in val:
-        return float("nan")
-    return val
-
-df = df.applymap(fix_cell)
-
-# === Fallback to Id as startup identifier ===
-df = df[df["Id"].notna()]
-df["Id"] = df["Id"].astype(str)
+try:
+    SECRETS = st.secrets.to_dict()
+except FileNotFoundError:  # no secrets.toml at all: offline demo
+    SECRETS = {}
+# Sync, storage and cohort options (see README.md)
+try:
+    SETTINGS = load_settings(SECRETS, APP_DIR)
+except ValueError as exc:
+    st.error(f"❌ Invalid `.streamlit/secrets.toml`: {exc}")
+    st.stop()
+# Mentors shown at once in EM's Feedback; the rest are paged
+MENTORS_PER_PAGE = 10
+# Search results shown at once
+SEARCH_RESULTS_PER_PAGE = 50
+# Stage timings in the sidebar: [debug] perf collects them for every session and
+# the process totals, ?perf=1 only for the reruns of this session
+SHOW_PERF = SETTINGS.perf or st.query_params.get("perf") == "1"
+
+@st.cache_resource
+def setup_perf_log(path):
+    return perf.log_to(path)
+
+if SETTINGS.perf:
+    perf.enable()
+    if SETTINGS.perf_log:
+        setup_perf_log(SETTINGS.perf_log)
+rerun_trace = perf.start("rerun", session=SHOW_PERF)
+
+# === Airtable snapshots (one store per cohort, shared by every session) ===
+@st.cache_resource
+def get_fetcher():
+    return pipeline.make_fetcher(SETTINGS)
+
+@st.cache_resource
+def get_cohorts():
+    # Cohorts are only loaded when first selected
+    return pipeline.open_cohorts(SETTINGS, get_fetcher())
+
+@st.cache_resource
+def get_details(cohort_name):
+    return pipeline.make_detail_loader(SETTINGS, cohorts[cohort_name].store)
+
+@st.cache_resource
+def get_image_cache():
+    return pipeline.make_image_cache(SETTINGS)
+
+def format_age(fetched_at):
+    """Human-readable age of a snapshot, e.g. '3 min ago'."""
+    seconds = int((datetime.now(timezone.utc) - fetched_at).total_seconds())
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{seconds // 60} min ago"
+    return f"{seconds // 3600} h {seconds % 3600 // 60} min ago"
+
+cohorts = get_cohorts()
+with st.sidebar:
+    cohort_name = st.selectbox("Program", cohorts.names, index=cohorts.names.index(SETTINGS.default_cohort),
+                               disabled=len(cohorts) < 2)
+    compare_with = st.multiselect(
+        "Compare with", [n for n in cohorts.names if n != cohort_name],
+        help="Other programs are only loaded when selected here",
+    ) if len(cohorts) > 1 else []
+    refresh = st.button("🔄 Refresh now", help="Fetch the latest feedback from Airtable",
+                        disabled=SETTINGS.offline)
+cohort = cohorts[cohort_name]
+names = cohort.names
+
+try:
+    store = cohort.store
+except FileNotFoundError:
+    st.error("❌ Offline mode: no local snapshot found. Add Airtable credentials to `.streamlit/secrets.toml`.")
+    st.stop()
+# A cold start without a snapshot file syncs while the page header renders
+store.prefetch()
 
 # === General Stats ===
-st.title("Decelera 2025 Program Feedback Dashboard")
+st.title(f"Decelera {cohort.name} Program Feedback Dashboard")
 
 st.markdown("""
 **This dashboard summarizes real-time feedback from Decelera Experience Makers, from the team, and multiple due dilligiences conducted.**  
@@ -140,466 +115,72 @@ st.markdown("""
 Use the dropdown below to explore each startup’s evaluation, or scroll down for program-wide insights.
             
 """)
-
-
-st.subheader("General view of the Program")
-total_reviews = df["Number of Reviews"].fillna(0).sum()
-avg_risk = df["Average RISK"].mean()
-avg_reward = df["Average Reward"].mean()
-num_startups = df["Id"].nunique()
-
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("Number of Startups", num_startups)
-col2.metric("Total Reviews", int(total_reviews))
-col3.metric("Average Risk", f"{avg_risk:.2f}" if pd.notna(avg_risk) else "N/A")
-col4.metric("Average Reward", f"{avg_reward:.2f}" if pd.notna(avg_reward) else "N/A")
-
-# Sum the counts from all rows
-yes_total = df["Investable_Yes_Count"].fillna(0).sum()
-no_total = df["Investable_No_Count"].fillna(0).sum()
-
-# Create pie chart data
-pie_data = pd.DataFrame({
-    "Response": ["Yes", "No"],
-    "Count": [yes_total, no_total]
-})
-
-# Plot using Plotly
-fig_pie = px.pie(
-    pie_data,
-    names="Response",
-    values="Count",
-    color="Response",
-    color_discrete_map={"Yes": "green", "No": "red"},
-    title="Experience Makers' Investability Votes"
-)
-
-fig_pie.update_traces(textinfo="label+percent", pull=[0.05, 0])
-fig_pie.update_layout(height=400, showlegend=False)
-
-st.plotly_chart(fig_pie, use_container_width=True)
-
-# Define score tiers
-def classify(value):
-    if value > 3.5:
-        return "High"
-    elif value > 2.5:
-        return "Medium"
-    else:
-        return "Low"
-
-# Classify each startup
-df["Risk Level"] = df["Average RISK"].apply(classify)
-df["Reward Level"] = df["Average Reward"].apply(classify)
-
-# Define labels from ID mapping
-df["Startup Label"] = df["Id"].apply(lambda x: id_to_name.get(x, f"ID {x}"))
-
-# Clean subset for plotting
-plot_df = df[["Startup Label", "Average RISK", "Average Reward"]].dropna()
-
-# Create scatter plot with unique color per startup
-fig = px.scatter(
-    plot_df,
-    x="Average RISK",
-    y="Average Reward",
-    color="Startup Label",         # 🟢 each startup gets unique color
-    text="Startup Label",
-    labels={
-        "Average RISK": "Risk Score",
-        "Average Reward": "Reward Score"
-    }
-)
-fig.update_xaxes(autorange = "reversed")
-
-
-# Improve style
-fig.update_traces(
-    textposition='top center',
-    textfont_color='black',
-    marker=dict(size=12, line=dict(width=1, color='DarkSlateGrey'))
-)
-
-fig.update_layout(
-    height=600,
-    xaxis=dict(range=[4, 1], dtick=1, constrain="domain"),
-    yaxis=dict(range=[1, 4], dtick=1),
-    title="Risk vs. Reward Matrix",
-    title_x=0.5,
-    showlegend=False,  # Optional: turn off if too many startups
-    shapes=[
-        dict(type="line", x0=2.5, x1=2.5, y0=0, y1=4.2, line=dict(dash="dot", color="grey", width=1)),
-        dict(type="line", x0=0, x1=4.2, y0=2.5, y1=2.5, line=dict(dash="dot", color="grey", width=1))
-    ]
-)
-# Etiquetas de cuadrantes
-fig.add_annotation(x=1.25, y=3.8, text="Riesgo alto, recompensa alta", showarrow=False, font=dict(size=12))
-fig.add_annotation(x=3.5,  y=3.8, text="Riesgo bajo, recompensa alta", showarrow=False, font=dict(size=12))
-fig.add_annotation(x=1.25, y=1.4, text="Riesgo alto, recompensa baja", showarrow=False, font=dict(size=12))
-fig.add_annotation(x=3.5,  y=1.4, text="Riesgo bajo, recompensa baja", showarrow=False, font=dict(size=12))
-
-st.plotly_chart(fig, use_container_width=True)
-
-# === Dropdown
-startup_ids = sorted(df["Id"].unique())
-
-
-# === Dropdown using hardcoded ID → Name mapping ===
-valid_ids = [id_ for id_ in df["Id"].unique() if id_ in id_to_name]
-selected_id = st.selectbox(
-    "Choose a Startup",
-    options=sorted(valid_ids, key=int),
-    format_func=lambda x: id_to_name.get(x, f"Startup {x}")
-)
-
-filtered = df[df["Id"] == selected_id]
-if filtered.empty:
-    st.warning("❌ No data for the selected startup.")
-    st.stop()
-
-row = filtered.iloc[0]
-
-st.subheader(f"Evaluation for {id_to_name.get(selected_id, selected_id)}")
-
-# === Display logo if available
-logo_data = row.get("original logo")
-
-if isinstance(logo_data, list) and len(logo_data) > 0 and "url" in logo_data[0]:
-    logo_url = logo_data[0]["url"]
-    st.image(logo_url, width=400)
+perf.mark("page.first_render")
+
+skeleton = st.empty()
+if not store.ready:
+    with skeleton.container():
+        st.info("Loading the program from Airtable for the first time, this takes a few seconds…")
+        for section in ("General view of the Program", "Business Metrics"):
+            st.subheader(section)
+            st.caption("Loading…")
+
+with st.spinner("Syncing feedback from Airtable…"):
+    with perf.stage("page.sync"):
+        snapshot = cohort.refresh() if refresh else store.get()
+skeleton.empty()
+df = snapshot.df
+# Typed records, parsed per-startup views and cohort stats, built once per snapshot
+records = pipeline.startup_records(snapshot)
+views = pipeline.startup_views(snapshot)
+cohort_stats = pipeline.cohort_stats(snapshot)
+if store.offline:
+    st.sidebar.caption(f"Offline mode: local snapshot from {snapshot.synced_at:%Y-%m-%d %H:%M:%S} UTC.")
 else:
-    st.info("No logo available for this startup.")
-
-
-st.markdown(" ")
-# -------------------------------------------------------------------
-# 💸 1) INVESTABILITY  ───────────────────────────────────────────────
-# -------------------------------------------------------------------
-st.markdown("## Business Metrics")
-
-st.subheader("💸 Investability")
-
-yes_votes  = row.get("Investable_Yes_Count", 0) or 0
-no_votes   = row.get("Investable_No_Count", 0) or 0
-total_votes = yes_votes + no_votes
-yes_ratio   = (yes_votes / total_votes * 100) if total_votes else 0
-
-#–– yes / no / ratio  (3-column row)
-col_yes, col_no, col_ratio = st.columns(3)
-col_yes.metric("✅ Yes Votes",  int(yes_votes))
-col_no.metric("❌ No Votes",    int(no_votes))
-col_ratio.metric("🟢 Yes Ratio", f"{yes_ratio:.1f}%" if total_votes else "—")
-
-# horizontal rule between the two big blocks
-st.markdown("---")
-
-st.subheader("Risk/Reward")
-
-st.markdown("The following are the averages for the PROGRAM")
-col11, col22= st.columns(2)
-col11.metric("Average Risk", f"{avg_risk:.2f}" if pd.notna(avg_risk) else "N/A")
-col22.metric("Average Reward", f"{avg_reward:.2f}" if pd.notna(avg_reward) else "N/A")
-
-# === Average Risk and Reward (Side by Side)
-st.markdown("The following are the averages for the STARTUP you selected")
-risk_col, reward_col = st.columns(2)
-
-risk_col.metric("Average Risk", round(row.get("Average RISK", 0), 2))
-reward_col.metric("Average Reward", round(row.get("Average Reward", 0), 2))
-
-st.markdown("""- **Risk**: based on  
-  • *State of Development: How do you assess the current State of Development of the product?*  
-  • *Momentum: Is the market momentum favorable in terms of trends, legislation, and market dynamics?*  
-  • *Management: Does the company have the necessary expertise and execute effectively?*
-
-- **Reward**: based on  
-  • *Market potential: Is it large, accessible, and not overly competitive?*  
-  • *Team strength: Does the team seem to have a strong bond and complement each other?*  
-  • *Pain relevance: Does it address a real and significant problem in the market?*  
-  • *Scalability: Is there a clear and feasible path for growth and expansion?*
-
-All metrics are scored on a **scale from 1 to 4**, with 4 being the most favorable.""")
-
-st.subheader("Risk Breakdown")
-
-risk_scores = {
-    "State of Development": row.get("Average RISK | State of development_Score", 0),
-    "Momentum": row.get("Average RISK | Momentum_Score", 0),
-    "Management": row.get("Average RISK | Management_Score", 0),
-}
-
-risk_df = pd.DataFrame.from_dict(risk_scores, orient="index", columns=["Score"]).reset_index()
-risk_df.columns = ["Category", "Score"]
-
-fig_risk = px.bar(
-    risk_df,
-    x="Category",
-    y="Score",
-    text="Score",
-    color_discrete_sequence=["rgb(29, 202, 237)"]
-)
-fig_risk.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-fig_risk.update_layout(yaxis_range=[1, 4], height=450)
-
-st.plotly_chart(fig_risk, use_container_width=True)
-
-st.subheader("Reward Breakdown")
-
-reward_scores = {
-    "Market": row.get("Average Reward | Market_Score", 0),
-    "Team": row.get("Average Reward | Team_Score", 0),
-    "Pain": row.get("Average Reward | Pain_Score", 0),
-    "Scalability": row.get("Average Reward | Scalability_Score", 0),
-}
-
-reward_df = pd.DataFrame.from_dict(reward_scores, orient="index", columns=["Score"]).reset_index()
-reward_df.columns = ["Category", "Score"]
-
-fig_reward = px.bar(
-    reward_df,
-    x="Category",
-    y="Score",
-    text="Score",
-    color_discrete_sequence=["rgb(29, 202, 237)"]
-)
-fig_reward.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-fig_reward.update_layout(yaxis_range=[1, 4], height=450)
-
-st.plotly_chart(fig_reward, use_container_width=True)
-
-# --- 1. Names list stays the same ------------------------------------------
-JUDGE_NAMES = [
-    "Jorge Gonzalez-Iglesias", "Juan de Antonio", "Adam Beguelin",
-    "Alejandro Lopez", "Alex Barrera", "Álvaro Dexeus", "Anastasia Dedyukhina",
-    "Andrea Klimowitz", "Anna  Fedulow", "Bastien  Pierre Jean Gambini",
-    "Beth Susanne", "David Beratech", "Elise Mitchell", "Esteban Urrea",
-    "Fernando Cabello", "Gennaro Bifulco", "Ivan Alaiz", "Ivan Nabalon",
-    "Ivan Peña", "Jair Halevi", "Jason Eckenroth", "Javier Darriba",
-    "Juan Pablo Tejela", "Laura Montells", "Manel Adell", "Oscar Macia",
-    "Paul Ford", "Pedro Claveria", "Philippe Gelis", "Ranny Nachmais",
-    "Rebeca De Sancho", "Rui Fernandes", "Sean Cook", "Shadi  Yazdan",
-    "Shari Swan", "Stacey  Ford", "Sven  Huber", "Torsten Kolind", "Jaime", "John Varuguese", "Elise Mitchel"
-]
-
-# --- 2. Simple HTML cleaner (unchanged) ------------------------------------
-_HTML_BREAK_RE = re.compile(r"<br\s*/?>", flags=re.I)
-
-def _clean_html(raw: str) -> str:
-    if not isinstance(raw, str):
-        return raw or ""
-    txt = _HTML_BREAK_RE.sub("\n", raw)
-    txt = txt.replace("**", "")
-    return txt.strip()
-
-# --- 3. Updated NAME regex --------------------------------------------------
-# It matches a judge name followed by EITHER:
-#   • end-of-string
-#   • whitespace
-#   • a capital letter (for “State”, “Momentum”…), a colon, or a newline
-CATS = [
-    "State of development", "Momentum", "Management",
-    "Market", "Team", "Pain", "Scalability",
-]
-
-# === Expresión regular para categorías (con ":")
-_CAT_RE = re.compile(r"(" + "|".join(map(re.escape, CATS)) + r")\s*:", flags=re.I)
-
-# === Expresión regular para nombres de mentor
-_NAME_RE = re.compile(
-    r"(" + "|".join(re.escape(n) for n in JUDGE_NAMES) + r")(?=$|\s|[A-Z])",
-    flags=re.I
-)
-
-def extract_mentor_scores(row) -> dict[str, dict[str, float]]:
-    mentor_scores = defaultdict(dict)
-
-    for cat in CATS:
-        field_name = f"{cat} | Mentor Scores"
-        raw = row.get(field_name)
-        if not raw:
-            continue
-        entries = normalize_list(raw)
-        for entry in entries:
-            parts = [p.strip() for p in entry.split(",")]
-            for p in parts:
-                if ": " in p:
-                    name, score = p.split(": ")
-                    try:
-                        mentor_scores[name.strip()][cat.lower()] = float(score.strip())
-                    except ValueError:
-                        continue
-    return mentor_scores
-
-# === Formatea texto con puntuaciones del mentor
-def _format_categories(text: str, scores: dict[str, float] | None = None) -> str:
-    text = _clean_html(text)
-    matches = list(_CAT_RE.finditer(text))
-    if not matches:
-        return text.strip()
-
-    out = []
-
-    if matches[0].start() > 0:
-        out.append(text[:matches[0].start()].strip())
-
-    for idx, match in enumerate(matches):
-        label = match.group(1).strip()
-        key = label.lower()
-        start = match.end()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
-        body = text[start:end].strip()
-
-        score = scores.get(key) if scores else None
-        score_text = f" ({score:.2f})" if score is not None and pd.notna(score) else ""
-        out.append(f"**{label}{score_text}:** {body}")
-
-    return "\n\n".join(out)
-
-# === Extrae (mentor, comentario sin procesar) desde string largo
-def _group_by_mentor(raw: str) -> list[tuple[str, str]]:
-    text = _clean_html(raw)
-    hits = list(_NAME_RE.finditer(text))
-
-    if not hits:
-        yield "Anonymous", text.strip()
+    st.sidebar.caption(
+        f"Data as of {snapshot.synced_at:%Y-%m-%d %H:%M:%S} UTC ({format_age(snapshot.synced_at)}). "
+        f"Synced every {SETTINGS.cache_ttl} s ({SETTINGS.sync_mode})."
+    )
+    if store.syncing:
+        st.sidebar.caption("Syncing in the background…")
+    if store.last_error is not None:
+        st.sidebar.warning(f"Last sync failed, showing the previous data: {store.last_error}")
+
+# Cohort averages shown in several sections
+avg_risk = cohort_stats.mean("Average RISK")
+avg_reward = cohort_stats.mean("Average Reward")
+
+# === Startup vs. cohort (percentile, rank, z-score) ===
+def render_cohort_position(record, labels_to_columns, key):
+    """Expander comparing the selected startup with the cohort on each column."""
+    position = cohort_stats.for_startup(record.startup_id, labels_to_columns.values())
+    if position.empty:
         return
-
-    for idx, hit in enumerate(hits):
-        mentor = hit.group(1).strip()
-        start = hit.end()
-        end = hits[idx + 1].start() if idx + 1 < len(hits) else len(text)
-        comment = text[start:end].lstrip(' :–').strip()
-        if comment:
-            yield mentor, comment
-
-# === Junta todas las banderas (green/yellow/red) para cada mentor
-def collect_flag_records(row):
-    flag_fields = [
-        ("RISK | Green_exp",   "green"),
-        ("RISK | Yellow_exp",  "yellow"),
-        ("RISK | Red_exp",     "red"),
-        ("Reward | Green_exp", "green"),
-        ("Reward | Yellow_exp","yellow"),
-        ("Reward | Red_exp",   "red"),
-    ]
-
-    records = []
-    for field, color in flag_fields:
-        for raw in normalize_list(row.get(field, [])):
-            for mentor, raw_comment in _group_by_mentor(raw):
-                records.append((mentor, color, raw_comment))
-    return records
-
-# === Pinta cada mentor y su lista de flags con puntuaciones
-def render_flags_by_mentor(row):
-    st.markdown("#### 🚩 EM's Feedback")
-
-    mentor_scores = extract_mentor_scores(row)
-    records = collect_flag_records(row)
-
-    if not records:
-        st.markdown("_No hay feedback para este startup._")
-        return
-
-    # Agrupar por mentor y color
-    grouped = defaultdict(lambda: defaultdict(list))  # mentor → color → [raw_text]
-
-    for mentor, color, raw_comment in records:
-        grouped[mentor][color].append(raw_comment)
-
-    color_to_emoji = {"green": "🟢", "yellow": "🟡", "red": "🔴"}
-
-    for mentor in sorted(grouped):
-        st.markdown(f"### 👤 **{mentor}**")
-        scores = extract_mentor_scores(row).get(mentor, {})
-
-        for color in ["red", "yellow", "green"]:
-            comments = grouped[mentor].get(color, [])
-            if not comments:
-                continue
-
-            emoji = color_to_emoji.get(color, "⚪️")
-            st.markdown(f"{emoji} **{color.capitalize()} Flag**")
-
-            # Agrupar y mostrar todo como lista
-            all_formatted = []
-            for comment in comments:
-                formatted = _format_categories(comment, scores=scores)
-                all_formatted.append(formatted)
-
-            st.markdown("\n\n".join(all_formatted))
-            st.markdown("---")
-
-render_flags_by_mentor(row)
-
-st.markdown("## 👤 Individual Human Metrics")
-
-# -------------------------------------------------------------------
-# 🧠 2) UNCONVENTIONAL THINKING  ─────────────────────────────────────
-# -------------------------------------------------------------------
-
-startup_ut_talks = normalize_list(row.get("Talks | Unconventional thinking (Founder & Score)", []))
-talks_ut_list = [p.strip() for entry in startup_ut_talks for p in entry.split(", ")]  # tenemos nuestra lista de founder: tag
-
-startup_ut_works = normalize_list(row.get("Workstations | Unconventional Thinking (Founder & Score)", []))
-works_ut_list = [p.strip() for entry in startup_ut_works for p in entry.split(", ")]
-
-startup_ut_ind = normalize_list(row.get("Individual Contest | Unconventional Thinking (Founder & Score)", []))
-ind_ut_list = [p.strip() for entry in startup_ut_ind for p in entry.split(", ")]
-
-list_ut = [talks_ut_list, works_ut_list, ind_ut_list]
-#Vamos a contar cuantas de cada hay por founder
-scores_count_ut = defaultdict(lambda: {"Bonus Star": 0, "Red Flag": 0})
-for l in list_ut:
-    for tag in l:
-        nombre, score = tag.split(": ")
-        nombre = nombre.strip()
-        score = score.strip()
-        if "Bonus" in score:
-            scores_count_ut[nombre]["Bonus Star"] += 1
-        elif "Red" in score:
-            scores_count_ut[nombre]["Red Flag"] += 1
-
-if scores_count_ut:
-    st.subheader("🧠 Unconventional Thinking")
-    for nombre in sorted(scores_count_ut):
-        st.markdown(f"**{nombre}**")
-        col_bonus, col_red = st.columns(2)
-        col_bonus.metric("⭐ Bonus Star", int(scores_count_ut[nombre]["Bonus Star"]))
-        col_red.metric("🚩 Red Flag",    int(scores_count_ut[nombre]["Red Flag"]))
-
-# --------Ambition y Confidence (de Individual Contest)----------------------------
-
-startup_conf = normalize_list(row.get("Individual Contest | Confidence (Founder & Score)", []))
-ind_conf_list = [p.strip() for entry in startup_conf for p in entry.split(", ")]
-
-startup_amb = normalize_list(row.get("Individual Contest | Ambition (Founder & Score)", []))
-ind_amb_list = [p.strip() for entry in startup_amb for p in entry.split(", ")]
-
-scores_count_conf = defaultdict(lambda: {"Bonus Star": 0, "Red Flag": 0})
-scores_count_amb = defaultdict(lambda: {"Bonus Star": 0, "Red Flag": 0})
-
-for tag in ind_conf_list:
-    if ": " in tag:
-        nombre, score = tag.split(": ")
-        nombre = nombre.strip()
-        score = score.strip()
-        if "Bonus" in score:
-            scores_count_conf[nombre]["Bonus Star"] += 1
-        elif "Red" in score:
-            scores_count_conf[nombre]["Red Flag"] += 1
-
-for tag in ind_amb_list:
-    if ": " in tag:
-        nombre, score = tag.split(": ")
-        nombre = nombre.strip()
-        score = score.strip()
-        if "Bonus" in score:
-            scores_count_amb[nombre]["Bonus Star"] += 1
-        elif "Red" in score:
-            scores_count_amb[nombre]["Red Flag"] += 1
-
-for title, score_dict in zip(["Confidence", "Ambition"], [scores_count_conf, scores_count_amb]):
+    labels = {col: label for label, col in labels_to_columns.items()}
+    table = pd.DataFrame({
+        "Metric": [labels[c] for c in position.index],
+        "Startup": [record.scores.get(c) for c in position.index],
+        "Cohort mean": position["mean"].values,
+        "Cohort median": position["median"].values,
+        "Percentile": position["percentile"].values,
+        "Rank": [f"{r:.0f} / {n:.0f}" if pd.notna(r) else "—" for r, n in zip(position["rank"], position["count"])],
+        "z-score": position["z"].values,
+    })
+    with st.expander("📊 Your percentile vs. cohort"):
+        st.dataframe(
+            table,
+            hide_index=True,
+            key=key,
+            column_config={
+                "Startup": st.column_config.NumberColumn(format="%.2f"),
+                "Cohort mean": st.column_config.NumberColumn(format="%.2f"),
+                "Cohort median": st.column_config.NumberColumn(format="%.2f"),
+                "Percentile": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100),
+                "z-score": st.column_config.NumberColumn(format="%+.2f"),
+            },
+        )
+
+def render_tag_counts(title, score_dict):
     if score_dict:
         st.subheader(title)
         for nombre in sorted(score_dict):
@@ -608,294 +189,443 @@ for title, score_dict in zip(["Confidence", "Ambition"], [scores_count_conf, sco
             col_bonus.metric("⭐ Bonus Star", int(score_dict[nombre]["Bonus Star"]))
             col_red.metric("🚩 Red Flag", int(score_dict[nombre]["Red Flag"]))
 
-# ====Individual Human Metrics========================================================
-
-st.markdown("""
-**The following are the averages for the program and below the breakdown for the selected startup**
-""")
-
-individual_columns = [
-    "Purpose | Average",
-    "Openness | Average",
-    "Integrity and honesty | Average",
-    "Relevant experience | Average",
-    "Visionary leadership | Average",
-    "Flexibility | Average",
-    "Emotional intelligence | Average"
-]
-
-cohort_ind_means = df[individual_columns].mean()
-
-avg_cols_ind = st.columns(len(individual_columns))
-for i, col in enumerate(individual_columns):
-    pillar = col.split(" |")[0]
-    avg_cols_ind[i].metric(pillar, f"{cohort_ind_means[col]:.2f}")
-
-table_purp = normalize_list(row.get("Purpose | Founder & Score", []))
-tags_purp = [p.strip() for entry in table_purp for p in entry.split(", ")]
-
-table_open = normalize_list(row.get("Openness | Founder & Score", []))
-tags_open = [p.strip() for entry in table_open for p in entry.split(", ")]
-
-table_int = normalize_list(row.get("Integrity and honesty | Founder & Score", []))
-tags_int = [p.strip() for entry in table_int for p in entry.split(", ")]
-
-table_rel = normalize_list(row.get("Relevant experience | Founder & Score", []))
-tags_rel = [p.strip() for entry in table_rel for p in entry.split(", ")]
-
-table_vis = normalize_list(row.get("Visionary leadership | Founder & Score", []))
-tags_vis = [p.strip() for entry in table_vis for p in entry.split(", ")]
-
-table_flex = normalize_list(row.get("Flexibility | Founder & Score", []))
-tags_flex = [p.strip() for entry in table_flex for p in entry.split(", ")]
-
-table_emo = normalize_list(row.get("Emotional intelligence | Founder & Score", []))
-tags_emo = [p.strip() for entry in table_emo for p in entry.split(", ")]
-
-list_hum = [tags_purp, tags_open, tags_int, tags_rel, tags_vis, tags_flex, tags_emo]
-campos_hum = ["Purpose", "Openness", "Integrity and honesty", "Relevant experience", "Visionary leadership", "Flexibility", "Emotional intelligence"]
-
-rec_hum = defaultdict(lambda: defaultdict(list))
+# OLBI descriptor → colored dot
+def flag_color(text):
+    if isinstance(text, str):
+        text = text.lower()
+        if "high" in text:
+            return "🔴"
+        elif "moderate" in text:
+            return "🟡"
+        elif "low" in text:
+            return "🟢"
+    return "⚪️"
 
-for i, lista in enumerate(list_hum):
-    campo = campos_hum[i]
-    for entrada in lista:
-        if ": " in entrada:
-            nombre, valor = entrada.split(": ")
+def perf_frame(t):
+    return pd.DataFrame(
+        [{"Stage": k, "Calls": calls, "ms": seconds * 1e3} for k, (calls, seconds) in t.stages.items()],
+        columns=["Stage", "Calls", "ms"],
+    ).sort_values("ms", ascending=False)
+
+def render_perf_panel(t):
+    """Stage timings and counters of this rerun and, with ``[debug] perf``, since start-up."""
+    ms = st.column_config.NumberColumn(format="%.1f")
+    with st.sidebar.expander("⏱ Performance", expanded=True):
+        st.caption(f"This rerun: {t.seconds * 1e3:.0f} ms on the server, browser rendering not included. "
+                   "Reruns of a single section only count in the totals.")
+        st.dataframe(perf_frame(t), hide_index=True, column_config={"ms": ms})
+        if t.counters:
+            st.dataframe(pd.DataFrame(t.counters.items(), columns=["Counter", "Value"]), hide_index=True)
+        export = {"rerun": t.as_dict()}
+        # Process totals need [debug] perf; ?perf=1 alone only times this session
+        if perf.enabled():
+            st.markdown("**Since start-up** (all sessions and background syncs)")
+            st.dataframe(perf_frame(perf.TOTALS), hide_index=True, column_config={"ms": ms})
+            if perf.TOTALS.counters:
+                st.dataframe(pd.DataFrame(perf.TOTALS.counters.items(), columns=["Counter", "Value"]),
+                             hide_index=True)
+            export["process"] = perf.TOTALS.as_dict()
+        st.download_button("Download JSON", file_name="perf.json", mime="application/json",
+                           data=json.dumps(export, indent=1), on_click="ignore")
+
+# === Page sections ===
+# Each section is a fragment: interacting with a widget inside one (the startup
+# picker, the EM feedback pages) reruns that fragment only, not the whole script.
+
+@st.fragment
+@perf.timed("page.cohort_overview")
+def cohort_overview():
+    st.subheader("General view of the Program")
+    summary = pipeline.program_summary(snapshot)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Number of Startups", summary["Startups"])
+    col2.metric("Total Reviews", summary["Reviews"])
+    col3.metric("Average Risk", f"{avg_risk:.2f}" if pd.notna(avg_risk) else "N/A")
+    col4.metric("Average Reward", f"{avg_reward:.2f}" if pd.notna(avg_reward) else "N/A")
+
+    st.plotly_chart(snapshot.derived("fig_pie", cohort_pie), use_container_width=True)
+    st.plotly_chart(snapshot.derived("fig_matrix", cohort_matrix), use_container_width=True)
+
+    # === Program comparison (other cohorts are only loaded once selected) ===
+    if compare_with:
+        st.subheader("Comparison with other Programs")
+        snapshots = {cohort.name: snapshot}
+        for other in compare_with:
             try:
-                rec_hum[nombre.strip()][campo].append(float(valor.strip()))
-            except ValueError:
-                continue
-
-df_hum = {}
-for nombre, campos in rec_hum.items():
-    rows = []
-    for campo, valores in campos.items():
-        if valores:
-            media = sum(valores) / len(valores)
-            rows.append({"Campo": campo, "Media": media})
-    df_hum[nombre] = pd.DataFrame(rows)
-
-i = 0
-for nombre in sorted(df_hum):
-    data = df_hum[nombre]
-    if not data.empty:
-
-            fig_ft = px.bar(
-                data,
-                x="Campo",
-                y="Media",
-                text="Media",
-                barmode="group",
-                title= f"{nombre}",
-                color_discrete_sequence=["rgb(52, 199, 89)"],
-                height=350,
-            )
-
-            fig_ft.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-            fig_ft.update_layout(
-                yaxis_range=[1, 4],
-                height=450,
-                xaxis_tickangle=-45,
-                margin=dict(t=50, b=0),
-            )
-            st.plotly_chart(fig_ft, use_container_width=True, key=f"fig_{i}")
-            i += 1
-    else:
-        st.info(f"No feedback for individual metrics.")
-
-
-# === Team Human Metrics =====================================================
-st.markdown("## 👥 Team Human Metrics")
-st.markdown("""
-**The following are the averages for the program and below the breakdown for the selected startup**
-""")
-
-team_columns = [
-    "Conflict resolution | Average",
-    "Clear vision alignment | Average",
-    "Clear roles | Average",
-    "Complementary hard skills | Average",
-    "Execution and speed | Average",
-    "Team ambition | Average",
-    "Confidence and mutual respect | Average",
-    "Product and Customer Focus | Average",
-]
-
-# --- Scores for the chosen startup ------------------------------------------
-startup_team_scores = {c.split(" |")[0]: row.get(c, 0) for c in team_columns}
-
-# --- Cohort-wide averages ----------------------------------------------------
-cohort_team_means = df[team_columns].mean()
-
-# ── Show cohort averages as headline metrics ────────────────────────────────
-avg_cols = st.columns(len(team_columns))
-for i, col in enumerate(team_columns):
-    pillar = col.split(" |")[0]
-    avg_cols[i].metric(pillar, f"{cohort_team_means[col]:.2f}")
-
-# ── Bar chart of the startup’s own scores ───────────────────────────────────
-team_df = (
-    pd.DataFrame({
-        "Metric": list(startup_team_scores.keys()),
-        "Score":  list(startup_team_scores.values()),
-    })
-)
-
-fig_team = px.bar(
-    team_df,
-    x="Metric",
-    y="Score",
-    text="Score",
-    color_discrete_sequence=["rgb(52, 199, 89)"],
-)
-fig_team.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-fig_team.update_layout(
-    yaxis_range=[0, 4],
-    height=450,
-    xaxis_tickangle=-45,
-    margin=dict(t=50, b=0),
-)
-
-st.plotly_chart(fig_team, use_container_width=True)
-
-# =====Human Call Results Section========================================
+                with st.spinner(f"Loading {other} feedback…"):
+                    snapshots[other] = cohorts[other].store.get()
+            except FileNotFoundError:
+                st.warning(f"No local snapshot for {other}.")
+
+        comparison = pd.DataFrame([
+            {"Program": name, **pipeline.program_summary(s)} for name, s in snapshots.items()
+        ])
+        st.dataframe(comparison, hide_index=True, column_config={
+            "Average Risk": st.column_config.NumberColumn(format="%.2f"),
+            "Average Reward": st.column_config.NumberColumn(format="%.2f"),
+        })
+
+        combined = combine_cohorts({name: s.df.drop_duplicates("Id") for name, s in snapshots.items()})
+        long = combined.melt(id_vars=[COHORT_COLUMN], value_vars=["Average RISK", "Average Reward"],
+                             var_name="Metric", value_name="Score").dropna()
+        import plotly.express as px  # only needed when programs are compared
+        fig_cmp = px.box(long, x="Metric", y="Score", color=COHORT_COLUMN, points="all",
+                         title="Score distribution by Program")
+        fig_cmp.update_layout(height=450, yaxis=dict(range=[1, 4.2]))
+        st.plotly_chart(fig_cmp, use_container_width=True)
+
+@st.fragment
+@perf.timed("page.feedback_search")
+def feedback_search():
+    """Words and filters over every startup's mentor comments and call notes."""
+    st.markdown("## 🔎 Search Feedback")
+    # ?startup=<name or Id>, repeatable, links to the search of those startups
+    linked = st.query_params.get_all("startup")
+    if not st.toggle("Search the mentor comments and call notes of every startup", value=bool(linked),
+                     key="search_on"):
+        return
+    with st.spinner("Indexing feedback…"):
+        try:
+            index = pipeline.search_index(snapshot, get_details(cohort.name))
+        except AirtableError as exc:  # not cached: the next rerun asks Airtable again
+            st.warning(f"Could not read the comments from Airtable, searching the snapshot only: {exc}")
+            index = build_search_index(df)
+    startups = pipeline.snapshot_index(snapshot, names)
+    color_to_emoji = {"green": "🟢", "yellow": "🟡", "red": "🔴"}
 
-st.markdown("## 👥 Human Call Results")
+    query = st.text_input("Words", placeholder='e.g. regulation, or "go to market"', key="search_query",
+                          help="Every word must appear; words also match longer ones (regul → regulation).")
+    col_flag, col_cat, col_mentor, col_startup = st.columns(4)
+    colors = col_flag.multiselect("Flag", FLAG_COLORS, key="search_colors",
+                                  format_func=lambda c: f"{color_to_emoji[c]} {c.capitalize()}")
+    categories = col_cat.multiselect("Category", CATS, key="search_categories")
+    mentors = col_mentor.multiselect("Mentor", index.mentors, key="search_mentors")
+    linked = [i for i in map(startups.find, linked) if i in startups.labels]
+    selected = col_startup.multiselect("Startup", startups.options, default=linked, key="search_startups",
+                                       format_func=lambda x: startups.labels.get(x, f"Startup {x}"))
+    if not (query.strip() or colors or categories or mentors or selected):
+        st.caption(f"{len(index.entries)} comments and call notes indexed.")
+        return
 
-st.markdown("""
-This section reflects qualitative human due diligence conducted through evaluator calls.  
-It highlights how strong the founders are perceived to be based on expertise, clarity, execution ability, and leadership potential.
-""")
+    start = time.perf_counter()
+    hits = index.search(query, startups=selected, mentors=mentors, colors=colors, categories=categories)
+    st.caption(f"{len(hits)} results ({(time.perf_counter() - start) * 1e3:.1f} ms)")
+    if not hits:
+        return
 
-# === Values from Airtable
-hdd_avg = row.get("HDD_Calls_Average", "N/A")
-hdd_exceptional = row.get("HDD_Calls_Exceptional", 0)
-# Clean evaluator field
-raw_evaluator = row.get("HDD_Calls_Evaluator", "Unknown")
-hdd_evaluator = raw_evaluator[0] if isinstance(raw_evaluator, list) and raw_evaluator else raw_evaluator
-# Clean notes field
-raw_notes = row.get("HDD_Calls_Notes", "No notes provided.")
-hdd_notes = raw_notes[0] if isinstance(raw_notes, list) and raw_notes else raw_notes
+    pages = [hits[i:i + SEARCH_RESULTS_PER_PAGE] for i in range(0, len(hits), SEARCH_RESULTS_PER_PAGE)]
+    page = 0
+    if len(pages) > 1:
+        page = st.selectbox("Results", range(len(pages)), key="search_page",
+                            format_func=lambda p: f"{p * SEARCH_RESULTS_PER_PAGE + 1}–"
+                                                  f"{p * SEARCH_RESULTS_PER_PAGE + len(pages[p])}")
+    # Results of the page grouped by startup, in the order of the startup selector
+    by_startup = defaultdict(list)
+    for hit in pages[page]:
+        by_startup[hit.startup_id].append(hit)
+    rank = {startup_id: n for n, startup_id in enumerate(startups.options)}
+    order = sorted(by_startup, key=lambda i: rank.get(i, len(rank)))
+    for startup_id in order:
+        st.markdown(f"#### {startups.labels.get(startup_id, f'Startup {startup_id}')}")
+        for hit in by_startup[startup_id]:
+            if hit.source == SOURCE_CALL:
+                st.markdown(f"📞 **Call notes** · *{hit.mentor}*: {hit.text}")
+            else:
+                st.markdown(f"{color_to_emoji.get(hit.color, '⚪️')} **{hit.category or 'General'}** · "
+                            f"*{hit.mentor}*: {hit.text}")
+
+@st.fragment
+@perf.timed("page.business_metrics")
+def business_metrics(record):
+    st.markdown(" ")
+    # -------------------------------------------------------------------
+    # 💸 1) INVESTABILITY  ───────────────────────────────────────────────
+    # -------------------------------------------------------------------
+    st.markdown("## Business Metrics")
+
+    st.subheader("💸 Investability")
+
+    yes_votes  = record.yes_votes
+    no_votes   = record.no_votes
+    total_votes = yes_votes + no_votes
+    yes_ratio   = (yes_votes / total_votes * 100) if total_votes else 0
+
+    #–– yes / no / ratio  (3-column row)
+    col_yes, col_no, col_ratio = st.columns(3)
+    col_yes.metric("✅ Yes Votes",  yes_votes)
+    col_no.metric("❌ No Votes",    no_votes)
+    col_ratio.metric("🟢 Yes Ratio", f"{yes_ratio:.1f}%" if total_votes else "—")
+
+    # horizontal rule between the two big blocks
+    st.markdown("---")
+
+    st.subheader("Risk/Reward")
+
+    st.markdown("The following are the averages for the PROGRAM")
+    col11, col22= st.columns(2)
+    col11.metric("Average Risk", f"{avg_risk:.2f}" if pd.notna(avg_risk) else "N/A")
+    col22.metric("Average Reward", f"{avg_reward:.2f}" if pd.notna(avg_reward) else "N/A")
+
+    # === Average Risk and Reward (Side by Side)
+    st.markdown("The following are the averages for the STARTUP you selected")
+    risk_col, reward_col = st.columns(2)
+
+    risk_col.metric("Average Risk", round(record.average_risk, 2))
+    reward_col.metric("Average Reward", round(record.average_reward, 2))
+    render_cohort_position(record, {"Average Risk": "Average RISK", "Average Reward": "Average Reward"}, "pos_avg")
+
+    st.markdown("""
+    - **Risk**: based on  
+      • *State of Development: How do you assess the current State of Development of the product?*  
+      • *Momentum: Is the market momentum favorable in terms of trends, legislation, and market dynamics?*  
+      • *Management: Does the company have the necessary expertise and execute effectively?*
+
+    - **Reward**: based on  
+      • *Market potential: Is it large, accessible, and not overly competitive?*  
+      • *Team strength: Does the team seem to have a strong bond and complement each other?*  
+      • *Pain relevance: Does it address a real and significant problem in the market?*  
+      • *Scalability: Is there a clear and feasible path for growth and expansion?*
+
+    All metrics are scored on a **scale from 1 to 4**, with 4 being the most favorable.""")
+
+    st.subheader("Risk Breakdown")
+
+    risk_scores = {label: record.scores[col] for label, col in RISK_COLUMNS.items()}
+
+    fig_risk = score_bars(risk_scores.keys(), risk_scores.values(), RISK_REWARD_COLOR)
+    st.plotly_chart(fig_risk, use_container_width=True)
+    render_cohort_position(record, RISK_COLUMNS, "pos_risk")
+
+    st.subheader("Reward Breakdown")
+
+    reward_scores = {label: record.scores[col] for label, col in REWARD_COLUMNS.items()}
+
+    fig_reward = score_bars(reward_scores.keys(), reward_scores.values(), RISK_REWARD_COLOR)
+    st.plotly_chart(fig_reward, use_container_width=True)
+    render_cohort_position(record, REWARD_COLUMNS, "pos_reward")
+
+@st.fragment
+@perf.timed("page.em_feedback")
+def em_feedback(startup_id, row):
+    """Mentor feedback, one collapsed expander per mentor and MENTORS_PER_PAGE per page."""
+    st.markdown("#### 🚩 EM's Feedback")
 
-# === Score and Exceptional Tag
-col1, col2 = st.columns(2)
-col1.metric("Average HDD Score -- Out of 4", round(hdd_avg, 2) if pd.notna(hdd_avg) else "N/A")
-col2.metric("Exceptional Founders", "✅ Yes" if hdd_exceptional == 1 else "❌ No")
+    mentors = build_mentor_feedback(row)
+    if not mentors:
+        st.markdown("_No hay feedback para este startup._")
+        return
 
-# === Evaluator
-st.markdown(f"**Evaluator:** {hdd_evaluator}")
+    color_to_emoji = {"green": "🟢", "yellow": "🟡", "red": "🔴"}
 
-# === Notes
-st.markdown("**📝 Notes from the call:**")
-st.info(hdd_notes)
+    # Only the selected page is rendered
+    pages = [mentors[i:i + MENTORS_PER_PAGE] for i in range(0, len(mentors), MENTORS_PER_PAGE)]
+    page = 0
+    if len(pages) > 1:
+        page = st.selectbox(
+            "Mentors", range(len(pages)), key=f"em_page_{startup_id}",
+            format_func=lambda p: f"{pages[p][0].name} – {pages[p][-1].name}",
+        )
+
+    for mentor in pages[page]:
+        n_flags = sum(len(formatted) for formatted in mentor.flags.values())
+        with st.expander(f"👤 **{mentor.name}** ({n_flags} flags)"):
+            for color, formatted in mentor.flags.items():
+                emoji = color_to_emoji.get(color, "⚪️")
+                st.markdown(f"{emoji} **{color.capitalize()} Flag**")
+
+                # Agrupar y mostrar todo como lista
+                st.markdown("\n\n".join(formatted))
+                st.markdown("---")
+
+@st.fragment
+@perf.timed("page.individual_metrics")
+def individual_metrics(record, view):
+    st.markdown("## 👤 Individual Human Metrics")
+
+    # -------------------------------------------------------------------
+    # 🧠 2) UNCONVENTIONAL THINKING  ─────────────────────────────────────
+    # -------------------------------------------------------------------
+
+    render_tag_counts("🧠 Unconventional Thinking", view.unconventional_thinking)
 
-st.markdown("### 🧪 Scientific Analysis Results")
+    # --------Ambition y Confidence (de Individual Contest)----------------------------
 
-# === BRS – Brief Resilience Scale
-st.markdown("""
-**1. BRS – Brief Resilience Scale**  
-*Purpose:* Measures the ability to recover or "bounce back" from stress.  
-*Interpretation:* A high score indicates strong resilience, meaning the person is capable of quickly recovering from emotional setbacks.
-""")
+    render_tag_counts("Confidence", view.confidence)
+    render_tag_counts("Ambition", view.ambition)
+
+    if view.tag_errors:
+        with st.expander(f"⚠️ {len(view.tag_errors)} malformed Founder & Score entries were skipped"):
+            st.dataframe(pd.DataFrame(view.tag_errors).drop(columns="startup_id"), hide_index=True)
 
-raw_calc = row.get("BRS_Calculation", "No interpretation provided.")
-brs_interpretation = raw_calc[0] if isinstance(raw_calc, list) and raw_calc else raw_calc
-st.success(f"**Conclusion:** {brs_interpretation}")
+    # ====Individual Human Metrics========================================================
 
+    st.markdown("""
+    **The following are the averages for the program and below the breakdown for the selected startup**
+    """)
 
-# === GRIT Scale
-st.markdown("""
-**2. GRIT Scale**  
-*Purpose:* Assesses perseverance and passion for long-term goals.  
-*Interpretation:* A high GRIT score reflects consistency in interests and sustained effort over time, even in the face of setbacks.
-""")
 
-raw_grit_calc = row.get("GRIT_Calculation", "No interpretation provided.")
-grit_interpretation = raw_grit_calc[0] if isinstance(raw_grit_calc, list) and raw_grit_calc else raw_grit_calc
-st.success(f"**Conclusion:** {grit_interpretation}")
+    avg_cols_ind = st.columns(len(INDIVIDUAL_COLUMNS))
+    for i, col in enumerate(INDIVIDUAL_COLUMNS):
+        pillar = col.split(" |")[0]
+        avg_cols_ind[i].metric(pillar, f"{cohort_stats.mean(col):.2f}")
+    render_cohort_position(record, {c.split(" |")[0]: c for c in INDIVIDUAL_COLUMNS}, "pos_ind")
 
+    df_hum = view.human_means
+
+    i = 0
+    for nombre in sorted(df_hum):
+        data = df_hum[nombre]
+        if not data.empty:
+
+                fig_ft = score_bars(data["Campo"], data["Media"], HUMAN_COLOR, x_title="Campo",
+                                    y_title="Media", title=nombre, tilted=True)
+                st.plotly_chart(fig_ft, use_container_width=True, key=f"fig_{i}")
+                i += 1
+        else:
+            st.info(f"No feedback for individual metrics.")
+
+@st.fragment
+@perf.timed("page.team_metrics")
+def team_metrics(record):
+    # === Team Human Metrics =====================================================
+    st.markdown("## 👥 Team Human Metrics")
+    st.markdown("""
+    **The following are the averages for the program and below the breakdown for the selected startup**
+    """)
+
+    # --- Scores for the chosen startup ------------------------------------------
+    startup_team_scores = {c.split(" |")[0]: record.scores[c] for c in TEAM_COLUMNS}
+
+
+    # ── Show cohort averages as headline metrics ────────────────────────────────
+    avg_cols = st.columns(len(TEAM_COLUMNS))
+    for i, col in enumerate(TEAM_COLUMNS):
+        pillar = col.split(" |")[0]
+        avg_cols[i].metric(pillar, f"{cohort_stats.mean(col):.2f}")
+
+    # ── Bar chart of the startup’s own scores ───────────────────────────────────
+    fig_team = score_bars(startup_team_scores.keys(), startup_team_scores.values(), HUMAN_COLOR,
+                          x_title="Metric", y_range=(0, 4), tilted=True)
+
+    st.plotly_chart(fig_team, use_container_width=True)
+    render_cohort_position(record, {c.split(" |")[0]: c for c in TEAM_COLUMNS}, "pos_team")
+
+@st.fragment
+@perf.timed("page.human_calls")
+def human_calls(details):
+    # =====Human Call Results Section========================================
+
+    st.markdown("## 👥 Human Call Results")
+
+    st.markdown("""
+    This section reflects qualitative human due diligence conducted through evaluator calls.  
+    It highlights how strong the founders are perceived to be based on expertise, clarity, execution ability, and leadership potential.
+    """)
+
+    # === Values from Airtable
+    # === Score and Exceptional Tag
+    col1, col2 = st.columns(2)
+    col1.metric("Average HDD Score -- Out of 4",
+                round(details.hdd_average, 2) if details.hdd_average is not None else "N/A")
+    col2.metric("Exceptional Founders", "✅ Yes" if details.hdd_exceptional else "❌ No")
+
+    # === Evaluator
+    st.markdown(f"**Evaluator:** {details.hdd_evaluator}")
+
+    # === Notes
+    st.markdown("**📝 Notes from the call:**")
+    st.info(details.hdd_notes)
+
+    st.markdown("### 🧪 Scientific Analysis Results")
+
+    # === BRS – Brief Resilience Scale
+    st.markdown("""
+    **1. BRS – Brief Resilience Scale**  
+    *Purpose:* Measures the ability to recover or "bounce back" from stress.  
+    *Interpretation:* A high score indicates strong resilience, meaning the person is capable of quickly recovering from emotional setbacks.
+    """)
+
+    st.success(f"**Conclusion:** {details.brs}")
+
+
+    # === GRIT Scale
+    st.markdown("""
+    **2. GRIT Scale**  
+    *Purpose:* Assesses perseverance and passion for long-term goals.  
+    *Interpretation:* A high GRIT score reflects consistency in interests and sustained effort over time, even in the face of setbacks.
+    """)
+
+    st.success(f"**Conclusion:** {details.grit}")
+
+
+    st.markdown("""
+    **3. OLBI – Oldenburg Burnout Inventory**  
+    *Purpose:* Evaluates two core dimensions of burnout — **exhaustion** and **disengagement** from work.  
+    *Interpretation:* Helps identify early signs of burnout. High scores on either dimension could indicate emotional fatigue or withdrawal from work tasks.
+    """)
+
+    olbi_exhaust = details.olbi_exhaustion
+    olbi_disengage = details.olbi_disengagement
+
+    # Combine into a single block with icons
+    olbi_summary = f"""
+    **Exhaustion:** {flag_color(olbi_exhaust)} {olbi_exhaust}  
+    **Disengagement:** {flag_color(olbi_disengage)} {olbi_disengage}
+    """
+    st.success(olbi_summary)
+
+@st.fragment
+@perf.timed("page.startup_sections")
+def startup_sections():
+    # === Dropdown using the cohort's ID → Name mapping ===
+    index = pipeline.snapshot_index(snapshot, names)
+    selected_id = st.selectbox(
+        "Choose a Startup",
+        options=index.options,
+        format_func=lambda x: index.labels.get(x, f"Startup {x}")
+    )
+
+    view, record = views.get(selected_id), records.get(selected_id)
+    if view is None or record is None:
+        st.warning("❌ No data for the selected startup.")
+        return
 
-st.markdown("""
-**3. OLBI – Oldenburg Burnout Inventory**  
-*Purpose:* Evaluates two core dimensions of burnout — **exhaustion** and **disengagement** from work.  
-*Interpretation:* Helps identify early signs of burnout. High scores on either dimension could indicate emotional fatigue or withdrawal from work tasks.
-""")
+    # Long texts and the logo are only downloaded for the selected startup
+    with st.spinner("Loading startup details…"):
+        row = index.row(df, selected_id)
+        try:
+            row = get_details(cohort.name).load(row)
+        except AirtableError as exc:
+            st.warning(f"Could not load the startup details from Airtable, showing the snapshot: {exc}")
+    details = StartupDetails.from_row(row)
 
-# Extract descriptors
-raw_olbi_exhaust = row.get("OLBI_Exhaustion_Descriptor", "No result")
-olbi_exhaust = raw_olbi_exhaust[0] if isinstance(raw_olbi_exhaust, list) and raw_olbi_exhaust else raw_olbi_exhaust
+    st.subheader(f"Evaluation for {names.startup(selected_id, selected_id)}")
 
-raw_olbi_disengage = row.get("OLBI_Disengagement_Descriptor", "No result")
-olbi_disengage = raw_olbi_disengage[0] if isinstance(raw_olbi_disengage, list) and raw_olbi_disengage else raw_olbi_disengage
+    # === Display logo if available
+    logo_path = get_image_cache().get(details.logo) if details.logo else None
 
-# Combine into a single block with icons
-def flag_color(text):
-    if isinstance(text, str):
-        text = text.lower()
-        if "high" in text:
-            return "🔴"
-        elif "moderate" in text:
-            return "🟡"
-        elif "low" in text:
-            return "🟢"
-    return "⚪️"
-
-olbi_summary = f"""
-**Exhaustion:** {flag_color(olbi_exhaust)} {olbi_exhaust}  
-**Disengagement:** {flag_color(olbi_disengage)} {olbi_disengage}
-"""
-st.success(olbi_summary)
-
-# ------------------------------------------------------------------
-# 📄  FULL-PAGE “Save as PDF” button – paste at bottom of app.py
-# ------------------------------------------------------------------
-st.markdown("""
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js"></script>
-
-    <style>
-        #savepdf {
-            background-color: #0b6abf;
-            color: white;
-            padding: 0.6rem 1.2rem;
-            font-size: 16px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            margin-top: 30px;
-        }
-    </style>
-
-    <button id="savepdf">⬇️ Descargar esta página en PDF</button>
-
-    <script>
-    const { jsPDF } = window.jspdf;
-
-    document.getElementById("savepdf").addEventListener("click", function () {
-        const body = document.body;
-        html2canvas(body, { scale: 2, useCORS: true }).then(canvas => {
-            const imgData = canvas.toDataURL('image/png');
-            const pdf = new jsPDF('p', 'mm', 'a4');
-            const pageWidth = pdf.internal.pageSize.getWidth();
-            const pageHeight = pdf.internal.pageSize.getHeight();
-            const imgHeight = canvas.height * pageWidth / canvas.width;
-
-            let heightLeft = imgHeight;
-            let position = 0;
-
-            pdf.addImage(imgData, 'PNG', 0, position, pageWidth, imgHeight);
-            heightLeft -= pageHeight;
-
-            while (heightLeft > 0) {
-                position -= pageHeight;
-                pdf.addPage();
-                pdf.addImage(imgData, 'PNG', 0, position, pageWidth, imgHeight);
-                heightLeft -= pageHeight;
-            }
-
-            pdf.save("feedback-decelera.pdf");
-        });
-    });
-    </script>
-""", unsafe_allow_html=True)
+    if logo_path:
+        st.image(logo_path, width=400)
+    else:
+        st.info("No logo available for this startup.")
+
+    business_metrics(record)
+    em_feedback(selected_id, row)
+    individual_metrics(record, view)
+    team_metrics(record)
+    human_calls(details)
+
+    # === PDF report of this startup, built on the server when the button is clicked
+    report = make_report(row, view, cohort_stats, names.startup(selected_id, selected_id), cohort.name,
+                         snapshot.synced_at, logo_path=logo_path)
+    st.download_button("⬇️ Descargar informe en PDF", data=lambda: build_report(report),
+                       file_name=report.file_name, mime=REPORT_MIME, on_click="ignore")
+
+cohort_overview()
+feedback_search()
+startup_sections()
+
+perf.finish(rerun_trace)
+if SHOW_PERF:
+    render_perf_panel(rerun_trace)
@@ -0,0 +1,77 @@
+"""Full refresh of the feedback table and its linked tables from a mock Airtable.
+
+Compares fetching the tables one after another (what the app did through
+pyairtable) with :meth:`AirtableFetcher.fetch_many`, and runs a fetcher
+whose limiter is set too high against the mock's 5 req/s limit to exercise
+the 429 retries.
+
+    python -m benchmarks.bench_fetch [latency_seconds]
+"""
+import sys
+import time
+
+from feedback_core.fetch import AirtableFetcher
+
+from .mock_airtable import MockAirtable
+from .synthetic import judge_names, records
+
+
+def linked(prefix, names):
+    return [{"id": f"rec{prefix}{i:011d}", "fields": {"Id": i + 1, "Name": n}} for i, n in enumerate(names)]
+
+
+def tables():
+    """Feedback table in base app1, the linked tables in app1 and app2."""
+    return {
+        ("app1", "Feedback"): records(n_startups=450, extra_columns=0),
+        ("app1", "Startups"): linked("S", [f"Startup {i}" for i in range(30)]),
+        ("app2", "Founders"): linked("F", [f"Founder {i}" for i in range(90)]),
+        ("app2", "Mentors"): linked("M", judge_names(300)),
+        ("app2", "Logos"): linked("L", [f"logo-{i}.png" for i in range(120)]),
+    }
+
+
+def downloads(fetcher, wanted):
+    """``table → base`` to the ``all`` of each table, for :meth:`AirtableFetcher.fetch_many`."""
+    return {table: fetcher.table(base, table).all for table, base in wanted.items()}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(latency=0.2):
+    data = tables()
+    wanted = {table: base for base, table in data}
+    server = MockAirtable(data, latency=latency).start()
+    try:
+        fetcher = AirtableFetcher("key", api_url=server.url, backoff=0.2)
+        print(f"mock latency {latency * 1e3:.0f} ms, 5 requests/s per base")
+        print(f"{'table':<10} {'records':>8} {'pages':>6} {'alone (s)':>10}")
+        alone = {}
+        for key, base in wanted.items():
+            alone[key], got = timed(lambda: fetcher.fetch_table(base, key))
+            print(f"{key:<10} {len(got):>8} {-(-len(got) // 100):>6} {alone[key]:>10.2f}")
+
+        time.sleep(1)   # let the rate-limit windows drain
+        sequential, _ = timed(lambda: {k: fetcher.fetch_table(base, k) for k, base in wanted.items()})
+        time.sleep(1)
+        concurrent, got = timed(lambda: fetcher.fetch_many(downloads(fetcher, wanted)))
+        assert all(len(got[k]) == len(data[(base, k)]) for k, base in wanted.items())
+        print(f"\nsequential {sequential:.2f} s, concurrent {concurrent:.2f} s "
+              f"({sequential / concurrent:.1f}x), slowest table alone {max(alone.values()):.2f} s")
+
+        time.sleep(1)
+        eager = AirtableFetcher("key", api_url=server.url, rate_per_base=50, backoff=0.2)
+        before = server.throttled
+        elapsed, got = timed(lambda: eager.fetch_many(downloads(eager, wanted)))
+        assert all(len(got[k]) == len(data[(base, k)]) for k, base in wanted.items())
+        print(f"limiter at 50 req/s: {elapsed:.2f} s, {server.throttled - before} 429s retried, all records fetched")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Rerun cost of the dashboard figures: plotly.express vs. ``feedback_core.charts``.
+
+"rerun" is what every rerun pays: building the figure (old path only, the new
+cohort figures are cached per snapshot) plus what ``st.plotly_chart`` does
+with it, i.e. validation and ``plotly.io.to_json``.
+
+    python -m benchmarks.bench_figures [startups ...]
+"""
+import random
+import sys
+import time
+
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+import plotly.tools
+
+from feedback_core.charts import risk_reward_matrix, score_bars
+
+
+def legacy_matrix(plot_df):
+    fig = px.scatter(plot_df, x="Average RISK", y="Average Reward", color="Startup Label",
+                     text="Startup Label", labels={"Average RISK": "Risk Score", "Average Reward": "Reward Score"})
+    fig.update_xaxes(autorange="reversed")
+    fig.update_traces(textposition="top center", textfont_color="black",
+                      marker=dict(size=12, line=dict(width=1, color="DarkSlateGrey")))
+    fig.update_layout(height=600, xaxis=dict(range=[4, 1], dtick=1), yaxis=dict(range=[1, 4], dtick=1),
+                      showlegend=False)
+    return fig
+
+
+def legacy_bars(scores):
+    df = pd.DataFrame({"Category": list(scores), "Score": list(scores.values())})
+    fig = px.bar(df, x="Category", y="Score", text="Score", color_discrete_sequence=["rgb(29, 202, 237)"])
+    fig.update_traces(texttemplate="%{text:.2f}", textposition="outside")
+    fig.update_layout(yaxis_range=[1, 4], height=450)
+    return fig
+
+
+def serialize(fig):
+    # What st.plotly_chart does with the figure
+    plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(fig, validate=False)
+
+
+def best(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), out
+
+
+def main(sizes):
+    rnd = random.Random(0)
+    scores = {f"Pillar {i}": rnd.uniform(1, 4) for i in range(8)}
+    old_bar, _ = best(lambda: serialize(legacy_bars(scores)))
+    new_bar, _ = best(lambda: serialize(score_bars(scores.keys(), scores.values(), "rgb(29, 202, 237)")))
+    print(f"score bar chart per rerun: {old_bar * 1e3:.1f} ms -> {new_bar * 1e3:.1f} ms\n")
+
+    print(f"{'startups':>9} {'old rerun (ms)':>15} {'new rerun (ms)':>15} {'speed-up':>9} {'old KB':>8} {'new KB':>8}")
+    for n in sizes:
+        plot_df = pd.DataFrame({
+            "Startup Label": [f"Startup {i}" for i in range(n)],
+            "Average RISK": [rnd.uniform(1, 4) for _ in range(n)],
+            "Average Reward": [rnd.uniform(1, 4) for _ in range(n)],
+        })
+        old, old_json = best(lambda: serialize(legacy_matrix(plot_df)), repeat=3)
+        cached = risk_reward_matrix(plot_df)
+        new, new_json = best(lambda: serialize(cached))
+        print(f"{n:>9} {old * 1e3:>15.1f} {new * 1e3:>15.1f} {old / new:>8.0f}x "
+              f"{len(old_json) / 1e3:>8.0f} {len(new_json) / 1e3:>8.0f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [25, 100, 400])
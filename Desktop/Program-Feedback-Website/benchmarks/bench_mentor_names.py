@@ -0,0 +1,46 @@
+"""Mentor name matching: Aho–Corasick ``NameMatcher`` vs. the old regex alternation.
+
+    python -m benchmarks.bench_mentor_names [judges ...]
+"""
+import random
+import re
+import sys
+import time
+
+from feedback_core.mentors import NameMatcher
+
+from .synthetic import flag_blob, judge_names
+
+
+def legacy_regex(names):
+    return re.compile(
+        r"(" + "|".join(re.escape(n) for n in names) + r")(?=$|\s|[A-Z])",
+        flags=re.I,
+    )
+
+
+def timed(fn, texts, repeat=3):
+    best, hits = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = sum(len(fn(t)) for t in texts)
+        best = min(best, time.perf_counter() - start)
+    return best, hits
+
+
+def main(sizes, n_texts=300, mentors_per_text=8):
+    print(f"{'judges':>7} {'regex (ms)':>11} {'matcher (ms)':>13} {'speed-up':>9} {'hits':>11}")
+    for n in sizes:
+        names = judge_names(n)
+        rnd = random.Random(n)
+        texts = [flag_blob(rnd, rnd.sample(names, mentors_per_text)) for _ in range(n_texts)]
+
+        regex = legacy_regex(names)
+        matcher = NameMatcher(names)
+        old, old_hits = timed(lambda t: regex.findall(t), texts)
+        new, new_hits = timed(matcher.finditer, texts)
+        print(f"{n:>7} {old * 1e3:>11.1f} {new * 1e3:>13.1f} {old / new:>8.1f}x {old_hits:>5}/{new_hits:<5}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [40, 400, 4000])
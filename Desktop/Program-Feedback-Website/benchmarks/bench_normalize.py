@@ -0,0 +1,47 @@
+"""Vectorized normalization vs. the old per-cell ``applymap(fix_cell)``.
+
+    python -m benchmarks.bench_normalize [rows ...]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from feedback_core.normalize import normalize_frame
+
+from .synthetic import records
+
+
+def fix_cell(val):
+    if isinstance(val, dict) and "specialValue" in val:
+        return float("nan")
+    return val
+
+
+def legacy(df):
+    # DataFrame.applymap was renamed to DataFrame.map in pandas 2.1
+    apply_cells = df.map if hasattr(df, "map") else df.applymap
+    return apply_cells(fix_cell)
+
+
+def best_of(fn, df, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    print(f"{'rows':>8} {'cols':>5} {'applymap (s)':>13} {'vectorized (s)':>15} {'speed-up':>9}")
+    for n in sizes:
+        recs = records(n_startups=n, n_mentors=40, mentors_per_startup=2)
+        df = pd.DataFrame([r["fields"] for r in recs])
+        old = best_of(legacy, df)
+        new = best_of(normalize_frame, df)
+        print(f"{n:>8} {df.shape[1]:>5} {old:>13.3f} {new:>15.3f} {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,63 @@
+"""Snapshot download with and without field projection, from a mock Airtable.
+
+Reads the whole feedback table, then only ``SNAPSHOT_FIELDS`` and only the
+overview fields, and reports
+bytes on the wire, download and ``normalize_frame`` time, plus the lazy
+per-startup detail fetch.
+
+    python -m benchmarks.bench_projection [startups]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from feedback_core.details import DetailLoader
+from feedback_core.fetch import AirtableFetcher
+from feedback_core.fields import DETAIL_FIELDS, SNAPSHOT_FIELDS, fields_for
+from feedback_core.normalize import normalize_frame
+
+from .mock_airtable import MockAirtable
+from .synthetic import records
+
+
+def load(table, fields, server):
+    before = server.bytes_sent
+    start = time.perf_counter()
+    recs = table.all(fields=fields)
+    fetched = time.perf_counter()
+    df = normalize_frame(pd.DataFrame([r["fields"] for r in recs], index=[r["id"] for r in recs]))
+    return server.bytes_sent - before, fetched - start, time.perf_counter() - fetched, df
+
+
+def main(n=500):
+    # Real rate limit off: this measures payload and parsing, not waiting
+    server = MockAirtable({("app1", "Feedback"): records(n_startups=n)}, latency=0, rate=10_000).start()
+    try:
+        fetcher = AirtableFetcher("key", api_url=server.url, rate_per_base=10_000, rate_per_token=10_000)
+        table = fetcher.table("app1", "Feedback")
+        print(f"{n} startups")
+        print(f"{'fields':<10} {'columns':>8} {'MB':>7} {'download (s)':>13} {'normalize (s)':>14}")
+        results = {}
+        for label, fields in [("all", ()), ("snapshot", SNAPSHOT_FIELDS), ("overview", fields_for(["overview"]))]:
+            size, download, parse, df = load(table, fields, server)
+            results[label] = size, download, parse
+            print(f"{label:<10} {df.shape[1]:>8} {size / 1e6:>7.2f} {download:>13.3f} {parse:>14.3f}")
+        s0, d0, p0 = results["all"]
+        for label in ("snapshot", "overview"):
+            s1, d1, p1 = results[label]
+            print(f"{label}: {s0 / s1:.1f}x fewer bytes, {d0 / d1:.1f}x faster download, "
+                  f"{p0 / p1:.1f}x faster normalize")
+
+        details = DetailLoader(table, DETAIL_FIELDS)
+        row = table.all(fields=SNAPSHOT_FIELDS)[0]
+        row = normalize_frame(pd.DataFrame([row["fields"]], index=[row["id"]])).iloc[0]
+        start = time.perf_counter()
+        full = details.load(row)
+        print(f"details of one startup: {time.perf_counter() - start:.3f} s, {len(full) - len(row)} fields added")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""EM's Feedback for one startup with 50 mentors and 7 categories.
+
+Compares the old renderer, which re-parsed the mentor scores once per
+mentor, with the memoized view-model path (first and repeated builds).
+
+    python -m benchmarks.bench_render_flags [mentors]
+"""
+import sys
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+from feedback_core import flags
+from feedback_core.mentors import NameMatcher
+from feedback_core.schema import RECORD_VERSION_COLUMN
+from feedback_core.view_model import FLAG_COLORS, build_mentor_feedback
+
+from .synthetic import judge_names, records
+
+
+def legacy_render(row):
+    extract = flags.extract_mentor_scores.__wrapped__
+    grouped = defaultdict(lambda: defaultdict(list))
+    for mentor, color, raw_comment in flags.collect_flag_records.__wrapped__(row):
+        grouped[mentor][color].append(raw_comment)
+    out = []
+    for mentor in sorted(grouped):
+        scores = extract(row).get(mentor, {})
+        for color in FLAG_COLORS:
+            out += [flags._format_categories(c, scores=scores) for c in grouped[mentor].get(color, [])]
+    return out
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_mentors=50):
+    names = judge_names(n_mentors)
+    flags.MENTORS = NameMatcher(names)
+    recs = records(n_startups=1, n_mentors=n_mentors, mentors_per_startup=n_mentors)
+    df = pd.DataFrame([r["fields"] for r in recs], index=[r["id"] for r in recs])
+    df[RECORD_VERSION_COLUMN] = "2025-01-01T00:00:00+00:00"
+    row = df.iloc[0]
+
+    def cold():
+        for fn in (flags.extract_mentor_scores, flags.collect_flag_records, build_mentor_feedback):
+            fn.cache_clear()
+        build_mentor_feedback(row)
+
+    old = best_of(lambda: legacy_render(row))
+    new_cold = best_of(cold)
+    new_warm = best_of(lambda: build_mentor_feedback(row))
+    mentors = len(build_mentor_feedback(row))
+    print(f"{mentors} mentors x {len(flags.CATS)} categories")
+    print(f"legacy renderer       {old * 1e3:8.2f} ms")
+    print(f"view model (cold)     {new_cold * 1e3:8.2f} ms  {old / new_cold:6.1f}x")
+    print(f"view model (memoized) {new_warm * 1e3:8.3f} ms  {old / new_warm:6.0f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
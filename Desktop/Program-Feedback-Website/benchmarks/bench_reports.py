@@ -0,0 +1,54 @@
+"""PDF reports of a synthetic cohort rendered with 1, 2, 4 … processes.
+
+Shows how :func:`feedback_core.report.write_reports` scales with the
+number of cores (the batch job uses one process per CPU by default).
+
+    python -m benchmarks.bench_reports [startups]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from feedback_core.cohort_stats import compute_cohort_stats
+from feedback_core.founders import build_fact_table
+from feedback_core.normalize import normalize_frame
+from feedback_core.report import default_workers, make_report, write_reports
+from feedback_core.view_model import build_views
+
+from .synthetic import records
+
+
+def synthetic_reports(n_startups):
+    recs = records(n_startups=n_startups, n_mentors=60, extra_columns=0)
+    df = normalize_frame(pd.DataFrame([r["fields"] for r in recs], index=[r["id"] for r in recs]))
+    df["Id"] = df["Id"].astype(str)
+    facts, tag_errors = build_fact_table(df)
+    views = build_views(df, facts, tag_errors)
+    stats = compute_cohort_stats(df)
+    now = datetime.now(timezone.utc)
+    return [make_report(row, views[row["Id"]], stats, f"Startup {row['Id']}", "bench", now)
+            for _, row in df.iterrows()]
+
+
+def main(n_startups=25):
+    reports = synthetic_reports(n_startups)
+    cpus = default_workers()
+    counts = sorted({1, *(2 ** k for k in range(1, cpus.bit_length()) if 2 ** k < cpus), cpus})
+    print(f"{n_startups} startups, {cpus} CPUs")
+    print(f"{'workers':>8} {'wall (s)':>9} {'per report (s)':>15} {'speedup':>8}")
+    base = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in counts:
+            start = time.perf_counter()
+            write_reports(reports, os.path.join(tmp, f"pack-{workers}.zip"), max_workers=workers)
+            wall = time.perf_counter() - start
+            base = base or wall
+            print(f"{workers:>8} {wall:>9.2f} {wall / n_startups:>15.3f} {base / wall:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""Feedback search: inverted index against a regex scan of every comment.
+
+Builds :func:`feedback_core.search.build_search_index` on a synthetic
+cohort and times a few queries, next to the same word searched with a
+regex over every flag blob. The scan only finds records: telling the
+mentor, color and category of each hit apart means parsing every blob,
+which is the index build time, on every query.
+
+    python -m benchmarks.bench_search [startups]
+"""
+import re
+import sys
+import time
+
+from feedback_core import flags
+from feedback_core.cohorts import CohortNames
+from feedback_core.frame import build_frame
+from feedback_core.mentors import NameMatcher
+from feedback_core.normalize import normalize_list
+from feedback_core.search import build_search_index
+
+from .synthetic import judge_names, records
+
+QUERIES = [
+    ("market", {}),
+    ("team", {"colors": ["red"]}),
+    ("", {"colors": ["red"], "categories": ["Team"]}),
+    ('"market momentum"', {}),
+    ("zzz", {}),
+]
+
+
+def best_of(fn, repeat=5):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def regex_scan(df, word):
+    """Records with ``word`` in any flag field, scanning the raw text."""
+    pattern = re.compile(rf"\b{re.escape(word)}", re.I)
+    blobs = [c for c, _ in flags.FLAG_FIELDS if c in df]
+    return [i for i, row in zip(df.index, df[blobs].itertuples(index=False))
+            if any(pattern.search(text) for v in row for text in normalize_list(v))]
+
+
+def main(n_startups=1000):
+    flags.MENTORS = NameMatcher(judge_names(200))
+    df = build_frame(records(n_startups=n_startups, n_mentors=200), CohortNames())
+    start = time.perf_counter()
+    index = build_search_index(df)
+    print(f"{n_startups} startups: {len(index.entries)} entries indexed in {time.perf_counter() - start:.2f} s")
+
+    print(f"\n{'query':<24} {'filters':<44} {'hits':>7} {'ms':>8}")
+    for query, filters in QUERIES:
+        seconds, hits = best_of(lambda: index.search(query, **filters))
+        print(f"{query:<24} {str(filters):<44} {len(hits):>7} {seconds * 1e3:>8.2f}")
+
+    seconds, hits = best_of(lambda: regex_scan(df, "market"), repeat=1)
+    print(f"\nregex scan for 'market' over every flag field: {len(hits)} records, {seconds * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,112 @@
+"""Cold start of the dashboard: import times and time to first render.
+
+Every measurement runs in a fresh interpreter, as in a new container, with
+Streamlit already imported (the server loads it before running the page).
+The page runs offline from the local snapshot with ``AppTest``; "first
+render" is when the title is sent, "full run" when the script ends, and
+"warm rerun" is a second run in the same process.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --target 2.5    # exit 1 when the first render is slower
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from feedback_core.config import APP_DIR, SECRETS_PATH, load_settings, read_secrets
+
+# Imports of app.py and of the sections it renders, slowest candidates first
+MODULES = [
+    "pandas",
+    "plotly.express",
+    "plotly.graph_objects",
+    "reportlab.platypus",
+    "pyarrow.parquet",
+    "requests",
+    "PIL.Image",
+    "feedback_core",
+    "feedback_core.pipeline",
+    "feedback_core.charts",
+    "feedback_core.report",
+]
+
+_IMPORT = "import time, streamlit; t = time.perf_counter(); import {}; print(time.perf_counter() - t)"
+
+_PAGE = """
+import json, sys, time
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+secrets = json.loads(sys.argv[2])
+marks = {}
+title = st.title
+
+def timed_title(*args, **kwargs):
+    marks.setdefault("first_render", time.perf_counter() - marks["start"])
+    return title(*args, **kwargs)
+
+st.title = timed_title
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+for section, values in secrets.items():
+    at.secrets[section] = values
+marks["start"] = time.perf_counter()
+at.run()
+marks["full_run"] = time.perf_counter() - marks["start"]
+if at.exception:
+    sys.exit(str(at.exception))
+start = time.perf_counter()
+at.run()
+marks["warm_rerun"] = time.perf_counter() - start
+del marks["start"]
+print(json.dumps(marks))
+"""
+
+
+def run(code, *args):
+    return subprocess.run([sys.executable, "-c", code, *args], cwd=APP_DIR, capture_output=True,
+                          text=True, check=True).stdout.strip().splitlines()[-1]
+
+
+def import_seconds(module, repeat):
+    """Fastest cold import of ``module``, in seconds."""
+    return min(float(run(_IMPORT.format(module))) for _ in range(repeat))
+
+
+def page_seconds(secrets, repeat):
+    """Seconds to the first render, the full run and a warm rerun; fastest cold start of ``repeat``."""
+    runs = [json.loads(run(_PAGE, os.path.join(APP_DIR, "app.py"), json.dumps(secrets))) for _ in range(repeat)]
+    return min(runs, key=lambda marks: marks["first_render"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup", description=__doc__.split("\n")[0])
+    parser.add_argument("--secrets", default=SECRETS_PATH)
+    parser.add_argument("--repeat", type=int, default=3, help="cold starts per measurement, the fastest is kept")
+    parser.add_argument("--target", type=float, help="seconds the cold first render must stay under")
+    args = parser.parse_args(argv)
+
+    print(f"{'import (after streamlit)':<28} {'seconds':>8}")
+    for module in MODULES:
+        print(f"{module:<28} {import_seconds(module, args.repeat):>8.3f}")
+
+    secrets = read_secrets(args.secrets)
+    secrets["airtable"] = {**secrets.get("airtable", {}), "offline": True}
+    settings = load_settings(secrets)
+    snapshot = next(c for c in settings.cohorts if c.name == settings.default_cohort).snapshot_path
+    if not os.path.exists(snapshot):
+        sys.exit(f"\nNo local snapshot at {snapshot}: open the dashboard online once first.")
+
+    marks = page_seconds(secrets, args.repeat)
+    print(f"\n{'page (offline snapshot)':<28} {'seconds':>8}")
+    for name, seconds in marks.items():
+        print(f"{name:<28} {seconds:>8.3f}")
+
+    if args.target is not None and marks["first_render"] > args.target:
+        print(f"\nFirst render took {marks['first_render']:.2f} s, over the {args.target:.2f} s target")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Local stand-in for the Airtable list-records endpoint.
+
+Serves ``GET /v0/<base>/<table>`` with Airtable's paging (``pageSize``,
+``offset``), ``fields[]`` projection (422 for unknown fields),
+``RECORD_ID() = '...'`` formulas and the ``LAST_MODIFIED_TIME()`` filter of
+incremental syncs (see :meth:`MockAirtable.touch`), a fixed latency per
+request and the per-base rate limit: more than ``rate`` requests to one
+base within a second get a 429.
+
+    server = MockAirtable({("app1", "tblA"): records}).start()
+    AirtableFetcher("key", api_url=server.url)
+"""
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+_MODIFIED_RE = re.compile(r"IS_AFTER\(LAST_MODIFIED_TIME\(\), DATETIME_PARSE\('([^']+)'\)\)")
+
+
+class MockAirtable:
+    def __init__(self, tables, latency=0.05, rate=5, host="127.0.0.1", port=0):
+        self.tables = tables            # (base_id, table) → list of records
+        self.latency = latency
+        self.rate = rate
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self._recent = defaultdict(deque)   # base_id → monotonic times of the last second
+        # record id → last edit; records never touched were edited an hour before start-up
+        self.modified = {}
+        self._created = datetime.now(timezone.utc) - timedelta(hours=1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v0"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def touch(self, *record_ids):
+        """Mark records as edited now, as Airtable does when a non-computed field changes."""
+        now = datetime.now(timezone.utc)
+        for record_id in record_ids:
+            self.modified[record_id] = now
+
+    def _allow(self, base_id):
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            recent = self._recent[base_id]
+            while recent and now - recent[0] >= 1:
+                recent.popleft()
+            if len(recent) >= self.rate:
+                self.throttled += 1
+                return False
+            recent.append(now)
+            return True
+
+    def _page(self, base_id, table, query):
+        records = self.tables[(base_id, table)]
+        formula = query.get("filterByFormula", [""])[0]
+        match = re.fullmatch(r"RECORD_ID\(\) = '(\w+)'", formula)
+        if match:
+            records = [r for r in records if r["id"] == match.group(1)]
+        match = _MODIFIED_RE.fullmatch(formula)
+        if match:
+            since = datetime.fromisoformat(match.group(1).replace("Z", "+00:00"))
+            records = [r for r in records if self.modified.get(r["id"], self._created) > since]
+        size = min(int(query.get("pageSize", ["100"])[0]), 100)
+        start = int(query.get("offset", ["0"])[0])
+        page = records[start:start + size]
+        fields = query.get("fields[]")
+        if fields:
+            page = [{**r, "fields": {k: v for k, v in r["fields"].items() if k in fields}} for r in page]
+        body = {"records": page}
+        if start + size < len(records):
+            body["offset"] = str(start + size)
+        return body
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                parts = url.path.strip("/").split("/")
+                if len(parts) != 3 or (parts[1], parts[2]) not in mock.tables:
+                    return self._send(404, {"error": "NOT_FOUND"})
+                time.sleep(mock.latency)
+                if not mock._allow(parts[1]):
+                    return self._send(429, {"errors": [{"error": "RATE_LIMIT_REACHED"}]})
+                known = {k for r in mock.tables[(parts[1], parts[2])] for k in r["fields"]}
+                unknown = set(parse_qs(url.query).get("fields[]", [])) - known
+                if unknown:
+                    return self._send(422, {"error": {"type": "UNKNOWN_FIELD_NAME",
+                                                      "message": f"Unknown field name: {unknown.pop()!r}"}})
+                self._send(200, mock._page(parts[1], parts[2], parse_qs(url.query)))
+
+            def _send(self, status, body):
+                data = json.dumps(body).encode()
+                with mock._lock:
+                    mock.bytes_sent += len(data)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
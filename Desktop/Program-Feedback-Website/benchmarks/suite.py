@@ -0,0 +1,219 @@
+"""Every pipeline stage timed on synthetic cohorts of growing size, saved as JSON.
+
+Cohorts go from 25 startups / 40 mentors to 10,000 startups / 2,000 mentors
+(see ``SIZES``); records come from :mod:`benchmarks.synthetic`, with
+special-value cells, mentor score strings, ``*_exp`` flag blobs and
+Founder & Score tags. Stages:
+
+    dataframe        raw records → DataFrame
+    normalize        normalize_frame (special values, numeric casts)
+    build_frame      the rest of feedback_core.frame.build_frame (risk/reward levels, labels)
+    mentor_names     collect_flag_records: mentor names found in every *_exp blob
+    mentor_scores    extract_mentor_scores: the "Mentor: score" strings
+    flag_grouping    build_mentor_feedback without the two stages above (grouping, formatting)
+    founder_facts    build_fact_table: Founder & Score tags parsed into facts
+    founder_views    build_views: flag counts and pillar means per founder
+    cohort_stats     compute_cohort_stats
+    figures          cohort pie and risk/reward matrix, built and serialized like st.plotly_chart
+    startup_figures  one startup's score bars, built and serialized
+
+Per-record memoization is bypassed, so every stage does the full work.
+Results go to ``benchmarks/results/<date>-<commit>.json``; ``--compare``
+prints the ratios to an earlier file and exits with 1 when a stage got
+slower than ``--threshold``.
+
+    python -m benchmarks.suite                  # full grid
+    python -m benchmarks.suite --quick          # two smallest sizes
+    python -m benchmarks.suite --compare benchmarks/results/baseline.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import plotly
+import plotly.io as pio
+
+from feedback_core import flags, view_model
+from feedback_core.charts import HUMAN_COLOR, RISK_REWARD_COLOR, cohort_matrix, cohort_pie, score_bars
+from feedback_core.cohort_stats import compute_cohort_stats
+from feedback_core.cohorts import CohortNames
+from feedback_core.founders import build_fact_table
+from feedback_core.frame import build_frame
+from feedback_core.mentors import NameMatcher
+from feedback_core.normalize import normalize_frame
+from feedback_core.schema import REWARD_COLUMNS, RISK_COLUMNS
+from feedback_core.view_model import build_views
+
+from .synthetic import judge_names, records
+
+# (startups, mentors in the cohort)
+SIZES = [(25, 40), (100, 100), (500, 300), (2_000, 800), (10_000, 2_000)]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def best_of(fn, repeat):
+    """Fastest of ``repeat`` runs, in seconds, and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+@contextlib.contextmanager
+def judges(names):
+    """Match the synthetic mentor names instead of the real judges."""
+    saved = flags.MENTORS
+    flags.MENTORS = NameMatcher(names)
+    try:
+        yield
+    finally:
+        flags.MENTORS = saved
+
+
+@contextlib.contextmanager
+def precomputed(flag_records, mentor_scores):
+    """Serve build_mentor_feedback's inputs from the earlier stages' results."""
+    saved = view_model.collect_flag_records, view_model.extract_mentor_scores
+    view_model.collect_flag_records = lambda row: flag_records[row.name]
+    view_model.extract_mentor_scores = lambda row: mentor_scores[row.name]
+    try:
+        yield
+    finally:
+        view_model.collect_flag_records, view_model.extract_mentor_scores = saved
+
+
+def run_size(n_startups, n_mentors, repeat):
+    """Stage → seconds for one cohort size."""
+    recs = records(n_startups=n_startups, n_mentors=n_mentors)
+    names = CohortNames(startups={str(i + 1): f"Startup {i + 1}" for i in range(n_startups)})
+    times = {}
+
+    times["dataframe"], raw = best_of(
+        lambda: pd.DataFrame([r["fields"] for r in recs], index=[r["id"] for r in recs]), repeat)
+    times["normalize"], _ = best_of(lambda: normalize_frame(raw), repeat)
+    total, df = best_of(lambda: build_frame(recs, names), repeat)
+    times["build_frame"] = max(total - times["dataframe"] - times["normalize"], 0.0)
+
+    rows = [row for _, row in df.iterrows()]
+    with judges(judge_names(n_mentors)):
+        times["mentor_names"], flag_records = best_of(
+            lambda: {row.name: flags.collect_flag_records.__wrapped__(row) for row in rows}, repeat)
+        times["mentor_scores"], mentor_scores = best_of(
+            lambda: {row.name: flags.extract_mentor_scores.__wrapped__(row) for row in rows}, repeat)
+        with precomputed(flag_records, mentor_scores):
+            times["flag_grouping"], _ = best_of(
+                lambda: [view_model.build_mentor_feedback.__wrapped__(row) for row in rows], repeat)
+
+    times["founder_facts"], (facts, tag_errors) = best_of(lambda: build_fact_table(df), repeat)
+    times["founder_views"], views = best_of(lambda: build_views(df, facts, tag_errors), repeat)
+    times["cohort_stats"], _ = best_of(lambda: compute_cohort_stats(df), repeat)
+
+    def cohort_figures():
+        for fig in (cohort_pie(df), cohort_matrix(df)):
+            pio.to_json(fig, validate=False)
+    times["figures"], _ = best_of(cohort_figures, repeat)
+
+    row, view = rows[0], views[rows[0]["Id"]]
+
+    def startup_figures():
+        for columns in (RISK_COLUMNS, REWARD_COLUMNS):
+            pio.to_json(score_bars(columns, [row.get(c) for c in columns.values()], RISK_REWARD_COLOR),
+                        validate=False)
+        for founder, means in view.human_means.items():
+            pio.to_json(score_bars(means["Campo"], means["Media"], HUMAN_COLOR, title=founder, tilted=True),
+                        validate=False)
+    times["startup_figures"], _ = best_of(startup_figures, repeat)
+    return times
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata():
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "plotly": plotly.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print current / baseline per stage; the (size, stage) pairs slower than ``threshold``."""
+    before = {(r["startups"], r["mentors"], r["stage"]): r["seconds"] for r in baseline["results"]}
+    print(f"\ncompared with {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')})")
+    slower = []
+    for r in results:
+        key = (r["startups"], r["mentors"], r["stage"])
+        if key not in before or before[key] <= 0:
+            continue
+        ratio = r["seconds"] / before[key]
+        flag = "  <-- slower" if ratio > threshold else ""
+        print(f"{r['startups']:>7} {r['mentors']:>6} {r['stage']:<16} {before[key]:>9.4f} -> "
+              f"{r['seconds']:>9.4f} s  {ratio:5.2f}x{flag}")
+        if flag:
+            slower.append(key)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", nargs="+", metavar="STARTUPSxMENTORS",
+                        help="e.g. 25x40 1000x500 (default: %s)" % " ".join(f"{s}x{m}" for s, m in SIZES))
+    parser.add_argument("--quick", action="store_true", help="only the two smallest sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the fastest is kept")
+    parser.add_argument("--output", help="JSON file (default: benchmarks/results/<date>-<commit>.json)")
+    parser.add_argument("--compare", help="earlier JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio reported as a regression (default 1.25)")
+    args = parser.parse_args(argv)
+
+    sizes = [tuple(int(x) for x in s.lower().split("x")) for s in args.sizes] if args.sizes else SIZES
+    if args.quick:
+        sizes = sizes[:2]
+
+    meta = metadata()
+    results = []
+    print(f"{'startups':>8} {'mentors':>7} {'stage':<16} {'seconds':>9} {'µs/startup':>10}")
+    for n_startups, n_mentors in sizes:
+        # The largest cohorts take a while to build: time them once
+        repeat = args.repeat if n_startups <= 2_000 else 1
+        for stage, seconds in run_size(n_startups, n_mentors, repeat).items():
+            results.append({"startups": n_startups, "mentors": n_mentors, "stage": stage,
+                            "seconds": round(seconds, 6), "repeat": repeat})
+            print(f"{n_startups:>8} {n_mentors:>7} {stage:<16} {seconds:>9.4f} {seconds / n_startups * 1e6:>10.1f}")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{meta['timestamp'][:10]}-{meta['commit'] or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=1)
+    print(f"\nwrote {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            slower = compare(results, json.load(f), args.threshold)
+        if slower:
+            print(f"{len(slower)} stage(s) slower than {args.threshold}x the baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Synthetic records shaped like the Airtable feedback table."""
+import random
+
+from feedback_core.schema import INDIVIDUAL_COLUMNS, NUMERIC_COLUMNS
+
+FLAG_FIELDS = [
+    "RISK | Green_exp", "RISK | Yellow_exp", "RISK | Red_exp",
+    "Reward | Green_exp", "Reward | Yellow_exp", "Reward | Red_exp",
+]
+CATEGORIES = [
+    "State of development", "Momentum", "Management",
+    "Market", "Team", "Pain", "Scalability",
+]
+FLAG_TAG_FIELDS = [
+    "Talks | Unconventional thinking (Founder & Score)",
+    "Workstations | Unconventional Thinking (Founder & Score)",
+    "Individual Contest | Unconventional Thinking (Founder & Score)",
+    "Individual Contest | Confidence (Founder & Score)",
+    "Individual Contest | Ambition (Founder & Score)",
+]
+PILLAR_TAG_FIELDS = [c.replace("| Average", "| Founder & Score") for c in INDIVIDUAL_COLUMNS]
+
+_WORDS = (
+    "market team regulation traction pricing churn revenue pilot hardware margin "
+    "founders hiring burn runway competition moat pain customers scalability sales"
+).split()
+
+
+def judge_names(n, seed=0):
+    """``n`` distinct "First Last" mentor names."""
+    rnd = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        first = "".join(rnd.choices("abcdefghijklmnopqrstuvwxyz", k=rnd.randint(3, 8))).title()
+        last = "".join(rnd.choices("abcdefghijklmnopqrstuvwxyz", k=rnd.randint(4, 10))).title()
+        names.add(f"{first} {last}")
+    return sorted(names)
+
+
+def sentence(rnd, words=12):
+    return " ".join(rnd.choices(_WORDS, k=words)).capitalize() + "."
+
+
+def flag_blob(rnd, mentors):
+    """One ``*_exp`` rollup: each mentor's name followed by per-category comments."""
+    parts = []
+    for mentor in mentors:
+        cats = rnd.sample(CATEGORIES, rnd.randint(1, 3))
+        body = "<br>".join(f"**{c}:** {sentence(rnd)}" for c in cats)
+        parts.append(f"{mentor} {body}")
+    return "<br><br>".join(parts)
+
+
+def records(n_startups=25, n_mentors=40, mentors_per_startup=8, extra_columns=40,
+            special_rate=0.1, seed=0):
+    """Airtable-style ``{"id", "fields"}`` records.
+
+    Score columns sometimes hold ``{'specialValue': 'NaN'}`` like the real API,
+    flag blobs and mentor score strings name judges from :func:`judge_names`,
+    and ``extra_columns`` text fields pad the table to a realistic width.
+    """
+    rnd = random.Random(seed)
+    judges = judge_names(n_mentors, seed)
+    out = []
+    for i in range(n_startups):
+        fields = {"Id": i + 1}
+        for col in NUMERIC_COLUMNS:
+            if rnd.random() < special_rate:
+                fields[col] = {"specialValue": "NaN"}
+            elif col in ("Investable_Yes_Count", "Investable_No_Count", "Number of Reviews"):
+                fields[col] = rnd.randint(0, 20)
+            else:
+                fields[col] = round(rnd.uniform(1, 4), 2)
+
+        mentors = rnd.sample(judges, min(mentors_per_startup, len(judges)))
+        for cat in CATEGORIES:
+            fields[f"{cat} | Mentor Scores"] = [
+                ", ".join(f"{m}: {rnd.randint(1, 4)}" for m in mentors)
+            ]
+        for field in FLAG_FIELDS:
+            picked = rnd.sample(mentors, rnd.randint(1, len(mentors)))
+            fields[field] = [flag_blob(rnd, picked)]
+
+        founders = [f"Founder {i}-{k}" for k in range(rnd.randint(1, 3))]
+        for field in FLAG_TAG_FIELDS:
+            fields[field] = [", ".join(f"{f}: {rnd.choice(['Bonus Star', 'Red Flag'])}" for f in founders)]
+        for field in PILLAR_TAG_FIELDS:
+            fields[field] = [", ".join(f"{f}: {rnd.randint(1, 4)}" for f in founders)]
+
+        fields["HDD_Calls_Average"] = round(rnd.uniform(1, 4), 2)
+        fields["HDD_Calls_Exceptional"] = rnd.randint(0, 1)
+        fields["HDD_Calls_Evaluator"] = [rnd.choice(judges)]
+        fields["HDD_Calls_Notes"] = [" ".join(sentence(rnd) for _ in range(4))]
+        for field in ("BRS_Calculation", "GRIT_Calculation"):
+            fields[field] = [rnd.choice(["Low", "Moderate", "High"]) + " score"]
+        for field in ("OLBI_Exhaustion_Descriptor", "OLBI_Disengagement_Descriptor"):
+            fields[field] = [rnd.choice(["Low", "Moderate", "High"])]
+        fields["original logo"] = [{
+            "id": f"att{i:010d}",
+            "url": f"https://dl.airtable.com/{i}.png",
+            "filename": f"{i}.png",
+            "size": 2048,
+            "type": "image/png",
+        }]
+        for k in range(extra_columns):
+            fields[f"Notes {k}"] = sentence(rnd, 6)
+
+        out.append({"id": f"rec{i:014d}", "createdTime": "2025-01-01T00:00:00.000Z", "fields": fields})
+    return out
@@ -0,0 +1,29 @@
+"""Data layer behind the program feedback dashboard (no Streamlit imports).
+
+The pure functions of the pipeline, from raw Airtable records to what the
+page shows, are importable from here; charts (plotly), reports (reportlab)
+and the Airtable/snapshot plumbing live in their own modules so importing
+the package stays light::
+
+    from feedback_core import build_frame, build_views, compute_cohort_stats
+"""
+from .cohort_stats import CohortStats, compute_cohort_stats
+from .cohorts import CohortConfig, CohortNames
+from .config import Settings, load_settings, read_secrets
+from .flags import collect_flag_records, extract_mentor_scores
+from .founders import build_fact_table, flag_counts, founder_means
+from .frame import build_frame, classify
+from .index import SnapshotIndex, build_index
+from .normalize import normalize_frame, normalize_list
+from .records import SchemaError, StartupDetails, StartupRecord, build_records, check_schema
+from .search import FeedbackEntry, SearchIndex, build_search_index
+from .view_model import MentorFeedback, StartupView, build_mentor_feedback, build_views
+
+__all__ = [
+    "CohortConfig", "CohortNames", "CohortStats", "FeedbackEntry", "MentorFeedback", "SchemaError",
+    "SearchIndex", "Settings", "SnapshotIndex", "StartupDetails", "StartupRecord", "StartupView",
+    "build_fact_table", "build_frame", "build_index", "build_mentor_feedback", "build_records",
+    "build_search_index", "build_views", "check_schema", "classify",
+    "collect_flag_records", "compute_cohort_stats", "extract_mentor_scores", "flag_counts",
+    "founder_means", "load_settings", "normalize_frame", "normalize_list", "read_secrets",
+]
@@ -0,0 +1,129 @@
+"""Feedback pack of a whole program: one PDF per startup, rendered in parallel.
+
+    python -m feedback_core.batch reports/                  # one PDF per startup
+    python -m feedback_core.batch pack.zip --cohort 2025 --workers 4
+
+Uses the dashboard's ``.streamlit/secrets.toml``. With Airtable credentials
+the feedback table is fully synced first (and the snapshot file updated),
+otherwise, or with ``--offline``, the local snapshot is used. Prints one line
+per finished report and a timing summary.
+"""
+import argparse
+import contextvars
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import perf
+from .cohort_stats import compute_cohort_stats
+from .cohorts import Cohort
+from .config import SECRETS_PATH, load_settings, read_secrets
+from .details import DetailLoader
+from .founders import build_fact_table
+from .index import build_index
+from .pipeline import make_detail_loader, make_fetcher, make_image_cache, open_cohorts
+from .report import StartupReport, default_workers, make_report, write_reports
+from .view_model import build_views
+
+
+def _logo(image_cache, row):
+    logo = row.get("original logo")
+    if image_cache is None or not isinstance(logo, list) or not logo:
+        return None
+    return image_cache.get(logo[0])
+
+
+def cohort_reports(cohort: Cohort, details: DetailLoader, image_cache=None) -> list[StartupReport]:
+    """Reports of every startup the page lists, in the selectbox order."""
+    snapshot = cohort.store.get(force=True)   # a forced sync is always a full one
+    df = details.load_frame(snapshot.df.drop_duplicates("Id"))
+    facts, tag_errors = build_fact_table(df)
+    views = build_views(df, facts, tag_errors)
+    stats = compute_cohort_stats(df)
+
+    names = cohort.names
+    index = build_index(df, names)
+    rows = [index.row(df, startup_id) for startup_id in index.options]
+    # Logos are downloads: fetch them concurrently
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        # copy_context: the download timings go to the caller's perf trace
+        futures = [pool.submit(contextvars.copy_context().run, _logo, image_cache, row) for row in rows]
+        logos = [f.result() for f in futures]
+    return [
+        make_report(row, views[row["Id"]], stats, index.labels[row["Id"]], cohort.name,
+                    snapshot.synced_at, logo_path=logo)
+        for row, logo in zip(rows, logos)
+    ]
+
+
+def print_trace(trace):
+    """Loading stages, slowest first (the PDFs are rendered in other processes)."""
+    print(f"\n{'stage':<28} {'calls':>6} {'seconds':>9}", file=sys.stderr)
+    for stage, (calls, seconds) in sorted(trace.stages.items(), key=lambda item: -item[1][1]):
+        print(f"{stage:<28} {calls:>6} {seconds:>9.3f}", file=sys.stderr)
+    for counter, value in sorted(trace.counters.items()):
+        print(f"{counter:<28} {value:>16}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m feedback_core.batch",
+                                     description="Render the PDF report of every startup of a program.")
+    parser.add_argument("output", help="directory for the PDFs, or a .zip file")
+    parser.add_argument("--cohort", help="program to export (default: airtable.default_cohort, else the last one)")
+    parser.add_argument("--secrets", default=SECRETS_PATH)
+    parser.add_argument("--workers", type=int, help=f"rendering processes (default: one per CPU, {default_workers()})")
+    parser.add_argument("--offline", action="store_true", help="use the local snapshot, do not call Airtable")
+    parser.add_argument("--perf", action="store_true", help="print the time spent in each loading stage")
+    args = parser.parse_args(argv)
+    perf.enable(args.perf)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    settings = load_settings(read_secrets(args.secrets))
+    settings.offline = settings.offline or args.offline
+    fetcher = make_fetcher(settings)
+    cohorts = open_cohorts(settings, fetcher)
+    name = args.cohort or settings.default_cohort
+    if name not in cohorts.names:
+        parser.error(f"unknown program {name!r}, expected one of {', '.join(cohorts.names)}")
+    cohort = cohorts[name]
+
+    start = time.perf_counter()
+    with perf.trace("batch.load") as trace:
+        try:
+            store = cohort.store
+        except FileNotFoundError as exc:
+            sys.exit(f"Offline mode: {exc}")
+        reports = cohort_reports(cohort, make_detail_loader(settings, store), make_image_cache(settings))
+    loaded = time.perf_counter() - start
+    source = "local snapshot" if store.offline else "Airtable"
+    print(f"{name}: {len(reports)} startups loaded from {source} in {loaded:.2f} s", file=sys.stderr)
+    if not reports:
+        sys.exit("Nothing to render.")
+
+    workers = min(args.workers or default_workers(), len(reports))
+    done, busy = 0, 0.0
+
+    def progress(report, seconds):
+        nonlocal done, busy
+        done += 1
+        busy += seconds
+        print(f"[{done:>{len(str(len(reports)))}}/{len(reports)}] {report.startup_name} ({seconds:.2f} s CPU)",
+              file=sys.stderr)
+
+    start = time.perf_counter()
+    write_reports(reports, args.output, max_workers=workers, on_done=progress)
+    wall = time.perf_counter() - start
+
+    # CPU time over wall time: how many cores were rendering at once on average
+    print(f"\nRendered {done} reports into {args.output} in {wall:.2f} s with {workers} "
+          f"process{'es' if workers > 1 else ''} ({default_workers()} CPUs): {busy / done:.2f} s CPU per report, "
+          f"{busy / wall:.1f}x parallel speedup; total {loaded + wall:.2f} s", file=sys.stderr)
+    if trace is not None:
+        print_trace(trace)
+    if fetcher is not None:
+        fetcher.close()
+
+
+if __name__ == "__main__":
+    main()
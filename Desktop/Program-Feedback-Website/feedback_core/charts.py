@@ -0,0 +1,98 @@
+"""Plotly figures of the dashboard, built with graph objects.
+
+The cohort figures only depend on the snapshot, so the page caches them with
+``snapshot.derived``. The per-startup score bars take their styling from
+the ``SCORE_BAR_LAYOUT`` and ``SCORE_BAR_TRACE`` dicts, merged into each
+figure's layout and bar trace, instead of a custom template that plotly
+would validate again for every figure. The Risk vs. Reward matrix is a
+single trace with one color per point instead of a trace per startup,
+which keeps its JSON small as cohorts grow.
+"""
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from . import perf
+
+RISK_REWARD_COLOR = "rgb(29, 202, 237)"
+HUMAN_COLOR = "rgb(52, 199, 89)"
+
+# Score-bar styling; a custom template would be validated again on every figure
+# (most of a bar chart's build time), plotly's default one is not
+SCORE_BAR_LAYOUT = dict(height=450, barmode="group")
+SCORE_BAR_TRACE = dict(texttemplate="%{text:.2f}", textposition="outside")
+
+PALETTE = pio.templates["plotly"].layout.colorway
+
+
+@perf.timed("charts.score_bars")
+def score_bars(labels, scores, color, x_title="Category", y_title="Score", title=None,
+               y_range=(1, 4), tilted=False) -> go.Figure:
+    """Bar chart of one startup's scores on the 1–4 scale."""
+    scores = np.asarray(list(scores), dtype="float64")
+    fig = go.Figure(
+        go.Bar(x=list(labels), y=scores, text=scores, marker_color=color,
+               hovertemplate=f"{x_title}=%{{x}}<br>{y_title}=%{{y}}<extra></extra>", **SCORE_BAR_TRACE),
+        layout=dict(SCORE_BAR_LAYOUT, yaxis=dict(range=list(y_range), title=y_title), xaxis=dict(title=x_title),
+                    title=title),
+    )
+    if tilted:
+        fig.update_layout(xaxis_tickangle=-45, margin=dict(t=50, b=0))
+    return fig
+
+
+def investability_pie(yes, no) -> go.Figure:
+    return go.Figure(
+        go.Pie(labels=["Yes", "No"], values=[yes, no], marker=dict(colors=["green", "red"]),
+               textinfo="label+percent", pull=[0.05, 0],
+               hovertemplate="Response=%{label}<br>Count=%{value}<extra></extra>"),
+        layout=dict(title="Experience Makers' Investability Votes",
+                    height=400, showlegend=False),
+    )
+
+
+def risk_reward_matrix(plot_df) -> go.Figure:
+    """Every startup on the risk (reversed x) vs. reward plane, with the quadrant labels."""
+    labels = plot_df["Startup Label"].tolist()
+    colors = {label: PALETTE[i % len(PALETTE)] for i, label in enumerate(dict.fromkeys(labels))}
+    fig = go.Figure(
+        go.Scatter(
+            x=plot_df["Average RISK"], y=plot_df["Average Reward"], text=labels,
+            mode="markers+text", textposition="top center", textfont_color="black",
+            marker=dict(size=12, color=[colors[label] for label in labels],
+                        line=dict(width=1, color="DarkSlateGrey")),
+            hovertemplate="Startup Label=%{text}<br>Risk Score=%{x}<br>Reward Score=%{y}<extra></extra>",
+        ),
+        layout=dict(
+            height=600,
+            xaxis=dict(range=[4, 1], autorange="reversed", dtick=1, constrain="domain", title="Risk Score"),
+            yaxis=dict(range=[1, 4], dtick=1, title="Reward Score"),
+            title="Risk vs. Reward Matrix",
+            title_x=0.5,
+            showlegend=False,
+            shapes=[
+                dict(type="line", x0=2.5, x1=2.5, y0=0, y1=4.2, line=dict(dash="dot", color="grey", width=1)),
+                dict(type="line", x0=0, x1=4.2, y0=2.5, y1=2.5, line=dict(dash="dot", color="grey", width=1)),
+            ],
+        ),
+    )
+    # Etiquetas de cuadrantes
+    for x, y, text in [(1.25, 3.8, "Riesgo alto, recompensa alta"), (3.5, 3.8, "Riesgo bajo, recompensa alta"),
+                       (1.25, 1.4, "Riesgo alto, recompensa baja"), (3.5, 1.4, "Riesgo bajo, recompensa baja")]:
+        fig.add_annotation(x=x, y=y, text=text, showarrow=False, font=dict(size=12))
+    return fig
+
+
+# Cohort figures only change with the snapshot: the page builds them once per version
+@perf.timed("charts.cohort_pie")
+def cohort_pie(df) -> go.Figure:
+    # Sum the counts from all rows
+    yes_total = df["Investable_Yes_Count"].fillna(0).sum()
+    no_total = df["Investable_No_Count"].fillna(0).sum()
+    return investability_pie(yes_total, no_total)
+
+
+@perf.timed("charts.cohort_matrix")
+def cohort_matrix(df) -> go.Figure:
+    # Clean subset for plotting
+    return risk_reward_matrix(df[["Startup Label", "Average RISK", "Average Reward"]].dropna())
@@ -0,0 +1,66 @@
+"""Cohort-wide statistics for every score column, computed once per snapshot."""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from . import perf
+from .schema import INDIVIDUAL_COLUMNS, REWARD_COLUMNS, RISK_COLUMNS, TEAM_COLUMNS
+
+STAT_COLUMNS = [
+    "Average RISK",
+    "Average Reward",
+    *RISK_COLUMNS.values(),
+    *REWARD_COLUMNS.values(),
+    *INDIVIDUAL_COLUMNS,
+    *TEAM_COLUMNS,
+]
+
+PERCENTILES = [0.10, 0.25, 0.50, 0.75, 0.90]
+
+
+@dataclass
+class CohortStats:
+    """Per-column summary plus each startup's position in the cohort.
+
+    All scores run from 1 to 4 with 4 the most favorable, so rank 1 is the
+    highest score. ``percentiles`` is the share of startups (0–100) scoring
+    at or below the startup.
+    """
+    summary: pd.DataFrame       # column → count, mean, median, std, p10 … p90
+    zscores: pd.DataFrame       # startup Id × column
+    ranks: pd.DataFrame         # startup Id × column
+    percentiles: pd.DataFrame   # startup Id × column
+
+    def mean(self, column) -> float:
+        return self.summary.at[column, "mean"] if column in self.summary.index else float("nan")
+
+    def for_startup(self, startup_id, columns) -> pd.DataFrame:
+        """One row per column: the startup's score and where it sits in the cohort."""
+        columns = [c for c in columns if c in self.summary.index]
+        if startup_id not in self.zscores.index:
+            return pd.DataFrame(columns=["mean", "median", "z", "rank", "percentile"])
+        out = self.summary.loc[columns, ["count", "mean", "median"]].copy()
+        out["z"] = self.zscores.loc[startup_id, columns]
+        out["rank"] = self.ranks.loc[startup_id, columns]
+        out["percentile"] = self.percentiles.loc[startup_id, columns]
+        return out
+
+
+@perf.timed("cohort_stats")
+def compute_cohort_stats(df: pd.DataFrame, columns=STAT_COLUMNS) -> CohortStats:
+    """Stats over the first row of every startup; columns missing from ``df`` are skipped."""
+    scores = df.drop_duplicates("Id").set_index("Id")
+    scores = scores[[c for c in columns if c in scores.columns]].astype("float64")
+
+    summary = scores.agg(["count", "mean", "median", "std"]).T
+    quantiles = scores.quantile(PERCENTILES).T
+    quantiles.columns = [f"p{round(q * 100)}" for q in PERCENTILES]
+    summary = summary.join(quantiles)
+
+    std = summary["std"].where(summary["std"] > 0)
+    return CohortStats(
+        summary=summary,
+        zscores=(scores - summary["mean"]) / std,
+        ranks=scores.rank(ascending=False, method="min"),
+        percentiles=scores.rank(method="max", pct=True) * 100,
+    )
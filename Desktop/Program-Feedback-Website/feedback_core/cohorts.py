@@ -0,0 +1,180 @@
+"""Several programs (cohorts) side by side, each loaded and synced on its own.
+
+Every cohort is one Airtable feedback table with its own snapshot file and
+its own startup names (Id → name), read from the cohort's linked Airtable
+table when configured, else from ``cohorts/<name>.json``. Nothing is
+loaded until a cohort is first asked for.
+"""
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COHORT_COLUMN = "Cohort"
+
+
+@dataclass
+class CohortNames:
+    startups: dict[str, str] = field(default_factory=dict)   # startup Id → name
+
+    def startup(self, startup_id, default=None):
+        return self.startups.get(startup_id, default if default is not None else f"ID {startup_id}")
+
+
+@dataclass
+class CohortConfig:
+    name: str
+    base_id: str = None
+    table_id: str = None
+    snapshot_path: str = None
+    names_path: str = None          # JSON fallback with the "startups" names
+    # Optional linked table with the startup names
+    startups_table: str = None
+    startup_id_field: str = "Id"
+    startup_name_field: str = "Name"
+    modified_field: str = None      # overrides airtable.modified_field
+
+
+def load_cohort_configs(secrets: dict, base_dir: str) -> list[CohortConfig]:
+    """Cohorts from the ``[cohorts.<name>]`` sections of the secrets.
+
+    Without any, the ``[airtable]`` base/table is a single cohort named
+    ``airtable.cohort`` (default "2025") that keeps the ``[storage]`` snapshot
+    path. Relative paths are resolved against ``base_dir``.
+    """
+    airtable = secrets.get("airtable", {})
+    sections = secrets.get("cohorts", {})
+    if not sections:
+        name = str(airtable.get("cohort", "2025"))
+        sections = {name: {
+            "base_id": airtable.get("base_id"),
+            "table_id": airtable.get("table_id"),
+            "snapshot_path": secrets.get("storage", {}).get("snapshot_path", "data/feedback_snapshot.parquet"),
+            **{k: v for k, v in airtable.items() if k in CohortConfig.__dataclass_fields__},
+        }}
+
+    configs = []
+    for name, section in sections.items():
+        options = {k: v for k, v in section.items() if k in CohortConfig.__dataclass_fields__ and k != "name"}
+        config = CohortConfig(name=str(name), **options)
+        config.snapshot_path = os.path.join(
+            base_dir, config.snapshot_path or os.path.join("data", f"{config.name}_snapshot.parquet"))
+        config.names_path = os.path.join(
+            base_dir, config.names_path or os.path.join("cohorts", f"{config.name}.json"))
+        configs.append(config)
+    return configs
+
+
+def load_names_file(path) -> CohortNames:
+    if not path or not os.path.exists(path):
+        return CohortNames()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return CohortNames(startups={str(k): v for k, v in data.get("startups", {}).items()})
+
+
+def fetch_names(api, config: CohortConfig) -> CohortNames:
+    """Startup names from the cohort's linked table; ``api`` is an :class:`AirtableFetcher`."""
+    records = api.table(config.base_id, config.startups_table).all(
+        fields=[config.startup_id_field, config.startup_name_field])
+    names = CohortNames()
+    for r in records:
+        fields = r["fields"]
+        if config.startup_id_field in fields and config.startup_name_field in fields:
+            names.startups[str(fields[config.startup_id_field])] = fields[config.startup_name_field]
+    return names
+
+
+class Cohort:
+    """One program: its names and its :class:`SnapshotStore`, both built on first use.
+
+    ``make_store(config, cohort)`` creates the store; ``api`` is ``None`` in
+    offline mode, where names only come from the JSON file.
+    """
+
+    def __init__(self, config: CohortConfig, make_store, api=None):
+        self.config = config
+        self.name = config.name
+        self._make_store = make_store
+        self._api = api
+        self._lock = threading.Lock()
+        self._store = None
+        self._names = None
+
+    @property
+    def names(self) -> CohortNames:
+        if self._names is None:
+            self.reload_names()
+        return self._names
+
+    def reload_names(self):
+        """Re-read the names; keeps the old ones on failure."""
+        self._names = self._read_names()
+
+    def _read_names(self) -> CohortNames:
+        if self._api is None or not self.config.startups_table:
+            return load_names_file(self.config.names_path)
+        try:
+            return fetch_names(self._api, self.config)
+        except Exception:  # keep the dashboard up with the previous or bundled names
+            logger.exception("Could not load the names of cohort %s", self.name)
+            return self._names if self._names is not None else load_names_file(self.config.names_path)
+
+    def refresh(self):
+        """Re-read the names and run a full sync (the Refresh button).
+
+        Online, the names table and the feedback table are downloaded
+        together; the frame is built once both are in, with the new names.
+        """
+        store = self.store
+        if self._api is None or store.offline:
+            self.reload_names()
+            return store.get(force=True)
+        started = datetime.now(timezone.utc)
+        fetched = self._api.fetch_many({"names": self._read_names, "records": store.download})
+        self._names = fetched["names"]
+        return store.refresh(fetched["records"], started)
+
+    @property
+    def store(self):
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = self._make_store(self.config, self)
+        return self._store
+
+    @property
+    def loaded(self) -> bool:
+        return self._store is not None
+
+
+class CohortRegistry:
+    """The configured cohorts by name, in configuration order."""
+
+    def __init__(self, configs, make_store, api=None):
+        self.cohorts = {c.name: Cohort(c, make_store, api) for c in configs}
+
+    def __getitem__(self, name) -> Cohort:
+        return self.cohorts[name]
+
+    def __len__(self):
+        return len(self.cohorts)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.cohorts)
+
+
+def combine_cohorts(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """One frame partitioned by ``COHORT_COLUMN``; keeps the record-id index."""
+    if not frames:
+        return pd.DataFrame(columns=[COHORT_COLUMN])
+    combined = pd.concat([df.assign(**{COHORT_COLUMN: name}) for name, df in frames.items()])
+    combined[COHORT_COLUMN] = pd.Categorical(combined[COHORT_COLUMN], categories=list(frames))
+    return combined
@@ -0,0 +1,83 @@
+"""Dashboard settings, read from the sections of ``.streamlit/secrets.toml``."""
+import os
+import tomllib
+from dataclasses import dataclass, field
+
+from .cohorts import CohortConfig, load_cohort_configs
+
+# Folder of app.py, which relative paths in the settings are resolved against
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SECRETS_PATH = os.path.join(APP_DIR, ".streamlit", "secrets.toml")
+
+
+@dataclass
+class Settings:
+    api_key: str = None
+    # Without credentials (or with offline = true) the dashboard serves the local snapshot only
+    offline: bool = True
+    # Seconds a snapshot is shared before the next rerun syncs it again
+    cache_ttl: int = 300
+    # "incremental" only downloads records edited since the last sync, "full" re-reads the table
+    sync_mode: str = "incremental"
+    # Seconds between checks for records deleted in Airtable (incremental mode)
+    deletion_check_interval: int = 600
+    # Seconds between full syncs in incremental mode: deltas miss rollup, lookup and formula fields
+    full_sync_interval: int = 1800
+    # Optional Airtable "Last modified time" field used to tell which records changed
+    modified_field: str = None
+    # Tables downloaded at the same time (each base is still capped at 5 requests/s)
+    fetch_workers: int = 8
+    # Sync only the fields the cohort views need and fetch long texts per startup
+    lazy_fields: bool = True
+    # Resized copies of the startup logos, so expired attachment URLs still render
+    image_cache_dir: str = os.path.join(APP_DIR, "data", "images")
+    image_cache_mb: int = 50
+    # One entry per program: base/table, snapshot file and where the names come from
+    cohorts: list[CohortConfig] = field(default_factory=list)
+    default_cohort: str = None
+    # Stage timings of every session in a sidebar panel and as JSON lines (?perf=1: one session)
+    perf: bool = False
+    perf_log: str = None
+
+    def cohort_modified_field(self, config: CohortConfig):
+        return config.modified_field or self.modified_field
+
+
+def read_secrets(path=SECRETS_PATH) -> dict:
+    """The secrets file as a dict, empty when there is none (offline demo)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_settings(secrets: dict, base_dir=APP_DIR) -> Settings:
+    """Settings from the ``[airtable]``, ``[storage]``, ``[debug]`` and ``[cohorts.*]`` sections.
+
+    Raises ``ValueError`` when ``default_cohort`` names no configured program.
+    """
+    airtable = secrets.get("airtable", {})
+    storage = secrets.get("storage", {})
+    debug = secrets.get("debug", {})
+    cohorts = load_cohort_configs(secrets, base_dir)
+    default_cohort = str(airtable.get("default_cohort", cohorts[-1].name))
+    if default_cohort not in {c.name for c in cohorts}:
+        raise ValueError(f"airtable.default_cohort = {default_cohort!r} is not a configured program, "
+                         f"expected one of {', '.join(c.name for c in cohorts)}")
+    return Settings(
+        api_key=airtable.get("api_key"),
+        offline=bool(airtable.get("offline", False)) or "api_key" not in airtable,
+        cache_ttl=int(airtable.get("cache_ttl", 300)),
+        sync_mode=airtable.get("sync_mode", "incremental"),
+        deletion_check_interval=int(airtable.get("deletion_check_interval", 600)),
+        full_sync_interval=int(airtable.get("full_sync_interval", 1800)),
+        modified_field=airtable.get("modified_field"),
+        fetch_workers=int(airtable.get("fetch_workers", 8)),
+        lazy_fields=bool(airtable.get("lazy_fields", True)),
+        image_cache_dir=os.path.join(base_dir, storage.get("image_cache_dir", "data/images")),
+        image_cache_mb=int(storage.get("image_cache_mb", 50)),
+        cohorts=cohorts,
+        default_cohort=default_cohort,
+        perf=bool(debug.get("perf", False)),
+        perf_log=os.path.join(base_dir, debug["perf_log"]) if debug.get("perf_log") else None,
+    )
@@ -0,0 +1,48 @@
+"""Heavy fields of one startup, downloaded when it is selected."""
+import pandas as pd
+
+from . import perf
+from .memo import memoize_by_record
+from .normalize import normalize_frame
+
+
+def record_formula(record_id: str) -> str:
+    """filterByFormula selecting a single record."""
+    return f"RECORD_ID() = '{record_id}'"
+
+
+class DetailLoader:
+    """Adds the ``fields`` a snapshot row lacks, fetched from ``table``.
+
+    Downloads are cached per (record id, record version), so a record is
+    fetched again only after it changed. With ``table=None`` (offline), or
+    when the row already holds some of the fields (a snapshot synced without
+    projection), the row is returned as is.
+    """
+
+    def __init__(self, table, fields, maxsize=256):
+        self.table = table
+        self.fields = list(fields)
+        self._fetch = memoize_by_record(maxsize)(self._fetch_record)
+
+    @perf.timed("details.fetch")
+    def _fetch_record(self, row) -> pd.Series:
+        records = self.table.all(formula=record_formula(row.name), fields=self.fields)
+        if not records:
+            return pd.Series(dtype=object)
+        df = pd.DataFrame([records[0]["fields"]], index=[records[0]["id"]])
+        return normalize_frame(df).iloc[0]
+
+    def load(self, row: pd.Series) -> pd.Series:
+        if self.table is None or row.reindex(self.fields).notna().any():
+            return row
+        detail = self._fetch(row)
+        return pd.concat([row, detail.drop(row.index, errors="ignore")]).rename(row.name)
+
+    def load_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """``df`` with the fields of every record, read in one paged listing (batch jobs)."""
+        if self.table is None or df.reindex(columns=self.fields).notna().any().any():
+            return df
+        records = self.table.all(fields=self.fields)
+        detail = normalize_frame(pd.DataFrame([r["fields"] for r in records], index=[r["id"] for r in records]))
+        return df.join(detail.drop(columns=df.columns, errors="ignore"))
@@ -0,0 +1,205 @@
+"""Concurrent Airtable reader: one pooled HTTP session, per-base rate limits.
+
+Airtable allows 5 requests per second per base (and 50 per second per
+token) and answers 429 above that. Tables are fetched in parallel on a
+thread pool; the pages of one table are sequential because every page
+carries the ``offset`` cursor for the next one. Requests block on a token
+bucket before they are sent, and 429/5xx answers, connection errors and
+timeouts are retried with exponential backoff.
+"""
+import contextvars
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import perf
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://api.airtable.com/v0"
+PAGE_SIZE = 100         # Airtable's maximum
+RATE_PER_BASE = 5.0     # requests per second
+RATE_PER_TOKEN = 50.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AirtableError(Exception):
+    """An error answer from Airtable, or a request that still failed after every retry."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting for it if the bucket is empty."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+
+    def pause(self, seconds):
+        """Empty the bucket so nobody sends for ``seconds`` (after a 429)."""
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class AirtableFetcher:
+    """Reads whole Airtable tables, several at a time.
+
+    ``table(base_id, table)`` returns an object with the pyairtable-style
+    ``all(fields=..., formula=...)`` used by :class:`SnapshotStore`, and
+    :meth:`fetch_many` runs several such downloads concurrently, so a full
+    refresh takes about as long as the slowest table.
+    """
+
+    def __init__(self, api_key, api_url=API_URL, max_workers=8, rate_per_base=RATE_PER_BASE,
+                 rate_per_token=RATE_PER_TOKEN, max_retries=5, backoff=1.0, timeout=30):
+        self.api_url = api_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate_per_base = rate_per_base
+
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {api_key}"
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="airtable-fetch")
+        self._token_bucket = TokenBucket(rate_per_token)
+        self._base_buckets = {}
+        self._buckets_lock = threading.Lock()
+
+    def _bucket(self, base_id) -> TokenBucket:
+        with self._buckets_lock:
+            if base_id not in self._base_buckets:
+                # No bursts: Airtable counts requests over a sliding second
+                self._base_buckets[base_id] = TokenBucket(self.rate_per_base, capacity=1)
+            return self._base_buckets[base_id]
+
+    def _get(self, base_id, table, params):
+        url = f"{self.api_url}/{base_id}/{table}"
+        bucket = self._bucket(base_id)
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            self._token_bucket.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error, status, retry_after = exc, None, None
+            except requests.RequestException as exc:
+                raise AirtableError(f"{exc} on {base_id}/{table}") from exc
+            else:
+                perf.count("airtable.requests")
+                perf.count("airtable.bytes", len(response.content))
+                if response.status_code not in RETRY_STATUSES:
+                    if not response.ok:
+                        raise AirtableError(f"{response.status_code} on {base_id}/{table}: {response.text[:200]}",
+                                            status=response.status_code)
+                    return response.json()
+                error, status = f"{response.status_code} on {base_id}/{table}", response.status_code
+                retry_after = response.headers.get("Retry-After")
+                if response.status_code == 429:
+                    # Airtable blocks the whole base for a while: hold every request to it
+                    bucket.pause(float(retry_after) if retry_after else self.backoff)
+            if attempt == self.max_retries:
+                break
+            delay = float(retry_after) if retry_after else self.backoff * 2 ** attempt
+            delay *= 1 + random.random() / 4     # jitter, so threads do not retry in lockstep
+            perf.count("airtable.retries")
+            logger.warning("Airtable %s, retrying in %.1f s", error, delay)
+            time.sleep(delay)
+        cause = error if isinstance(error, requests.RequestException) else None
+        raise AirtableError(f"{error} after {self.max_retries} retries", status=status) from cause
+
+    @perf.timed("airtable.fetch_table")
+    def fetch_table(self, base_id, table, fields=(), formula=None) -> list[dict]:
+        """Every record of one table (all pages), as Airtable returns them."""
+        params = {"pageSize": PAGE_SIZE}
+        if fields:
+            params["fields[]"] = list(fields)
+        if formula:
+            params["filterByFormula"] = formula
+        records = []
+        while True:
+            page = self._get(base_id, table, params)
+            records.extend(page.get("records", []))
+            if not page.get("offset"):
+                perf.count("airtable.records", len(records))
+                return records
+            params["offset"] = page["offset"]
+
+    def fetch_many(self, downloads: dict) -> dict:
+        """``key → download`` to ``key → result``, run concurrently.
+
+        A download is any function without arguments that reads tables of
+        this fetcher, e.g. ``fetcher.table(base, table).all``. The first
+        failure is raised once every download has finished.
+        """
+        # copy_context: timings of the fetch threads go to the caller's perf trace
+        futures = {key: self._executor.submit(contextvars.copy_context().run, download)
+                   for key, download in downloads.items()}
+        wait(futures.values())
+        return {key: future.result() for key, future in futures.items()}
+
+    def table(self, base_id, table) -> "FetcherTable":
+        return FetcherTable(self, base_id, table)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+
+class FetcherTable:
+    """One table of an :class:`AirtableFetcher` with a pyairtable-like ``all``.
+
+    Airtable rejects a ``fields[]`` list naming a field the table does not
+    have (e.g. an older cohort); the table is then read whole and the
+    projection applied locally from there on.
+    """
+
+    def __init__(self, fetcher, base_id, table):
+        self.fetcher = fetcher
+        self.base_id = base_id
+        self.table = table
+        self.projectable = True
+
+    def all(self, fields=(), formula=None) -> list[dict]:
+        if fields and self.projectable:
+            try:
+                return self.fetcher.fetch_table(self.base_id, self.table, fields, formula)
+            except AirtableError as exc:
+                if exc.status != 422 or "UNKNOWN_FIELD_NAME" not in str(exc):
+                    raise
+                logger.warning("%s; reading every field of %s instead", exc, self.table)
+                self.projectable = False
+        records = self.fetcher.fetch_table(self.base_id, self.table, (), formula)
+        if not fields:
+            return records
+        keep = set(fields)
+        return [{**r, "fields": {k: v for k, v in r["fields"].items() if k in keep}} for r in records]
@@ -0,0 +1,39 @@
+"""Which Airtable fields each part of the page reads.
+
+The snapshot only downloads the ``SNAPSHOT_SECTIONS`` fields, which every
+startup needs for the cohort views. The long texts and attachments of
+``DETAIL_SECTIONS`` are fetched one record at a time, when that startup is
+selected (see :class:`feedback_core.details.DetailLoader`).
+"""
+from .cohort_stats import STAT_COLUMNS
+from .flags import CATS, FLAG_FIELDS
+from .founder_tags import TAG_FIELDS
+from .schema import VOTE_COLUMNS
+
+SECTION_FIELDS = {
+    # Program overview: counts, votes and the risk/reward matrix
+    "overview": ["Id", "Average RISK", "Average Reward", *VOTE_COLUMNS],
+    # Score charts and the percentile tables
+    "scores": STAT_COLUMNS,
+    # Founder & Score tags (Unconventional Thinking, Confidence, Ambition, pillars)
+    "founder_tags": [f.field for f in TAG_FIELDS],
+    # EM's Feedback: flag explanations and the mentor scores inlined in them
+    "mentor_feedback": [field for field, _ in FLAG_FIELDS] + [f"{cat} | Mentor Scores" for cat in CATS],
+    "human_calls": ["HDD_Calls_Average", "HDD_Calls_Exceptional", "HDD_Calls_Evaluator", "HDD_Calls_Notes"],
+    "scientific": ["BRS_Calculation", "GRIT_Calculation",
+                   "OLBI_Exhaustion_Descriptor", "OLBI_Disengagement_Descriptor"],
+    "logo": ["original logo"],
+}
+
+SNAPSHOT_SECTIONS = ["overview", "scores", "founder_tags"]
+DETAIL_SECTIONS = ["mentor_feedback", "human_calls", "scientific", "logo"]
+
+
+def fields_for(sections, extra=()) -> list[str]:
+    """Fields of ``sections`` plus ``extra``, without duplicates and in order."""
+    fields = [f for s in sections for f in SECTION_FIELDS[s]]
+    return list(dict.fromkeys([*fields, *(f for f in extra if f)]))
+
+
+SNAPSHOT_FIELDS = fields_for(SNAPSHOT_SECTIONS)
+DETAIL_FIELDS = fields_for(DETAIL_SECTIONS)
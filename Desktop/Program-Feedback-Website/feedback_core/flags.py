@@ -0,0 +1,136 @@
+"""Parsing of the mentor flag rollups (``*_exp``) and mentor score strings."""
+import re
+from collections import defaultdict
+
+import pandas as pd
+
+from . import perf
+from .memo import memoize_by_record
+from .mentors import NameMatcher
+from .normalize import normalize_list
+
+# --- 1. Names list stays the same ------------------------------------------
+JUDGE_NAMES = [
+    "Jorge Gonzalez-Iglesias", "Juan de Antonio", "Adam Beguelin",
+    "Alejandro Lopez", "Alex Barrera", "Álvaro Dexeus", "Anastasia Dedyukhina",
+    "Andrea Klimowitz", "Anna  Fedulow", "Bastien  Pierre Jean Gambini",
+    "Beth Susanne", "David Beratech", "Elise Mitchell", "Esteban Urrea",
+    "Fernando Cabello", "Gennaro Bifulco", "Ivan Alaiz", "Ivan Nabalon",
+    "Ivan Peña", "Jair Halevi", "Jason Eckenroth", "Javier Darriba",
+    "Juan Pablo Tejela", "Laura Montells", "Manel Adell", "Oscar Macia",
+    "Paul Ford", "Pedro Claveria", "Philippe Gelis", "Ranny Nachmais",
+    "Rebeca De Sancho", "Rui Fernandes", "Sean Cook", "Shadi  Yazdan",
+    "Shari Swan", "Stacey  Ford", "Sven  Huber", "Torsten Kolind", "Jaime", "John Varuguese", "Elise Mitchel"
+]
+
+# Variant spelling → canonical mentor name (repeated spaces are ignored anyway)
+MENTOR_ALIASES = {
+    "Elise Mitchel": "Elise Mitchell",
+}
+
+# --- 2. Simple HTML cleaner (unchanged) ------------------------------------
+_HTML_BREAK_RE = re.compile(r"<br\s*/?>", flags=re.I)
+
+def _clean_html(raw: str) -> str:
+    if not isinstance(raw, str):
+        return raw or ""
+    txt = _HTML_BREAK_RE.sub("\n", raw)
+    txt = txt.replace("**", "")
+    return txt.strip()
+
+CATS = [
+    "State of development", "Momentum", "Management",
+    "Market", "Team", "Pain", "Scalability",
+]
+
+# === Expresión regular para categorías (con ":")
+_CAT_RE = re.compile(r"(" + "|".join(map(re.escape, CATS)) + r")\s*:", flags=re.I)
+
+# === Matcher de nombres de mentor
+# A judge name counts when followed by end-of-string, whitespace, a colon or a
+# capital letter (for “State”, “Momentum”…), see NameMatcher.
+MENTORS = NameMatcher(JUDGE_NAMES, MENTOR_ALIASES)
+
+@memoize_by_record()
+@perf.timed("flags.mentor_scores")
+def extract_mentor_scores(row) -> dict[str, dict[str, float]]:
+    """Mentor → {category: score}, parsed once per record version."""
+    mentor_scores = defaultdict(dict)
+
+    for cat in CATS:
+        field_name = f"{cat} | Mentor Scores"
+        raw = row.get(field_name)
+        if not raw:
+            continue
+        entries = normalize_list(raw)
+        for entry in entries:
+            parts = [p.strip() for p in entry.split(",")]
+            for p in parts:
+                if ": " in p:
+                    name, score = p.split(": ")
+                    try:
+                        mentor_scores[MENTORS.canonical(name)][cat.lower()] = float(score.strip())
+                    except ValueError:
+                        continue
+    return dict(mentor_scores)
+
+# === Formatea texto con puntuaciones del mentor
+def _format_categories(text: str, scores: dict[str, float] | None = None) -> str:
+    text = _clean_html(text)
+    matches = list(_CAT_RE.finditer(text))
+    if not matches:
+        return text.strip()
+
+    out = []
+
+    if matches[0].start() > 0:
+        out.append(text[:matches[0].start()].strip())
+
+    for idx, match in enumerate(matches):
+        label = match.group(1).strip()
+        key = label.lower()
+        start = match.end()
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+        body = text[start:end].strip()
+
+        score = scores.get(key) if scores else None
+        score_text = f" ({score:.2f})" if score is not None and pd.notna(score) else ""
+        out.append(f"**{label}{score_text}:** {body}")
+
+    return "\n\n".join(out)
+
+# === Extrae (mentor, comentario sin procesar) desde string largo
+def _group_by_mentor(raw: str) -> list[tuple[str, str]]:
+    text = _clean_html(raw)
+    hits = MENTORS.finditer(text)
+
+    if not hits:
+        yield "Anonymous", text.strip()
+        return
+
+    for idx, (_, start, mentor) in enumerate(hits):
+        end = hits[idx + 1][0] if idx + 1 < len(hits) else len(text)
+        comment = text[start:end].lstrip(' :–').strip()
+        if comment:
+            yield mentor, comment
+
+# === Junta todas las banderas (green/yellow/red) para cada mentor
+FLAG_FIELDS = [
+    ("RISK | Green_exp",   "green"),
+    ("RISK | Yellow_exp",  "yellow"),
+    ("RISK | Red_exp",     "red"),
+    ("Reward | Green_exp", "green"),
+    ("Reward | Yellow_exp","yellow"),
+    ("Reward | Red_exp",   "red"),
+]
+
+@memoize_by_record()
+@perf.timed("flags.group_by_mentor")
+def collect_flag_records(row):
+    """[(mentor, color, raw comment), ...] from the six flag fields."""
+    records = []
+    for field, color in FLAG_FIELDS:
+        for raw in normalize_list(row.get(field, [])):
+            for mentor, raw_comment in _group_by_mentor(raw):
+                records.append((mentor, color, raw_comment))
+    return records
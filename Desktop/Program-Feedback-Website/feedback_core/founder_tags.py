@@ -0,0 +1,116 @@
+"""Strict parser for the "Founder & Score" tag fields.
+
+Every field holds one or more entries (a string or a list of strings) of the form
+
+    field := tag (", " tag)*
+    tag   := founder ": " value
+    value := "Bonus Star" | "Red Flag"      (flag fields)
+           | number                          (pillar fields)
+
+Well-formed tags become :class:`FounderTag` tuples; anything else is collected
+as a :class:`TagError` instead of raising.
+"""
+import re
+from typing import NamedTuple
+
+import pandas as pd
+
+from .normalize import normalize_list
+
+# Numeric value of the flag tags
+BONUS_STAR = 1.0
+RED_FLAG = -1.0
+
+FLAG, SCORE = "flag", "score"
+
+
+class TagField(NamedTuple):
+    field: str      # Airtable field name
+    source: str     # where the tag was given: Talks, Workstations, Individual Contest, Pillars
+    metric: str
+    kind: str       # FLAG or SCORE
+
+
+HUMAN_PILLARS = [
+    "Purpose", "Openness", "Integrity and honesty", "Relevant experience",
+    "Visionary leadership", "Flexibility", "Emotional intelligence",
+]
+
+TAG_FIELDS = [
+    TagField("Talks | Unconventional thinking (Founder & Score)", "Talks", "Unconventional Thinking", FLAG),
+    TagField("Workstations | Unconventional Thinking (Founder & Score)", "Workstations", "Unconventional Thinking", FLAG),
+    TagField("Individual Contest | Unconventional Thinking (Founder & Score)", "Individual Contest", "Unconventional Thinking", FLAG),
+    TagField("Individual Contest | Confidence (Founder & Score)", "Individual Contest", "Confidence", FLAG),
+    TagField("Individual Contest | Ambition (Founder & Score)", "Individual Contest", "Ambition", FLAG),
+    *(TagField(f"{p} | Founder & Score", "Pillars", p, SCORE) for p in HUMAN_PILLARS),
+]
+
+
+class FounderTag(NamedTuple):
+    startup_id: str
+    source: str
+    founder: str
+    metric: str
+    value: float    # pillar score, or BONUS_STAR / RED_FLAG
+
+
+class TagError(NamedTuple):
+    startup_id: str
+    field: str
+    entry: str
+    reason: str
+
+
+_TAG_RE = re.compile(r"(?P<founder>[^:,]*\S)\s*: (?P<value>[^:,]+)")
+_NUMBER_RE = re.compile(r"[+-]?\d+(?:\.\d+)?")
+_FLAG_VALUES = {"bonus star": BONUS_STAR, "red flag": RED_FLAG}
+
+
+def _parse_value(raw: str, kind: str):
+    """(value, None) or (None, reason)."""
+    text = " ".join(raw.split())
+    if kind == FLAG:
+        value = _FLAG_VALUES.get(text.lower())
+        return (value, None) if value is not None else (None, f"expected Bonus Star or Red Flag, got {text!r}")
+    if _NUMBER_RE.fullmatch(text):
+        return float(text), None
+    return None, f"expected a number, got {text!r}"
+
+
+def parse_field(startup_id, spec: TagField, raw, tags: list, errors: list):
+    """Append the tags found in one cell to ``tags`` and its problems to ``errors``."""
+    for entry in normalize_list(raw):
+        if not isinstance(entry, str):
+            errors.append(TagError(startup_id, spec.field, repr(entry), "not text"))
+            continue
+        for part in entry.split(", "):
+            part = part.strip()
+            if not part:
+                continue
+            m = _TAG_RE.fullmatch(part)
+            if m is None:
+                errors.append(TagError(startup_id, spec.field, part, 'expected "Founder: value"'))
+                continue
+            value, reason = _parse_value(m.group("value"), spec.kind)
+            if reason:
+                errors.append(TagError(startup_id, spec.field, part, reason))
+                continue
+            tags.append(FounderTag(startup_id, spec.source, " ".join(m.group("founder").split()),
+                                   spec.metric, value))
+
+
+def parse_frame(df: pd.DataFrame, fields=TAG_FIELDS) -> tuple[list[FounderTag], list[TagError]]:
+    """Parse every tag field of every startup in ``df`` in one pass.
+
+    Rows are read column by column; fields missing from ``df`` are skipped.
+    """
+    tags, errors = [], []
+    ids = df["Id"].tolist()
+    for spec in fields:
+        if spec.field not in df:
+            continue
+        for startup_id, raw in zip(ids, df[spec.field].tolist()):
+            if isinstance(raw, float) and pd.isna(raw):
+                continue
+            parse_field(startup_id, spec, raw, tags, errors)
+    return tags, errors
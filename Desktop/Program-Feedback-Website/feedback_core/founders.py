@@ -0,0 +1,50 @@
+"""Long-format founder metric facts and their aggregations.
+
+One row per parsed "Founder & Score" tag::
+
+    startup_id | founder | pillar | source | value
+
+Flag pillars (Unconventional Thinking, Confidence, Ambition) hold BONUS_STAR
+or RED_FLAG, the human pillars hold the 1–4 score. Every aggregation is a
+single ``groupby`` over this table.
+"""
+import pandas as pd
+
+from . import perf
+from .founder_tags import BONUS_STAR, FLAG, RED_FLAG, SCORE, TAG_FIELDS, parse_frame
+
+FACT_COLUMNS = ["startup_id", "founder", "pillar", "source", "value"]
+
+FLAG_PILLARS = list(dict.fromkeys(f.metric for f in TAG_FIELDS if f.kind == FLAG))
+SCORE_PILLARS = list(dict.fromkeys(f.metric for f in TAG_FIELDS if f.kind == SCORE))
+
+
+@perf.timed("founders.facts")
+def build_fact_table(df: pd.DataFrame):
+    """Facts for the first row of every startup in ``df``, plus the parse errors."""
+    tags, errors = parse_frame(df.drop_duplicates("Id"))
+    facts = pd.DataFrame(tags, columns=["startup_id", "source", "founder", "metric", "value"])
+    facts = facts.rename(columns={"metric": "pillar"})[FACT_COLUMNS]
+    facts["pillar"] = pd.Categorical(facts["pillar"], categories=FLAG_PILLARS + SCORE_PILLARS)
+    for col in ("startup_id", "founder", "source"):
+        facts[col] = facts[col].astype("category")
+    facts["value"] = facts["value"].astype("float64")
+    return facts, errors
+
+
+def flag_counts(facts: pd.DataFrame) -> pd.DataFrame:
+    """Bonus Star / Red Flag counts indexed by (startup_id, pillar, founder)."""
+    flags = facts[facts["pillar"].isin(FLAG_PILLARS)]
+    return (
+        flags.assign(**{"Bonus Star": flags["value"].eq(BONUS_STAR),
+                        "Red Flag": flags["value"].eq(RED_FLAG)})
+        .groupby(["startup_id", "pillar", "founder"], observed=True)[["Bonus Star", "Red Flag"]]
+        .sum()
+    )
+
+
+def founder_means(facts: pd.DataFrame) -> pd.DataFrame:
+    """Mean score per (startup_id, founder, pillar) over the human pillars."""
+    scores = facts[facts["pillar"].isin(SCORE_PILLARS)]
+    return scores.groupby(["startup_id", "founder", "pillar"], observed=True)["value"].mean().to_frame()
+
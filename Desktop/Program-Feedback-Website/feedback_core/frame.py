@@ -0,0 +1,52 @@
+"""Raw Airtable records → the dashboard DataFrame."""
+import pandas as pd
+
+from . import perf
+from .normalize import normalize_frame
+from .records import check_schema
+
+
+# Define score tiers
+def classify(value):
+    if value > 3.5:
+        return "High"
+    elif value > 2.5:
+        return "Medium"
+    else:
+        return "Low"
+
+
+def _column(df, name):
+    """Column ``name`` or all-NaN when no record in ``df`` has that field."""
+    return df[name] if name in df else pd.Series(float("nan"), index=df.index)
+
+
+def build_frame(records, names, partial=False):
+    """Turn raw Airtable records into the dashboard DataFrame, indexed by record id.
+
+    ``names`` is the cohort's :class:`~feedback_core.cohorts.CohortNames`.
+    Raises :class:`~feedback_core.records.SchemaError` when the fields changed
+    type. ``partial`` records are the few changed since an incremental sync:
+    they are not checked (none of them may have an ``Id``), the next full
+    sync checks the whole table.
+    """
+    # === Convert to DataFrame ===
+    with perf.stage("frame.dataframe"):
+        df = pd.DataFrame([r["fields"] for r in records], index=[r["id"] for r in records])
+    if not partial:
+        check_schema(df)
+    # === Fix {'specialValue': 'NaN'} values and cast the score columns ===
+    with perf.stage("frame.normalize"):
+        df = normalize_frame(df)
+
+    # === Fallback to Id as startup identifier ===
+    df = df[_column(df, "Id").notna()].copy()
+    df["Id"] = _column(df, "Id").astype(str)
+
+    # Classify each startup
+    df["Risk Level"] = _column(df, "Average RISK").apply(classify)
+    df["Reward Level"] = _column(df, "Average Reward").apply(classify)
+
+    # Define labels from the cohort's names
+    df["Startup Label"] = df["Id"].apply(names.startup)
+    return df
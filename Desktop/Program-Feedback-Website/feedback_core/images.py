@@ -0,0 +1,147 @@
+"""Local copies of the Airtable logo attachments, resized once.
+
+Attachment URLs are signed and expire after a few hours, and the originals
+are often several MB. Each attachment is downloaded once, shrunk to
+``width`` pixels and kept on disk as ``<attachment id>_<width>.webp``; the
+least recently used files are deleted when the folder grows past
+``max_bytes``.
+
+A URL that failed (expired, unreachable) is not tried again for
+``failure_ttl`` seconds, so a missing logo does not cost a timeout on every
+rerun; with ``offline=True`` only the files already on disk are served.
+"""
+import io
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from PIL import Image
+
+from . import perf
+
+logger = logging.getLogger(__name__)
+
+FORMAT, SUFFIX = "WEBP", ".webp"
+
+
+class ImageCache:
+    def __init__(self, directory, width=800, max_bytes=50 * 1024 * 1024, timeout=15, session=None,
+                 offline=False, failure_ttl=300):
+        self.directory = directory
+        self.width = width
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.offline = offline
+        self.failure_ttl = failure_ttl
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._failures = {}             # url → time.monotonic() of its last failed download
+        os.makedirs(directory, exist_ok=True)
+
+        # path → size, oldest access first (file mtimes carry the order across restarts)
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith(SUFFIX):
+                stat = os.stat(os.path.join(directory, name))
+                entries.append((stat.st_mtime, os.path.join(directory, name), stat.st_size))
+        self._entries = OrderedDict((path, size) for _, path, size in sorted(entries))
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._entries.values())
+
+    def _path(self, attachment_id):
+        return os.path.join(self.directory, f"{attachment_id}_{self.width}{SUFFIX}")
+
+    def _source_url(self, attachment):
+        """Smallest Airtable thumbnail at least ``width`` wide, else the original."""
+        thumbs = sorted(
+            (t for t in (attachment.get("thumbnails") or {}).values()
+             if isinstance(t, dict) and t.get("url") and (t.get("width") or 0) >= self.width),
+            key=lambda t: t["width"],
+        )
+        return thumbs[0]["url"] if thumbs else attachment.get("url")
+
+    def get(self, attachment) -> str | None:
+        """Path of the resized copy of ``attachment`` (an Airtable attachment dict).
+
+        ``None`` when it is not cached and cannot be downloaded, e.g. because
+        its URL has expired (or failed less than ``failure_ttl`` seconds ago),
+        or in offline mode.
+        """
+        if not isinstance(attachment, dict) or not attachment.get("id"):
+            return None
+        path = self._path(attachment["id"])
+        with self._lock:
+            if path in self._entries:
+                if os.path.exists(path):
+                    self._touch(path)
+                    return path
+                del self._entries[path]
+            key_lock = self._key_locks.setdefault(path, threading.Lock())
+
+        with key_lock:  # one download per attachment, however many sessions ask
+            if path in self._entries:
+                return path
+            url = self._source_url(attachment)
+            if not url or self.offline or self._failed_recently(url):
+                return None
+            try:
+                with perf.stage("images.download"):
+                    response = self.session.get(url, timeout=self.timeout)
+                    response.raise_for_status()
+                    data = self._resize(response.content)
+                perf.count("images.downloaded_bytes", len(response.content))
+            except (requests.RequestException, OSError) as exc:
+                logger.warning("Could not cache image %s: %s", attachment["id"], exc)
+                with self._lock:
+                    self._failures[url] = time.monotonic()
+                return None
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            with self._lock:
+                self._entries[path] = len(data)
+                self._evict()
+                self._key_locks.pop(path, None)
+            return path
+
+    def _failed_recently(self, url) -> bool:
+        with self._lock:
+            failed_at = self._failures.get(url)
+            if failed_at is None:
+                return False
+            if time.monotonic() - failed_at < self.failure_ttl:
+                return True
+            del self._failures[url]
+            return False
+
+    def _resize(self, content: bytes) -> bytes:
+        with Image.open(io.BytesIO(content)) as im:
+            im = im.convert("RGBA" if im.mode in ("RGBA", "LA", "P") else "RGB")
+            im.thumbnail((self.width, self.width))
+            out = io.BytesIO()
+            im.save(out, FORMAT, quality=85)
+        return out.getvalue()
+
+    def _touch(self, path):
+        self._entries.move_to_end(path)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        total = self.total_bytes
+        while total > self.max_bytes and len(self._entries) > 1:
+            path, size = self._entries.popitem(last=False)
+            total -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,51 @@
+"""Lookups by startup Id and name, built once per snapshot.
+
+Selecting a startup used to filter the whole frame by ``Id`` and rebuild
+and re-sort the option list on every rerun. :class:`SnapshotIndex` keeps
+the row position of each Id, the sorted selectbox options, their labels
+and a reverse name → Id map, so each of those is a dict or list access.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .cohorts import CohortNames
+
+
+def _id_order(startup_id: str):
+    """Numeric Ids in numeric order, anything else after them."""
+    return (0, int(startup_id), "") if startup_id.isdigit() else (1, 0, startup_id)
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotIndex:
+    names: CohortNames              # the names the index was built with
+    positions: dict[str, int]       # Id → position of its first row in the frame
+    options: list[str]              # Ids with a name, sorted (the selectbox options)
+    labels: dict[str, str]          # Id → startup name
+    by_name: dict[str, str]         # casefolded startup name → Id
+
+    def row(self, df: pd.DataFrame, startup_id) -> pd.Series | None:
+        """First row of ``startup_id`` in ``df``, the frame the index was built from."""
+        position = self.positions.get(startup_id)
+        return None if position is None else df.iloc[position]
+
+    def find(self, name) -> str | None:
+        """Id of the startup called ``name`` (any case), or ``name`` itself when it is an Id."""
+        name = str(name).strip()
+        return self.by_name.get(name.casefold()) or (name if name in self.positions else None)
+
+
+def build_index(df: pd.DataFrame, names: CohortNames) -> SnapshotIndex:
+    positions = {}
+    for position, startup_id in enumerate(df["Id"].tolist()):
+        positions.setdefault(startup_id, position)
+    options = sorted((i for i in positions if i in names.startups), key=_id_order)
+    labels = {i: names.startups[i] for i in options}
+    return SnapshotIndex(
+        names=names,
+        positions=positions,
+        options=options,
+        labels=labels,
+        by_name={str(label).strip().casefold(): i for i, label in labels.items()},
+    )
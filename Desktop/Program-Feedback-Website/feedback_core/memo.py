@@ -0,0 +1,41 @@
+"""Memoization of per-record parsing across snapshots."""
+import functools
+import threading
+from collections import OrderedDict
+
+from .schema import RECORD_VERSION_COLUMN
+
+
+def memoize_by_record(maxsize=2048):
+    """Cache ``fn(row)`` per (Airtable record id, record version).
+
+    ``row`` is a row of the snapshot frame, so ``row.name`` is the record id
+    and ``RECORD_VERSION_COLUMN`` changes whenever the record does. Results
+    survive incremental syncs for untouched records. Rows without a version
+    are parsed every time. Cached values are shared, so callers must not
+    modify them.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(row):
+            version = row.get(RECORD_VERSION_COLUMN)
+            if version is None or not isinstance(version, str):
+                return fn(row)
+            key = (row.name, version)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+            value = fn(row)
+            with lock:
+                cache[key] = value
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
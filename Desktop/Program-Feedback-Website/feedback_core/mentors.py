@@ -0,0 +1,129 @@
+"""Single-pass matcher for mentor names in free text (Aho–Corasick)."""
+import bisect
+import re
+from collections import deque
+
+_WS_RUN_RE = re.compile(r"\s{2,}|[^\S ]")
+
+
+def normalize_name(name: str) -> str:
+    """Matching key: lower case, whitespace runs collapsed to one space."""
+    return " ".join(name.split()).lower()
+
+
+def _normalize_text(text: str) -> tuple[str, list[int], list[int]]:
+    """``text`` normalized like the names, plus what is needed to map offsets back.
+
+    Returns the normalized string and two sorted lists: the normalized offsets
+    right after each collapsed whitespace run, and how many characters had
+    been dropped before each of them.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Rare characters whose lower case is longer ("İ"); keep the originals
+        lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+    pieces, points, removed = [], [], []
+    last = dropped = 0
+    for m in _WS_RUN_RE.finditer(lowered):
+        pieces.append(lowered[last:m.start()])
+        pieces.append(" ")
+        space_at = m.start() - dropped
+        dropped += m.end() - m.start() - 1
+        points.append(space_at + 1)
+        removed.append(dropped)
+        last = m.end()
+    if not pieces:
+        return lowered, points, removed
+    pieces.append(lowered[last:])
+    return "".join(pieces), points, removed
+
+
+def _to_original(pos: int, points: list[int], removed: list[int]) -> int:
+    i = bisect.bisect_right(points, pos) - 1
+    return pos + (removed[i] if i >= 0 else 0)
+
+
+class NameMatcher:
+    """Finds known names in text with one linear pass, whatever the number of names.
+
+    Names are matched case-insensitively and regardless of repeated
+    whitespace ("Anna  Fedulow" == "Anna Fedulow"). ``aliases`` maps variant
+    spellings to the name they stand for ("Elise Mitchel" → "Elise Mitchell");
+    every hit is reported under its canonical spelling.
+
+    A hit must be followed by the end of the text, whitespace, a colon or an
+    upper-case letter, because the rollups glue names to the next word
+    ("Jaime State of development: …").
+    """
+
+    def __init__(self, names, aliases=None):
+        self._canonical = {}
+        for name in names:
+            self._canonical.setdefault(normalize_name(name), " ".join(name.split()))
+        for variant, name in (aliases or {}).items():
+            self._canonical[normalize_name(variant)] = self.canonical(name)
+
+        # Trie
+        self._goto = [{}]
+        self._out = [[]]                # state → keys ending here (incl. via fail links)
+        for key in self._canonical:
+            state = 0
+            for ch in key:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(key)
+
+        # Failure links, breadth first
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self._canonical)
+
+    def canonical(self, name: str) -> str:
+        """Canonical spelling of ``name``; unknown names just get their spaces collapsed."""
+        return self._canonical.get(normalize_name(name), " ".join(name.split()))
+
+    def finditer(self, text: str) -> list[tuple[int, int, str]]:
+        """Non-overlapping ``(start, end, canonical name)`` hits, leftmost-longest first."""
+        norm, points, removed = _normalize_text(text)
+        goto, fail, out = self._goto, self._fail, self._out
+
+        candidates = []
+        state = 0
+        for i, ch in enumerate(norm):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for key in out[state]:
+                candidates.append((i + 1 - len(key), i + 1, key))
+
+        hits = []
+        last_end = -1
+        candidates.sort(key=lambda c: (c[0], c[0] - c[1]))
+        for start, end, key in candidates:
+            if start < last_end:
+                continue
+            o_start = _to_original(start, points, removed)
+            o_end = _to_original(end - 1, points, removed) + 1
+            if o_end < len(text):
+                nxt = text[o_end]
+                if not (nxt.isspace() or nxt == ":" or nxt.isupper()):
+                    continue
+            hits.append((o_start, o_end, self._canonical[key]))
+            last_end = end
+        return hits
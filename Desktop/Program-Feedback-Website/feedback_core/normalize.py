@@ -0,0 +1,59 @@
+"""Column-wise cleanup of the raw Airtable frame."""
+import pandas as pd
+
+from .schema import NUMERIC_COLUMNS
+
+# Columns pandas can already tell hold no dicts, so they are skipped without a per-cell scan
+_PLAIN_KINDS = {"string", "floating", "integer", "mixed-integer-float", "boolean", "empty"}
+
+
+def normalize_list(value):
+    """Return a list no matter what Airtable gives back."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [value]
+    return [] if value is None or (isinstance(value, float) and pd.isna(value)) else [str(value)]
+
+
+def _is_special(val) -> bool:
+    return isinstance(val, dict) and "specialValue" in val
+
+
+def replace_special_values(df: pd.DataFrame, skip=()) -> pd.DataFrame:
+    """Replace Airtable's ``{'specialValue': 'NaN'}`` cells with NaN.
+
+    Only object columns are inspected, and each affected column is fixed with
+    one masked ``where`` instead of a Python call per cell. Lookups and
+    formulas mix lists or text with those dicts, so every object column
+    pandas cannot tell is plain gets the mask. Columns in ``skip``
+    are left alone (``cast_numeric`` already turns their dicts into NaN).
+    """
+    fixed = {}
+    for col in df.columns[df.dtypes == object]:
+        if col in skip:
+            continue
+        s = df[col]
+        if pd.api.types.infer_dtype(s, skipna=True) in _PLAIN_KINDS:
+            continue
+        special = s.map(_is_special).astype(bool)
+        if special.any():
+            fixed[col] = s.where(~special)
+    return df.assign(**fixed) if fixed else df
+
+
+def cast_numeric(df: pd.DataFrame, columns=NUMERIC_COLUMNS) -> pd.DataFrame:
+    """Cast the score and vote columns present in ``df`` to float64.
+
+    Anything that is not a number (special-value dicts included) becomes NaN.
+    """
+    present = [c for c in columns if c in df.columns]
+    if not present:
+        return df
+    return df.assign(**{c: pd.to_numeric(df[c], errors="coerce").astype("float64") for c in present})
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Full load-time cleanup of the frame built from ``table.all()``."""
+    df = cast_numeric(df)
+    return replace_special_values(df, skip=NUMERIC_COLUMNS)
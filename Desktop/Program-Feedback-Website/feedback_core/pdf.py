@@ -0,0 +1,249 @@
+"""reportlab drawing of a :class:`~feedback_core.report.StartupReport`.
+
+Kept apart from :mod:`feedback_core.report` so that importing the report
+data (the page builds one per startup) does not load reportlab; it is only
+imported when a PDF is actually rendered.
+"""
+import io
+import math
+import os
+import re
+from xml.sax.saxutils import escape
+
+import pandas as pd
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import (CondPageBreak, Image, KeepTogether, Paragraph, SimpleDocTemplate,
+                                Spacer, Table, TableStyle)
+
+from .records import _first
+from .report import StartupReport
+from .schema import INDIVIDUAL_COLUMNS, REWARD_COLUMNS, RISK_COLUMNS, TEAM_COLUMNS
+
+BAR_COLOR = colors.Color(29 / 255, 202 / 255, 237 / 255)      # charts.RISK_REWARD_COLOR
+HUMAN_COLOR = colors.Color(52 / 255, 199 / 255, 89 / 255)     # charts.HUMAN_COLOR
+COHORT_COLOR = colors.Color(0.75, 0.75, 0.75)
+FLAG_COLORS = {"green": "green", "yellow": "orange", "red": "red"}
+
+PAGE_WIDTH = A4[0] - 36 * mm    # between the margins
+
+
+def _number(value, fmt="{:.2f}", missing="N/A"):
+    return fmt.format(value) if isinstance(value, (int, float)) and not math.isnan(value) else missing
+
+
+# Standard PDF fonts only cover Latin-1/cp1252: drop emoji and other symbols
+def _text(value) -> str:
+    return str(value).encode("cp1252", "ignore").decode("cp1252").strip()
+
+
+def _markup(markdown: str) -> str:
+    """The little markdown the feedback uses (**bold**, line breaks) as reportlab markup."""
+    text = escape(_text(markdown))
+    text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text, flags=re.S)
+    return text.replace("\n", "<br/>")
+
+
+def _styles():
+    sheet = getSampleStyleSheet()
+    for name in ("Heading1", "Heading2", "Heading3"):
+        sheet[name].keepWithNext = 1
+    return {
+        "title": sheet["Title"],
+        "h1": sheet["Heading1"],
+        "h2": sheet["Heading2"],
+        "h3": sheet["Heading3"],
+        "body": sheet["BodyText"],
+        "small": ParagraphStyle("small", parent=sheet["BodyText"], fontSize=8, leading=10,
+                                textColor=colors.grey),
+    }
+
+
+def _bar_chart(labels, series, bar_colors, title=None) -> Drawing:
+    """Vertical bars on the 1–4 scale; ``series`` holds one list of scores per color.
+
+    Missing scores leave a gap.
+    """
+    tilted = len(labels) > 4
+    bottom = 30 * mm if tilted else 10 * mm
+    drawing = Drawing(PAGE_WIDTH, bottom + 45 * mm)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 12 * mm, bottom
+    chart.width, chart.height = PAGE_WIDTH - 20 * mm, 37 * mm
+    chart.data = [[s if isinstance(s, (int, float)) and not math.isnan(s) else None for s in scores]
+                  for scores in series]
+    chart.valueAxis.valueMin, chart.valueAxis.valueMax, chart.valueAxis.valueStep = 0, 4, 1
+    chart.categoryAxis.categoryNames = [_text(label) for label in labels]
+    chart.categoryAxis.labels.fontName = chart.valueAxis.labels.fontName = "Helvetica"
+    chart.categoryAxis.labels.fontSize = 7
+    chart.categoryAxis.labels.boxAnchor = "ne" if tilted else "n"
+    chart.categoryAxis.labels.angle = 45 if tilted else 0
+    chart.barLabelFormat = "%.2f"
+    chart.barLabels.fontName = "Helvetica"
+    chart.barLabels.fontSize = 6
+    chart.barLabels.nudge = 5
+    for i, color in enumerate(bar_colors):
+        chart.bars[i].fillColor = color
+        chart.bars[i].strokeColor = None
+    drawing.add(chart)
+    if title:
+        drawing.add(String(chart.x, drawing.height - 6, _text(title), fontName="Helvetica-Bold", fontSize=9))
+    return drawing
+
+
+def _table(rows, widths=None, header=True):
+    table = Table(rows, colWidths=widths, hAlign="LEFT", repeatRows=1 if header else 0)
+    style = [
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.lightgrey),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+    if header:
+        style += [("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                  ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke)]
+    table.setStyle(TableStyle(style))
+    return table
+
+
+def _position_table(report, labels_to_columns):
+    """Startup vs. cohort (same columns as the page's percentile expanders)."""
+    rows = [["Metric", "Startup", "Cohort mean", "Cohort median", "Percentile", "Rank", "z-score"]]
+    for label, col in labels_to_columns.items():
+        if col not in report.position.index:
+            continue
+        p = report.position.loc[col]
+        rows.append([
+            _text(label),
+            _number(report.scores.get(col)),
+            _number(p["mean"]),
+            _number(p["median"]),
+            _number(p["percentile"], "{:.0f}%", "—"),
+            f"{p['rank']:.0f} / {p['count']:.0f}" if pd.notna(p["rank"]) else "—",
+            _number(p["z"], "{:+.2f}", "—"),
+        ])
+    return _table(rows) if len(rows) > 1 else None
+
+
+def _score_section(report, labels_to_columns, color):
+    labels = list(labels_to_columns)
+    cols = list(labels_to_columns.values())
+    chart = _bar_chart(labels, [[report.scores.get(c) for c in cols],
+                                [report.cohort_means.get(c) for c in cols]], [color, COHORT_COLOR])
+    out = [chart]
+    table = _position_table(report, labels_to_columns)
+    if table is not None:
+        out += [Spacer(1, 2 * mm), table, Spacer(1, 4 * mm)]
+    return out
+
+
+def _story(report: StartupReport):
+    s = _styles()
+    story = []
+    if report.logo_path and os.path.exists(report.logo_path):
+        logo = Image(report.logo_path)
+        logo._restrictSize(60 * mm, 30 * mm)
+        logo.hAlign = "LEFT"
+        story.append(logo)
+    story += [
+        Paragraph(escape(_text(f"{report.startup_name} — Decelera {report.cohort_name} Program Feedback")), s["title"]),
+        Paragraph(f"Data as of {report.synced_at:%Y-%m-%d %H:%M} UTC. All scores run from 1 to 4, "
+                  "4 being the most favorable; grey bars are the program averages.", s["small"]),
+    ]
+
+    # === Business Metrics
+    story.append(Paragraph("Business Metrics", s["h1"]))
+    yes = _first(report.scores.get("Investable_Yes_Count")) or 0
+    no = _first(report.scores.get("Investable_No_Count")) or 0
+    total = yes + no
+    story.append(_table([
+        ["Yes votes", "No votes", "Yes ratio", "Average Risk", "Average Reward"],
+        [int(yes), int(no), f"{yes / total * 100:.1f}%" if total else "—",
+         _number(report.scores.get("Average RISK")), _number(report.scores.get("Average Reward"))],
+        ["", "", "Program", _number(report.cohort_means.get("Average RISK")),
+         _number(report.cohort_means.get("Average Reward"))],
+    ]))
+    story.append(Paragraph("Risk Breakdown", s["h2"]))
+    story += _score_section(report, RISK_COLUMNS, BAR_COLOR)
+    story.append(CondPageBreak(70 * mm))
+    story.append(Paragraph("Reward Breakdown", s["h2"]))
+    story += _score_section(report, REWARD_COLUMNS, BAR_COLOR)
+
+    # === EM's Feedback
+    story.append(Paragraph("EM's Feedback", s["h1"]))
+    if not report.mentors:
+        story.append(Paragraph("<i>No hay feedback para este startup.</i>", s["body"]))
+    for mentor in report.mentors:
+        story.append(Paragraph(escape(_text(mentor.name)), s["h3"]))
+        for color, formatted in mentor.flags.items():
+            flag = Paragraph(f'<font color="{FLAG_COLORS.get(color, "grey")}"><b>{color.capitalize()} Flag</b></font>',
+                             s["body"])
+            story.append(KeepTogether([flag, Paragraph(_markup(formatted[0]), s["body"])]))
+            story += [Paragraph(_markup(comment), s["body"]) for comment in formatted[1:]]
+
+    # === Individual Human Metrics
+    story.append(Paragraph("Individual Human Metrics", s["h1"]))
+    view = report.view
+    for title, counts in [("Unconventional Thinking", view.unconventional_thinking),
+                          ("Confidence", view.confidence), ("Ambition", view.ambition)]:
+        if counts:
+            story.append(Paragraph(title, s["h3"]))
+            story.append(_table([["Founder", "Bonus Star", "Red Flag"]] + [
+                [_text(name), counts[name]["Bonus Star"], counts[name]["Red Flag"]] for name in sorted(counts)
+            ]))
+    story += _score_section(report, {c.split(" |")[0]: c for c in INDIVIDUAL_COLUMNS}, HUMAN_COLOR)
+    for founder in sorted(view.human_means):
+        means = view.human_means[founder]
+        if not means.empty:
+            story.append(_bar_chart(means["Campo"], [means["Media"].tolist()], [HUMAN_COLOR], title=founder))
+
+    # === Team Human Metrics
+    story.append(CondPageBreak(90 * mm))
+    story.append(Paragraph("Team Human Metrics", s["h1"]))
+    story += _score_section(report, {c.split(" |")[0]: c for c in TEAM_COLUMNS}, HUMAN_COLOR)
+
+    # === Human Call Results
+    d = report.details
+    story.append(CondPageBreak(60 * mm))
+    story.append(Paragraph("Human Call Results", s["h1"]))
+    story.append(_table([
+        ["Average HDD Score (out of 4)", "Exceptional Founders", "Evaluator"],
+        [_number(d.get("HDD_Calls_Average")), "Yes" if d.get("HDD_Calls_Exceptional") == 1 else "No",
+         _text(d.get("HDD_Calls_Evaluator") or "Unknown")],
+    ], widths=[55 * mm, 40 * mm, PAGE_WIDTH - 95 * mm]))
+    story.append(Paragraph("<b>Notes from the call:</b>", s["body"]))
+    story.append(Paragraph(_markup(d.get("HDD_Calls_Notes") or "No notes provided."), s["body"]))
+
+    story.append(Paragraph("Scientific Analysis Results", s["h2"]))
+    for title, key in [("BRS – Brief Resilience Scale", "BRS_Calculation"), ("GRIT Scale", "GRIT_Calculation")]:
+        story.append(Paragraph(f"<b>{escape(_text(title))}:</b> "
+                               f"{_markup(d.get(key) or 'No interpretation provided.')}", s["body"]))
+    story.append(Paragraph(
+        "<b>OLBI – Oldenburg Burnout Inventory:</b> "
+        f"Exhaustion: {_markup(d.get('OLBI_Exhaustion_Descriptor') or 'No result')}; "
+        f"Disengagement: {_markup(d.get('OLBI_Disengagement_Descriptor') or 'No result')}", s["body"]))
+    return story
+
+
+def render_pdf(report: StartupReport) -> bytes:
+    """The PDF of one startup."""
+    out = io.BytesIO()
+    doc = SimpleDocTemplate(
+        out, pagesize=A4, leftMargin=18 * mm, rightMargin=18 * mm, topMargin=15 * mm, bottomMargin=15 * mm,
+        title=_text(f"{report.startup_name} – Decelera {report.cohort_name} Program Feedback"),
+        author="Decelera",
+    )
+
+    def footer(canvas, doc):
+        canvas.saveState()
+        canvas.setFont("Helvetica", 7)
+        canvas.setFillColor(colors.grey)
+        canvas.drawString(18 * mm, 8 * mm, _text(f"{report.startup_name} · Decelera {report.cohort_name}"))
+        canvas.drawRightString(A4[0] - 18 * mm, 8 * mm, f"Page {doc.page}")
+        canvas.restoreState()
+
+    doc.build(_story(report), onFirstPage=footer, onLaterPages=footer)
+    return out.getvalue()
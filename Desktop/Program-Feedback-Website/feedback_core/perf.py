@@ -0,0 +1,203 @@
+"""Lightweight timings and counters for the pipeline stages.
+
+Disabled by default: ``stage()`` then hands back a shared no-op context
+manager and ``count()`` returns at once, so the instrumentation left in
+the code costs a function call and a flag check.
+
+After :func:`enable`, every stage and counter is added to the current
+:class:`Trace` (one per page rerun or batch job, see :func:`trace`) and to
+the process-wide :data:`TOTALS`, which also collects the work of
+background threads (Airtable syncs). While disabled, a trace started with
+``start(name, session=True)`` still collects the stages run in its own
+context, and nothing else is recorded (one visitor's ``?perf=1``). Finished traces are logged as one
+JSON object on the ``feedback_core.perf`` logger; :func:`log_to` writes
+them to a JSON-lines file.
+
+    with perf.trace("rerun") as t:
+        with perf.stage("sync"):
+            ...
+        perf.count("airtable.requests")
+"""
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+_enabled = False
+_current = contextvars.ContextVar("perf_trace", default=None)
+
+
+class Trace:
+    """Stage durations and counters of one unit of work."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.seconds = None                 # total, set when the trace ends
+        self.stages = {}                    # stage → [calls, total seconds]
+        self.counters = Counter()
+        self._lock = threading.Lock()       # fetch threads add to the same trace
+        self._start = time.perf_counter()
+        self._token = None                  # contextvar token while current
+
+    def add(self, stage, seconds):
+        with self._lock:
+            entry = self.stages.setdefault(stage, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "trace": self.name,
+                "started_at": self.started_at.isoformat(timespec="milliseconds"),
+                "seconds": None if self.seconds is None else round(self.seconds, 6),
+                "stages": {k: {"calls": c, "seconds": round(s, 6)} for k, (c, s) in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+
+# Everything recorded since start-up (or the last reset), from any thread
+TOTALS = Trace("process")
+
+
+def enable(flag=True):
+    global _enabled
+    _enabled = bool(flag)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def current() -> Trace | None:
+    return _current.get()
+
+
+def _active() -> bool:
+    return _enabled or _current.get() is not None
+
+
+def _record(stage, seconds):
+    if _enabled:
+        TOTALS.add(stage, seconds)
+    t = _current.get()
+    if t is not None:
+        t.add(stage, seconds)
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+_NOOP = contextlib.nullcontext()
+
+
+def stage(name):
+    """Context manager timing ``name``; a no-op while disabled (and no trace is current)."""
+    return _Stage(name) if _active() else _NOOP
+
+
+def timed(name):
+    """Decorator timing every call of the function as stage ``name``."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _active():
+                return fn(*args, **kwargs)
+            with _Stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def mark(name):
+    """Record the time since the current trace started as stage ``name``,
+    e.g. when the first element of the page was sent."""
+    t = _current.get()
+    if t is not None:
+        _record(name, time.perf_counter() - t._start)
+
+
+def count(name, n=1):
+    """Add ``n`` to counter ``name`` (requests, bytes, records …)."""
+    if _enabled:
+        TOTALS.count(name, n)
+    t = _current.get()
+    if t is not None:
+        t.count(name, n)
+
+
+def start(name, session=False) -> Trace | None:
+    """Make a new :class:`Trace` the current one, for code that cannot use
+    :func:`trace` (a Streamlit script); ``None`` while disabled, unless
+    ``session`` (then only this trace is recorded, not :data:`TOTALS`)."""
+    if not (_enabled or session):
+        return None
+    t = Trace(name)
+    t._token = _current.set(t)
+    return t
+
+
+def finish(t: Trace | None):
+    """End ``t`` (from :func:`start`) and log it."""
+    if t is None or t.seconds is not None:
+        return
+    t.seconds = time.perf_counter() - t._start
+    try:
+        _current.reset(t._token)
+    except ValueError:  # finished from another context
+        _current.set(None)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(t.as_dict()))
+
+
+@contextlib.contextmanager
+def trace(name):
+    """Collect the stages run inside the block (and in threads started with
+    ``contextvars.copy_context()``) into a new :class:`Trace`, logged at the end.
+
+    Yields ``None`` while disabled.
+    """
+    t = start(name)
+    try:
+        yield t
+    finally:
+        finish(t)
+
+
+def reset():
+    global TOTALS
+    TOTALS = Trace("process")
+
+
+def log_to(path):
+    """Append every finished trace to ``path`` as JSON lines."""
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return handler
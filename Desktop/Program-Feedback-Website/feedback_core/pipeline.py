@@ -0,0 +1,111 @@
+"""The loading pipeline behind the page and the batch job.
+
+Settings → Airtable fetcher → one :class:`SnapshotStore` per cohort, and the
+data derived from each snapshot (founder facts, startup views, cohort
+stats, program totals), computed once per snapshot version with
+``snapshot.derived``. Nothing here imports Streamlit: the page only wraps
+these in ``st.cache_resource`` and renders the results.
+"""
+from .cohort_stats import CohortStats, compute_cohort_stats
+from .cohorts import CohortNames, CohortRegistry
+from .config import Settings
+from .details import DetailLoader
+from .fetch import AirtableFetcher
+from .fields import DETAIL_FIELDS, SNAPSHOT_SECTIONS, fields_for
+from .founders import build_fact_table
+from .frame import build_frame
+from .images import ImageCache
+from .index import SnapshotIndex, build_index
+from .records import StartupRecord, build_records
+from .search import SearchIndex, build_search_index
+from .snapshot import Snapshot, SnapshotStore
+from .view_model import StartupView, build_views
+
+
+def make_fetcher(settings: Settings) -> AirtableFetcher | None:
+    """One HTTP session and one rate limiter per base; ``None`` offline."""
+    return None if settings.offline else AirtableFetcher(settings.api_key, max_workers=settings.fetch_workers)
+
+
+def make_store(settings: Settings, fetcher, config, cohort) -> SnapshotStore:
+    """Snapshot store of ``cohort`` (``config`` is its :class:`CohortConfig`)."""
+    table = None if fetcher is None else fetcher.table(config.base_id, config.table_id)
+    modified_field = settings.cohort_modified_field(config)
+    return SnapshotStore(
+        table,
+        lambda records, partial: build_frame(records, cohort.names, partial),
+        ttl=settings.cache_ttl,
+        mode=settings.sync_mode,
+        deletion_check_interval=settings.deletion_check_interval,
+        full_sync_interval=settings.full_sync_interval,
+        path=config.snapshot_path,
+        modified_field=modified_field,
+        fields=fields_for(SNAPSHOT_SECTIONS, [modified_field]) if settings.lazy_fields else None,
+    )
+
+
+def open_cohorts(settings: Settings, fetcher=None) -> CohortRegistry:
+    """Every configured cohort; each one is only loaded when first used."""
+    return CohortRegistry(settings.cohorts,
+                          lambda config, cohort: make_store(settings, fetcher, config, cohort),
+                          api=fetcher)
+
+
+def make_detail_loader(settings: Settings, store: SnapshotStore) -> DetailLoader:
+    """Loader of the long texts the snapshot leaves out (none without lazy fields)."""
+    return DetailLoader(store.table if settings.lazy_fields else None, DETAIL_FIELDS)
+
+
+def make_image_cache(settings: Settings) -> ImageCache:
+    """Logo cache; offline it only serves the copies already on disk."""
+    return ImageCache(settings.image_cache_dir, max_bytes=settings.image_cache_mb * 1024 * 1024,
+                      offline=settings.offline)
+
+
+# === Per snapshot ===
+
+def founder_facts(snapshot: Snapshot):
+    """Founder metric facts (one row per Founder & Score tag) and the malformed tags."""
+    return snapshot.derived("founder_facts", build_fact_table)
+
+
+def startup_views(snapshot: Snapshot) -> dict[str, StartupView]:
+    facts, tag_errors = founder_facts(snapshot)
+    return snapshot.derived("views", lambda df: build_views(df, facts, tag_errors))
+
+
+def cohort_stats(snapshot: Snapshot) -> CohortStats:
+    """Mean/median/std/percentiles of every score column and each startup's position."""
+    return snapshot.derived("cohort_stats", compute_cohort_stats)
+
+
+def program_summary(snapshot: Snapshot) -> dict:
+    """Headline numbers of a program."""
+    df = snapshot.df
+    stats = cohort_stats(snapshot)
+    return {
+        "Startups": df["Id"].nunique(),
+        "Reviews": int(df["Number of Reviews"].fillna(0).sum()) if "Number of Reviews" in df else 0,
+        "Average Risk": stats.mean("Average RISK"),
+        "Average Reward": stats.mean("Average Reward"),
+    }
+
+
+def snapshot_index(snapshot: Snapshot, names: CohortNames) -> SnapshotIndex:
+    """Id → row position, the sorted startup options and their labels, for ``names``."""
+    # The index holds on to ``names``, so its id is not reused while the entry is cached
+    return snapshot.derived(("index", id(names)), lambda df: build_index(df, names))
+
+
+def search_index(snapshot: Snapshot, details: DetailLoader) -> SearchIndex:
+    """Full-text index of every startup's flag comments and call notes.
+
+    Built on first use; with lazy fields the texts of all records are read
+    in one paged listing (see :meth:`DetailLoader.load_frame`).
+    """
+    return snapshot.derived("search", lambda df: build_search_index(details.load_frame(df)))
+
+
+def startup_records(snapshot: Snapshot) -> dict[str, StartupRecord]:
+    """``Id`` → typed record of the startup."""
+    return snapshot.derived("records", build_records)
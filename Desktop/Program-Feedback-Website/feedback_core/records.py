@@ -0,0 +1,157 @@
+"""Typed per-startup records, built once per snapshot.
+
+The snapshot frame is wide and holds object cells: lookups come as
+one-element lists and empty cells as NaN. :func:`build_records` turns the
+row of each startup into a :class:`StartupRecord` with plain Python values,
+keyed by ``Id``, so a page rerun reads attributes instead of scanning the
+frame and calling ``row.get`` with the long column names.
+:class:`StartupDetails` does the same for the long texts fetched per
+startup.
+
+:func:`check_schema` runs on the raw records of every full sync: a numeric field
+holding text, or records without ``Id``, mean a field was changed in
+Airtable, and the sync fails with :class:`SchemaError` instead of the page
+silently showing NaN.
+"""
+import logging
+import math
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .cohort_stats import STAT_COLUMNS
+from .schema import NUMERIC_COLUMNS, RECORD_VERSION_COLUMN, VOTE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaError(ValueError):
+    """Airtable records that no longer match the fields the dashboard reads."""
+
+
+# Cells a numeric field may hold: numbers, or the dicts Airtable sends for formula errors
+_NUMBER_TYPES = (int, float, bool, dict)
+_NUMBER_KINDS = {"floating", "integer", "mixed-integer-float", "boolean", "empty"}
+
+
+def _is_numeric_text(value) -> bool:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def check_schema(df: pd.DataFrame):
+    """Raise :class:`SchemaError` when ``df`` (raw ``table.all()`` fields) drifted.
+
+    Fields missing from every record are only logged: Airtable leaves empty
+    cells out, so a new program has no score fields yet.
+    """
+    if df.empty:
+        return
+    if "Id" not in df:
+        raise SchemaError("No record has an 'Id' field: was it renamed in Airtable?")
+    problems = []
+    for col in NUMERIC_COLUMNS:
+        # pandas 3 gives an all-text column the str dtype, not object
+        if col not in df or pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        s = df[col].dropna()
+        if pd.api.types.infer_dtype(s, skipna=True) in _NUMBER_KINDS:
+            continue
+        other = s[~s.map(type).isin(_NUMBER_TYPES)]
+        bad = other[~other.map(_is_numeric_text).astype(bool)]
+        if len(bad):
+            problems.append(f"{col!r} should hold numbers, got {bad.iloc[0]!r} in record {bad.index[0]} "
+                            f"and {len(bad) - 1} more")
+    if problems:
+        raise SchemaError("Airtable fields changed type: " + "; ".join(problems))
+    missing = [c for c in NUMERIC_COLUMNS if c not in df]
+    if missing:
+        logger.warning("No record has the fields %s", ", ".join(missing))
+
+
+def _float(value) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+def _count(value) -> int:
+    return int(value) if isinstance(value, (int, float)) and not math.isnan(value) else 0
+
+
+def _first(value):
+    """Lookups come as lists: their first item; empty cells: ``None``."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return None if value is None or (isinstance(value, float) and math.isnan(value)) else value
+
+
+@dataclass(frozen=True, slots=True)
+class StartupRecord:
+    """The snapshot fields of one startup, with NaN for missing scores."""
+    record_id: str
+    startup_id: str
+    version: str | None
+    average_risk: float
+    average_reward: float
+    yes_votes: int
+    no_votes: int
+    reviews: int
+    scores: dict[str, float]    # every STAT_COLUMNS column → value
+
+
+def _column(df, name):
+    return df[name].tolist() if name in df else [math.nan] * len(df)
+
+
+def build_records(df: pd.DataFrame) -> dict[str, StartupRecord]:
+    """``Id`` → record of its first row in the snapshot frame."""
+    first = df.drop_duplicates("Id")
+    scores = {c: [_float(v) for v in _column(first, c)] for c in STAT_COLUMNS}
+    versions = _column(first, RECORD_VERSION_COLUMN)
+    yes, no, reviews = (_column(first, c) for c in VOTE_COLUMNS)
+    records = {}
+    for i, (record_id, startup_id) in enumerate(zip(first.index, first["Id"].tolist())):
+        records[startup_id] = StartupRecord(
+            record_id=record_id,
+            startup_id=startup_id,
+            version=versions[i] if isinstance(versions[i], str) else None,
+            average_risk=scores["Average RISK"][i],
+            average_reward=scores["Average Reward"][i],
+            yes_votes=_count(yes[i]),
+            no_votes=_count(no[i]),
+            reviews=_count(reviews[i]),
+            scores={c: values[i] for c, values in scores.items()},
+        )
+    return records
+
+
+@dataclass(frozen=True, slots=True)
+class StartupDetails:
+    """Human calls and scientific results of one startup (see ``DetailLoader``)."""
+    hdd_average: float | None
+    hdd_exceptional: bool
+    hdd_evaluator: str
+    hdd_notes: str
+    brs: str
+    grit: str
+    olbi_exhaustion: str
+    olbi_disengagement: str
+    logo: dict | None           # first attachment of "original logo"
+
+    @classmethod
+    def from_row(cls, row: pd.Series) -> "StartupDetails":
+        average = _first(row.get("HDD_Calls_Average"))
+        logo = _first(row.get("original logo"))
+        return cls(
+            hdd_average=float(average) if isinstance(average, (int, float)) else None,
+            hdd_exceptional=_first(row.get("HDD_Calls_Exceptional")) == 1,
+            hdd_evaluator=_first(row.get("HDD_Calls_Evaluator")) or "Unknown",
+            hdd_notes=_first(row.get("HDD_Calls_Notes")) or "No notes provided.",
+            brs=_first(row.get("BRS_Calculation")) or "No interpretation provided.",
+            grit=_first(row.get("GRIT_Calculation")) or "No interpretation provided.",
+            olbi_exhaustion=_first(row.get("OLBI_Exhaustion_Descriptor")) or "No result",
+            olbi_disengagement=_first(row.get("OLBI_Disengagement_Descriptor")) or "No result",
+            logo=logo if isinstance(logo, dict) and "url" in logo else None,
+        )
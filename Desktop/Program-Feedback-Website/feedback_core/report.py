@@ -0,0 +1,144 @@
+"""Per-startup PDF reports, rendered on the server with reportlab.
+
+The PDF is built from the same view model the page renders (scores, cohort
+position, mentor feedback, founder metrics, human calls): text stays text
+and the charts are reportlab vector drawings (see :mod:`feedback_core.pdf`),
+so reports are small, searchable and need no browser or network.
+:func:`write_reports` renders a whole cohort with a process pool (see
+``python -m feedback_core.batch``).
+"""
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+
+from . import perf
+from .cohort_stats import CohortStats
+from .fields import fields_for
+from .records import _first
+from .schema import VOTE_COLUMNS
+from .view_model import MentorFeedback, StartupView, build_mentor_feedback
+
+MIME = "application/pdf"
+
+# Fields the report reads besides the score columns
+REPORT_FIELDS = fields_for(["human_calls", "scientific"])
+
+
+@dataclass
+class StartupReport:
+    """Everything one report shows, as plain picklable data for the worker processes."""
+    startup_id: str
+    startup_name: str
+    cohort_name: str
+    synced_at: datetime
+    scores: dict[str, float]            # score and vote column → startup's value
+    cohort_means: dict[str, float]      # score column → cohort mean
+    position: pd.DataFrame              # CohortStats.for_startup over every score column
+    view: StartupView
+    mentors: list[MentorFeedback]
+    details: dict = field(default_factory=dict)
+    logo_path: str | None = None
+
+    @property
+    def file_name(self) -> str:
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", self.startup_name).strip("-").lower() or self.startup_id
+        return f"{self.startup_id}-{slug}.pdf"
+
+
+def make_report(row: pd.Series, view: StartupView, stats: CohortStats, startup_name, cohort_name,
+                synced_at, logo_path=None) -> StartupReport:
+    """Report of the startup in ``row``, which must hold the detail fields (see ``DetailLoader``)."""
+    columns = list(stats.summary.index)
+    return StartupReport(
+        startup_id=view.startup_id,
+        startup_name=startup_name,
+        cohort_name=cohort_name,
+        synced_at=synced_at,
+        scores={c: row.get(c) for c in [*columns, *VOTE_COLUMNS]},
+        cohort_means={c: stats.mean(c) for c in columns},
+        position=stats.for_startup(view.startup_id, columns),
+        view=view,
+        mentors=build_mentor_feedback(row),
+        details={f: _first(row.get(f)) for f in REPORT_FIELDS},
+        logo_path=logo_path,
+    )
+
+
+@perf.timed("report.pdf")
+def build_report(report: StartupReport) -> bytes:
+    """The PDF of one startup."""
+    from .pdf import render_pdf  # reportlab is only imported when a PDF is rendered
+    return render_pdf(report)
+
+
+def default_workers() -> int:
+    """CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS, Windows
+        return os.cpu_count() or 1
+
+
+def _render(report: StartupReport):
+    start = time.process_time()
+    pdf = build_report(report)
+    return pdf, time.process_time() - start
+
+
+def render_reports(reports, max_workers=None):
+    """Yield ``(report, pdf bytes, seconds)`` as each report is rendered.
+
+    Reports are rendered by ``max_workers`` processes (default: one per CPU),
+    so they come back in completion order; ``max_workers=1`` renders them in
+    this process, in order. ``seconds`` is the CPU time the worker spent on
+    the report, which does not grow when workers outnumber the cores.
+    """
+    reports = list(reports)
+    max_workers = min(max_workers or default_workers(), len(reports) or 1)
+    if max_workers == 1:
+        for report in reports:
+            yield (report, *_render(report))
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_render, r): r for r in reports}
+        for future in as_completed(futures):
+            yield (futures[future], *future.result())
+
+
+def write_reports(reports, target, max_workers=None, on_done=None) -> dict[str, str]:
+    """Render ``reports`` into the directory ``target``, or into a ZIP when it ends in ``.zip``.
+
+    Files are written as soon as each report is ready, and ``on_done(report,
+    seconds)`` is called after each one. Returns startup Id → file path (or
+    name inside the ZIP). Files only appear under their final name once
+    complete.
+    """
+    written = {}
+    if target.lower().endswith(".zip"):
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        tmp = f"{target}.tmp"
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zf:
+            for report, pdf, seconds in render_reports(reports, max_workers):
+                zf.writestr(report.file_name, pdf)
+                written[report.startup_id] = report.file_name
+                if on_done:
+                    on_done(report, seconds)
+        os.replace(tmp, target)
+        return written
+
+    os.makedirs(target, exist_ok=True)
+    for report, pdf, seconds in render_reports(reports, max_workers):
+        path = os.path.join(target, report.file_name)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(pdf)
+        os.replace(f"{path}.tmp", path)
+        written[report.startup_id] = path
+        if on_done:
+            on_done(report, seconds)
+    return written
@@ -0,0 +1,54 @@
+"""Names of the Airtable fields the dashboard reads."""
+
+# === Risk / Reward breakdown (label → column) ===
+RISK_COLUMNS = {
+    "State of Development": "Average RISK | State of development_Score",
+    "Momentum": "Average RISK | Momentum_Score",
+    "Management": "Average RISK | Management_Score",
+}
+
+REWARD_COLUMNS = {
+    "Market": "Average Reward | Market_Score",
+    "Team": "Average Reward | Team_Score",
+    "Pain": "Average Reward | Pain_Score",
+    "Scalability": "Average Reward | Scalability_Score",
+}
+
+# === Human metrics ===
+INDIVIDUAL_COLUMNS = [
+    "Purpose | Average",
+    "Openness | Average",
+    "Integrity and honesty | Average",
+    "Relevant experience | Average",
+    "Visionary leadership | Average",
+    "Flexibility | Average",
+    "Emotional intelligence | Average",
+]
+
+TEAM_COLUMNS = [
+    "Conflict resolution | Average",
+    "Clear vision alignment | Average",
+    "Clear roles | Average",
+    "Complementary hard skills | Average",
+    "Execution and speed | Average",
+    "Team ambition | Average",
+    "Confidence and mutual respect | Average",
+    "Product and Customer Focus | Average",
+]
+
+# === Vote counts ===
+VOTE_COLUMNS = ["Investable_Yes_Count", "Investable_No_Count", "Number of Reviews"]
+
+# Everything cast to float64 once at load time
+NUMERIC_COLUMNS = [
+    "Average RISK",
+    "Average Reward",
+    *RISK_COLUMNS.values(),
+    *REWARD_COLUMNS.values(),
+    *INDIVIDUAL_COLUMNS,
+    *TEAM_COLUMNS,
+    *VOTE_COLUMNS,
+]
+
+# Added by SnapshotStore: when the record last changed (see SnapshotStore.modified_field)
+RECORD_VERSION_COLUMN = "_record_version"
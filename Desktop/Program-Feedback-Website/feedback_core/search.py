@@ -0,0 +1,148 @@
+"""Full-text search over the mentor feedback and the human call notes.
+
+:func:`build_search_index` splits every flag comment (the ``*_exp``
+rollups, see :mod:`feedback_core.flags`) into one entry per mentor, color
+and category section, adds the HDD call notes, and indexes the words of
+each entry, its mentor and its category (case and accents ignored): word →
+set of entries. A query intersects the sets of its words and of the chosen
+filters, so its cost follows the number of hits rather than the amount of
+text, and no comment is scanned with a regex at query time.
+
+    index = build_search_index(df)      # df must hold the detail fields
+    index.search("regulation", colors=["red"], categories=["Team"])
+"""
+import bisect
+import functools
+import re
+import unicodedata
+from dataclasses import dataclass
+
+import pandas as pd
+
+from . import perf
+from .flags import _CAT_RE, CATS, _clean_html, collect_flag_records
+from .records import _first
+
+SOURCE_FLAG, SOURCE_CALL = "flag", "call"
+
+_WORD_RE = re.compile(r"\w+")
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+_CATEGORY = {c.lower(): c for c in CATS}
+# Shorter query words only match whole words, a prefix that short matches half the vocabulary
+_MIN_PREFIX = 3
+
+
+@functools.lru_cache(maxsize=65536)
+def _fold(word: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", word)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def words(text) -> list[str]:
+    """Words of ``text`` in lower case and without accents, the form they are indexed in."""
+    return [w if w.isascii() else _fold(w) for w in _WORD_RE.findall(str(text).casefold())]
+
+
+@dataclass(frozen=True, slots=True)
+class FeedbackEntry:
+    startup_id: str
+    mentor: str
+    source: str                 # SOURCE_FLAG (mentor comment) or SOURCE_CALL (HDD call notes)
+    color: str | None           # flag color
+    category: str | None        # one of CATS; None outside a "Team:"-style section
+    text: str
+
+
+def _sections(comment):
+    """(category, text) parts of a flag comment, split at its category labels."""
+    text = _clean_html(comment)
+    matches = list(_CAT_RE.finditer(text))
+    if not matches:
+        yield None, text.strip()
+        return
+    if matches[0].start() > 0:
+        yield None, text[:matches[0].start()].strip()
+    for idx, match in enumerate(matches):
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+        yield _CATEGORY[match.group(1).lower()], text[match.end():end].strip()
+
+
+class SearchIndex:
+    """Inverted index over :class:`FeedbackEntry` items; see :meth:`search`."""
+
+    FACETS = ("startup_id", "mentor", "color", "category", "source")
+
+    def __init__(self, entries: list[FeedbackEntry]):
+        self.entries = entries
+        self._postings = {}                             # word → entry positions
+        self._facets = {f: {} for f in self.FACETS}     # facet → value → entry positions
+        for i, entry in enumerate(entries):
+            for word in {*words(entry.text), *words(entry.mentor), *words(entry.category or "")}:
+                self._postings.setdefault(word, set()).add(i)
+            for facet, values in self._facets.items():
+                value = getattr(entry, facet)
+                if value is not None:
+                    values.setdefault(value, set()).add(i)
+        self._vocabulary = sorted(self._postings)
+
+    @property
+    def mentors(self) -> list[str]:
+        return sorted(self._facets["mentor"])
+
+    def _matching(self, word) -> set[int]:
+        """Entries with a word starting with ``word`` (or equal to it, when short)."""
+        if len(word) < _MIN_PREFIX:
+            return self._postings.get(word, set())
+        out = set()
+        for w in self._vocabulary[bisect.bisect_left(self._vocabulary, word):]:
+            if not w.startswith(word):
+                break
+            out |= self._postings[w]
+        return out
+
+    @perf.timed("search.query")
+    def search(self, query="", startups=(), mentors=(), colors=(), categories=(),
+               sources=()) -> list[FeedbackEntry]:
+        """Entries holding every word of ``query`` and matching every filter given.
+
+        Words match as prefixes ("regul" finds "regulation", "regulatory");
+        text in double quotes must appear as a phrase. Each filter is a
+        collection of accepted values. Without a query or filters nothing is
+        returned.
+        """
+        phrases = [" ".join(words(p)) for p in _PHRASE_RE.findall(query)]
+        terms = dict.fromkeys([*words(_PHRASE_RE.sub(" ", query)), *(w for p in phrases for w in p.split())])
+        sets = [self._matching(t) for t in terms]
+        for facet, accepted in zip(self.FACETS, (startups, mentors, colors, categories, sources)):
+            if accepted:
+                values = self._facets[facet]
+                sets.append(set().union(*(values.get(v, ()) for v in accepted)))
+        if not sets:
+            return []
+        sets.sort(key=len)
+        hits = set(sets[0])
+        for s in sets[1:]:
+            if not hits:
+                break
+            hits &= s
+        found = [self.entries[i] for i in sorted(hits)]
+        if phrases:
+            found = [e for e in found if all(p in " ".join(words(e.text)) for p in phrases)]
+        return found
+
+
+@perf.timed("search.build")
+def build_search_index(df: pd.DataFrame) -> SearchIndex:
+    """Index of the flag comments and call notes of the first row of every Id in ``df``."""
+    entries = []
+    for _, row in df.drop_duplicates("Id").iterrows():
+        startup_id = row["Id"]
+        for mentor, color, comment in collect_flag_records(row):
+            for category, text in _sections(comment):
+                if text:
+                    entries.append(FeedbackEntry(startup_id, mentor, SOURCE_FLAG, color, category, text))
+        notes = _first(row.get("HDD_Calls_Notes"))
+        if isinstance(notes, str) and notes.strip():
+            evaluator = _first(row.get("HDD_Calls_Evaluator")) or "Unknown"
+            entries.append(FeedbackEntry(startup_id, str(evaluator), SOURCE_CALL, None, None, notes.strip()))
+    return SearchIndex(entries)
@@ -0,0 +1,265 @@
+"""Shared copy of the Airtable feedback table, kept fresh with incremental syncs."""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from . import perf
+from .schema import RECORD_VERSION_COLUMN
+from .storage import load_frame, save_frame
+
+logger = logging.getLogger(__name__)
+
+# Re-read a few seconds before the previous sync started, so edits saved
+# while that sync was in flight are never missed (merging is idempotent).
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def modified_since(when: datetime) -> str:
+    """filterByFormula selecting records edited after ``when``."""
+    stamp = when.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{stamp}'))"
+
+
+@dataclass
+class Snapshot:
+    """One version of the table.
+
+    ``df`` is indexed by Airtable record id and shared between sessions, so it
+    must never be modified in place. ``version`` only changes when the data
+    does; ``synced_at`` is bumped on every successful sync.
+    """
+    df: pd.DataFrame
+    version: int
+    synced_at: datetime
+    _derived: dict = field(default_factory=dict, repr=False, compare=False)
+    _derived_lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    def derived(self, key, build):
+        """``build(df)``, computed once for this snapshot and shared by all callers."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = build(self.df)
+            return self._derived[key]
+
+
+class SnapshotStore:
+    """Keeps one local copy of an Airtable table and syncs it on demand.
+
+    ``table`` is anything with a pyairtable-style ``all(**options)`` method, or
+    ``None`` to serve the file at ``path`` only (offline mode), and
+    ``build_frame(records, partial)`` turns a list of raw records into the
+    normalized frame (``partial`` for the changed records of an incremental
+    sync, merged into the previous frame).
+
+    In ``"incremental"`` mode only records whose LAST_MODIFIED_TIME() is newer
+    than the previous sync are downloaded and merged into the frame; every
+    ``deletion_check_interval`` seconds the record ids are listed to drop rows
+    deleted in Airtable. ``"full"`` mode re-downloads the whole table each time.
+    LAST_MODIFIED_TIME() ignores computed fields (rollups, lookups, formulas:
+    the scores, votes and mentor feedback), so a forced sync is always a full
+    one, and so is the first sync after ``full_sync_interval`` seconds
+    without one.
+
+    Every row gets a ``RECORD_VERSION_COLUMN`` used to memoize per-record
+    parsing: the value of ``modified_field`` (an Airtable "Last modified
+    time" field) when configured, otherwise the time of the sync that
+    downloaded the record. ``modified_field`` misses computed fields too, so
+    its value is suffixed with the start of the last periodic (or forced)
+    full sync: cached parsing is never older than ``full_sync_interval``.
+
+    ``fields`` limits the download to those Airtable fields (``None``: all).
+
+    When ``path`` is set every new version is written there as Parquet and the
+    file is loaded on start-up, so a cold start is a local read. Syncs of a
+    stale snapshot run on a background thread while callers keep getting the
+    previous version.
+    """
+
+    def __init__(self, table, build_frame, ttl=300, mode="incremental",
+                 deletion_check_interval=600, id_field="Id", path=None,
+                 modified_field=None, fields=None, full_sync_interval=1800):
+        if mode not in ("incremental", "full"):
+            raise ValueError(f"Unknown sync mode: {mode!r}")
+        self.table = table
+        self.build_frame = build_frame
+        self.ttl = ttl
+        self.mode = mode
+        self.deletion_check_interval = deletion_check_interval
+        self.id_field = id_field
+        self.path = path
+        self.modified_field = modified_field
+        self.fields = fields
+        self.full_sync_interval = full_sync_interval
+        self.last_error = None          # exception raised by the last background sync
+
+        self._sync_lock = threading.Lock()      # held for the whole sync
+        self._worker_lock = threading.Lock()    # guards starting the background thread
+        self._worker = None
+        self._snapshot = None
+        self._watermark = None          # UTC start time of the last sync
+        self._last_sync = None          # time.monotonic() of the last sync
+        self._last_deletion_check = None
+        self._last_full_sync = None     # time.monotonic() of the last periodic or forced full sync
+        self._generation = None         # its UTC start time, part of every record version
+
+        if path and os.path.exists(path):
+            df, watermark = load_frame(path)
+            synced_at = watermark or datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+            self._snapshot = Snapshot(df=df, version=1, synced_at=synced_at)
+            self._watermark = watermark
+        elif table is None:
+            raise FileNotFoundError(f"Offline mode needs a snapshot file, none at {path!r}")
+
+    @property
+    def offline(self) -> bool:
+        return self.table is None
+
+    @property
+    def syncing(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def ready(self) -> bool:
+        """Whether :meth:`get` can return without waiting for Airtable."""
+        return self._snapshot is not None
+
+    def prefetch(self):
+        """Start the first sync on the background thread when there is no
+        snapshot yet, so the caller can render something meanwhile; the
+        next :meth:`get` waits for it."""
+        if not self.offline and self._snapshot is None:
+            self._sync_in_background()
+
+    def get(self, force=False) -> Snapshot:
+        """Return the current snapshot.
+
+        The very first call (no file on disk) and ``force=True`` sync before
+        returning; a snapshot older than the TTL is returned as is while a
+        background sync fetches the changes.
+        """
+        if self.offline:
+            return self._snapshot
+        if force:
+            return self.refresh()
+        if self._snapshot is None:
+            with self._sync_lock:
+                if self._snapshot is None:
+                    self._full_sync(refresh=True)
+        elif self._stale():
+            self._sync_in_background()
+        return self._snapshot
+
+    def download(self) -> list[dict]:
+        """Every record a full sync reads (with the ``fields`` projection)."""
+        return self.table.all(**self._projection())
+
+    def refresh(self, records=None, started=None) -> Snapshot:
+        """Run a full sync now and return its snapshot.
+
+        ``records`` are those of a :meth:`download` the caller already ran,
+        e.g. together with other tables, starting at ``started`` (UTC).
+        """
+        if self.offline:
+            return self._snapshot
+        with self._sync_lock:
+            self._full_sync(refresh=True, records=records, started=started)
+        return self._snapshot
+
+    def _stale(self):
+        return self._last_sync is None or time.monotonic() - self._last_sync >= self.ttl
+
+    def _full_sync_due(self):
+        return (self._last_full_sync is None
+                or time.monotonic() - self._last_full_sync >= self.full_sync_interval)
+
+    def _sync_in_background(self):
+        with self._worker_lock:
+            if self.syncing:
+                return
+            self._worker = threading.Thread(target=self._background_sync, daemon=True,
+                                            name="airtable-sync")
+            self._worker.start()
+
+    def _background_sync(self):
+        with self._sync_lock:
+            if not self._stale():
+                return
+            try:
+                if self.mode == "full" or self._watermark is None or self._full_sync_due():
+                    self._full_sync()
+                else:
+                    self._incremental_sync()
+                self.last_error = None
+            except Exception as exc:  # keep serving the previous snapshot
+                logger.exception("Airtable sync failed")
+                self.last_error = exc
+                self._last_sync = time.monotonic()
+
+    @perf.timed("snapshot.full_sync")
+    def _full_sync(self, refresh=False, records=None, started=None):
+        if records is None:
+            started, records = datetime.now(timezone.utc), self.download()
+        refresh = refresh or self._full_sync_due()
+        generation = started.isoformat() if refresh else self._generation
+        df = self._build(records, started, generation)
+        self._publish(df, started)
+        self._last_deletion_check = time.monotonic()
+        if refresh:
+            self._generation = generation
+            self._last_full_sync = time.monotonic()
+
+    def _projection(self):
+        return {"fields": self.fields} if self.fields else {}
+
+    def _build(self, records, started, generation, partial=False):
+        df = self.build_frame(records, partial)
+        if self.modified_field and self.modified_field in df:
+            version = df[self.modified_field].astype(str) + "@" + generation
+        else:
+            version = started.isoformat()
+        return df.assign(**{RECORD_VERSION_COLUMN: version})
+
+    @perf.timed("snapshot.incremental_sync")
+    def _incremental_sync(self):
+        started = datetime.now(timezone.utc)
+        df = self._snapshot.df
+
+        changed = self.table.all(formula=modified_since(self._watermark - SYNC_OVERLAP),
+                                 **self._projection())
+        if changed:
+            ids = [r["id"] for r in changed]
+            # A record may have lost its Id, so drop every changed row first and
+            # let build_frame decide which ones come back.
+            batch = self._build(changed, started, self._generation, partial=True)
+            df = pd.concat([df.drop(index=ids, errors="ignore"), batch])
+
+        if (self._last_deletion_check is None
+                or time.monotonic() - self._last_deletion_check >= self.deletion_check_interval):
+            live = {r["id"] for r in self.table.all(fields=[self.id_field])}
+            gone = df.index.difference(list(live))
+            if len(gone):
+                df = df.drop(index=gone)
+            self._last_deletion_check = time.monotonic()
+
+        self._publish(df, started)
+
+    def _publish(self, df, started):
+        now = datetime.now(timezone.utc)
+        if self._snapshot is not None and df is self._snapshot.df:
+            self._snapshot.synced_at = now
+        else:
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            self._snapshot = Snapshot(df=df, version=version, synced_at=now)
+            if self.path:
+                save_frame(df, self.path, watermark=started)
+        self._watermark = started
+        self._last_sync = time.monotonic()
@@ -0,0 +1,66 @@
+"""On-disk Parquet copy of the normalized feedback frame."""
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Schema metadata keys
+_JSON_COLUMNS_KEY = b"feedback_core.json_columns"
+_WATERMARK_KEY = b"feedback_core.watermark"
+
+
+def _needs_json(series: pd.Series) -> bool:
+    """Object columns holding anything but strings (lists, attachments, mixed types)."""
+    if series.dtype != object:
+        return False
+    return any(not isinstance(v, str) for v in series.dropna())
+
+
+def _encode(value):
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode(value):
+    # Missing cells come back as None, or NaN with pandas' string dtype
+    return json.loads(value) if isinstance(value, str) else float("nan")
+
+
+def save_frame(df: pd.DataFrame, path, watermark: datetime | None = None):
+    """Write ``df`` to ``path`` atomically.
+
+    Columns Airtable fills with lists or dicts are stored as JSON text so the
+    file round-trips whatever shape the API returned; ``watermark`` is the
+    time the data was synced, used to resume incremental syncs.
+    """
+    json_columns = [c for c in df.columns if _needs_json(df[c])]
+    out = df.copy()
+    for c in json_columns:
+        out[c] = out[c].map(_encode)
+
+    table = pa.Table.from_pandas(out, preserve_index=True)
+    meta = dict(table.schema.metadata or {})
+    meta[_JSON_COLUMNS_KEY] = json.dumps(json_columns).encode()
+    if watermark is not None:
+        meta[_WATERMARK_KEY] = watermark.isoformat().encode()
+    table = table.replace_schema_metadata(meta)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    pq.write_table(table, tmp)
+    os.replace(tmp, path)
+
+
+def load_frame(path) -> tuple[pd.DataFrame, datetime | None]:
+    """Read a frame written by :func:`save_frame` (memory-mapped) and its watermark."""
+    table = pq.read_table(path, memory_map=True)
+    meta = table.schema.metadata or {}
+    df = table.to_pandas()
+    for c in json.loads(meta.get(_JSON_COLUMNS_KEY, b"[]")):
+        df[c] = df[c].map(_decode).astype(object)
+    watermark = meta.get(_WATERMARK_KEY)
+    return df, datetime.fromisoformat(watermark.decode()) if watermark else None
@@ -0,0 +1,111 @@
+"""Per-startup data the page renders.
+
+:class:`StartupView` is precomputed once per snapshot for every startup; the
+mentor feedback needs the heavy flag fields and is built per selected row
+with :func:`build_mentor_feedback`.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+
+import pandas as pd
+
+from . import perf
+from .flags import _format_categories, collect_flag_records, extract_mentor_scores
+from .founder_tags import TagError
+from .founders import build_fact_table, flag_counts, founder_means
+from .memo import memoize_by_record
+
+FLAG_COLORS = ["red", "yellow", "green"]
+
+
+@dataclass
+class MentorFeedback:
+    name: str
+    # color → formatted markdown comments, with the mentor's category scores inlined
+    flags: dict[str, list[str]]
+
+
+@dataclass
+class StartupView:
+    startup_id: str
+    unconventional_thinking: dict[str, dict[str, int]]
+    confidence: dict[str, dict[str, int]]
+    ambition: dict[str, dict[str, int]]
+    # founder → ([pillar, ...], [mean score, ...])
+    pillar_means: dict[str, tuple[list[str], list[float]]]
+    # malformed "Founder & Score" entries, skipped above
+    tag_errors: list[TagError]
+
+    @property
+    def human_means(self) -> dict[str, pd.DataFrame]:
+        """founder → DataFrame with "Campo" (pillar) and "Media" (mean score), built when rendered."""
+        return {founder: pd.DataFrame({"Campo": pillars, "Media": values})
+                for founder, (pillars, values) in self.pillar_means.items()}
+
+
+@memoize_by_record()
+@perf.timed("mentor_feedback")
+def build_mentor_feedback(row) -> list[MentorFeedback]:
+    """Feedback per mentor, sorted by name; ``row`` must hold the flag fields."""
+    mentor_scores = extract_mentor_scores(row)
+
+    # Agrupar por mentor y color
+    grouped = defaultdict(lambda: defaultdict(list))  # mentor → color → [raw_text]
+    for mentor, color, raw_comment in collect_flag_records(row):
+        grouped[mentor][color].append(raw_comment)
+
+    out = []
+    for mentor in sorted(grouped):
+        scores = mentor_scores.get(mentor, {})
+        flags = {
+            color: [_format_categories(c, scores=scores) for c in grouped[mentor][color]]
+            for color in FLAG_COLORS
+            if grouped[mentor].get(color)
+        }
+        out.append(MentorFeedback(name=mentor, flags=flags))
+    return out
+
+
+@perf.timed("founders.views")
+def build_views(df: pd.DataFrame, facts=None, tag_errors=None) -> dict[str, StartupView]:
+    """Startup Id → view, for the first row of every Id in ``df``.
+
+    ``facts``/``tag_errors`` come from :func:`build_fact_table` and are built
+    here when not given.
+    """
+    df = df.drop_duplicates("Id")
+    if facts is None:
+        facts, tag_errors = build_fact_table(df)
+
+    # startup → pillar → founder → {"Bonus Star": n, "Red Flag": n}
+    counts = flag_counts(facts)
+    flags_by_id = defaultdict(lambda: defaultdict(dict))
+    for (startup_id, pillar, founder), bonus, red in zip(
+            counts.index, counts["Bonus Star"], counts["Red Flag"]):
+        flags_by_id[startup_id][pillar][founder] = {"Bonus Star": int(bonus), "Red Flag": int(red)}
+
+    # startup → founder → ([pillar], [mean]); the per-founder tables are built in StartupView.human_means
+    means = founder_means(facts).reset_index()
+    means_by_id = defaultdict(dict)
+    columns = (means[c].tolist() for c in ("startup_id", "founder", "pillar", "value"))
+    for startup_id, founder, pillar, value in zip(*columns):
+        pillars, values = means_by_id[str(startup_id)].setdefault(str(founder), ([], []))
+        pillars.append(str(pillar))
+        values.append(value)
+
+    errors_by_id = defaultdict(list)
+    for error in tag_errors or []:
+        errors_by_id[error.startup_id].append(error)
+
+    views = {}
+    for startup_id in df["Id"].tolist():
+        flags = flags_by_id.get(startup_id, {})
+        views[startup_id] = StartupView(
+            startup_id=startup_id,
+            unconventional_thinking=dict(flags.get("Unconventional Thinking", {})),
+            confidence=dict(flags.get("Confidence", {})),
+            ambition=dict(flags.get("Ambition", {})),
+            pillar_means=means_by_id.get(startup_id, {}),
+            tag_errors=errors_by_id.get(startup_id, []),
+        )
+    return views
@@ -0,0 +1,28 @@
+import pytest
+
+from benchmarks.mock_airtable import MockAirtable
+from feedback_core.fetch import AirtableFetcher
+
+BASE, TABLE = "appTest", "tblFeedback"
+
+
+def record(record_id, startup_id=None, **fields):
+    """An Airtable record of the feedback table."""
+    if startup_id is not None:
+        fields["Id"] = startup_id
+    return {"id": record_id, "createdTime": "2025-01-01T00:00:00.000Z", "fields": fields}
+
+
+@pytest.fixture
+def airtable():
+    """The mock Airtable API serving one feedback table (``airtable.tables[BASE, TABLE]``)."""
+    server = MockAirtable({(BASE, TABLE): []}, latency=0, rate=1000).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def fetcher(airtable):
+    fetcher = AirtableFetcher("key", api_url=airtable.url, backoff=0.01, rate_per_base=1000)
+    yield fetcher
+    fetcher.close()
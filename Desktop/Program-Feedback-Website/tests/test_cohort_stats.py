@@ -0,0 +1,38 @@
+import math
+
+import pandas as pd
+import pytest
+
+from feedback_core.cohort_stats import compute_cohort_stats
+
+
+@pytest.fixture
+def stats():
+    # Startup 1 has two rows: only the first one counts
+    df = pd.DataFrame({
+        "Id": ["1", "1", "2", "3", "4"],
+        "Average RISK": [4.0, 1.0, 3.0, 2.0, 1.0],
+        "Average Reward": [2.0, 2.0, 2.0, 2.0, None],
+    })
+    return compute_cohort_stats(df, columns=["Average RISK", "Average Reward", "Not a column"])
+
+
+def test_summary(stats):
+    assert list(stats.summary.index) == ["Average RISK", "Average Reward"]
+    assert stats.mean("Average RISK") == 2.5
+    assert stats.summary.at["Average Reward", "count"] == 3
+    assert stats.summary.at["Average RISK", "p50"] == 2.5
+    assert math.isnan(stats.mean("Not a column"))
+
+
+def test_position_of_a_startup(stats):
+    row = stats.for_startup("2", ["Average RISK", "Average Reward"])
+    assert row.at["Average RISK", "rank"] == 2            # rank 1 is the highest score
+    assert row.at["Average RISK", "percentile"] == 75
+    assert row.at["Average RISK", "z"] == pytest.approx(0.5 / stats.summary.at["Average RISK", "std"])
+    # Every startup scored the same: no z-score, all share rank 1
+    assert math.isnan(row.at["Average Reward", "z"]) and row.at["Average Reward", "rank"] == 1
+
+
+def test_unknown_startup(stats):
+    assert stats.for_startup("99", ["Average RISK"]).empty
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from feedback_core.details import DetailLoader
+from feedback_core.schema import RECORD_VERSION_COLUMN
+
+from .conftest import BASE, TABLE, record
+
+
+def snapshot_row(record_id, startup_id):
+    return pd.Series({"Id": startup_id, RECORD_VERSION_COLUMN: "v1"}, name=record_id)
+
+
+def test_row_gets_the_detail_fields(airtable, fetcher):
+    airtable.tables[BASE, TABLE].append(record("rec1", "1", **{"Call Notes": "Good call"}))
+    loader = DetailLoader(fetcher.table(BASE, TABLE), ["Call Notes"])
+    row = loader.load(snapshot_row("rec1", "1"))
+    assert row["Call Notes"] == "Good call" and row["Id"] == "1"
+
+    requests = airtable.requests
+    loader.load(snapshot_row("rec1", "1"))
+    assert airtable.requests == requests    # same record version: not fetched again
+
+
+def test_unknown_field_falls_back_to_local_projection(airtable, fetcher):
+    # A field of a newer cohort: Airtable answers 422 UNKNOWN_FIELD_NAME to the projection
+    airtable.tables[BASE, TABLE] += [record("rec1", "1", **{"Call Notes": "Good call", "Logo": "x"}),
+                                     record("rec2", "2", **{"Call Notes": "Short"})]
+    table = fetcher.table(BASE, TABLE)
+    loader = DetailLoader(table, ["Call Notes", "Pitch Deck"])
+    row = loader.load(snapshot_row("rec1", "1"))
+    assert not table.projectable
+    assert row["Call Notes"] == "Good call" and "Logo" not in row
+
+    df = loader.load_frame(pd.DataFrame({"Id": ["1", "2"]}, index=["rec1", "rec2"]))
+    assert df["Call Notes"].tolist() == ["Good call", "Short"]
@@ -0,0 +1,93 @@
+import pytest
+
+from benchmarks.mock_airtable import MockAirtable
+from feedback_core.cohorts import Cohort, CohortConfig, CohortNames
+from feedback_core.fetch import AirtableError, AirtableFetcher, TokenBucket
+from feedback_core.frame import build_frame
+from feedback_core.snapshot import SnapshotStore
+
+from .conftest import BASE, TABLE, record
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_waits_for_tokens():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+    bucket.acquire()
+    assert clock.slept == [pytest.approx(0.5)]
+
+
+def test_token_bucket_pause():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=5, capacity=1, clock=clock, sleep=clock.sleep)
+    bucket.pause(2)
+    bucket.acquire()
+    assert clock.now == pytest.approx(2.2)
+
+
+def pages(n):
+    return [record(f"rec{i}", str(i)) for i in range(n)]
+
+
+def test_429_is_retried():
+    server = MockAirtable({(BASE, TABLE): pages(250)}, latency=0, rate=2).start()
+    # The limiter lets everything through: the mock's 2 requests/s answer 429
+    fetcher = AirtableFetcher("key", api_url=server.url, backoff=0.05, rate_per_base=1000, max_retries=8)
+    try:
+        assert len(fetcher.fetch_table(BASE, TABLE)) == 250
+        assert server.throttled > 0
+    finally:
+        fetcher.close()
+        server.stop()
+
+
+def test_429_after_every_retry_raises():
+    server = MockAirtable({(BASE, TABLE): pages(150)}, latency=0, rate=1).start()
+    fetcher = AirtableFetcher("key", api_url=server.url, backoff=0.01, rate_per_base=1000, max_retries=1)
+    try:
+        with pytest.raises(AirtableError) as raised:
+            fetcher.fetch_table(BASE, TABLE)
+        assert raised.value.status == 429
+    finally:
+        fetcher.close()
+        server.stop()
+
+
+def test_fetch_many_raises_the_first_failure(airtable, fetcher):
+    airtable.tables[BASE, TABLE].append(record("rec1", "1"))
+    downloads = {"feedback": fetcher.table(BASE, TABLE).all, "missing": fetcher.table(BASE, "tblNope").all}
+    with pytest.raises(AirtableError):
+        fetcher.fetch_many(downloads)
+    assert fetcher.fetch_many({"feedback": downloads["feedback"]})["feedback"][0]["id"] == "rec1"
+
+
+def test_refresh_reads_names_and_feedback_together(airtable, fetcher, tmp_path):
+    airtable.tables[BASE, TABLE].append(record("rec1", "7"))
+    airtable.tables[BASE, "tblStartups"] = [record("recS", "7", Name="Acme")]
+    config = CohortConfig("2025", BASE, TABLE, names_path=str(tmp_path / "none.json"),
+                          startups_table="tblStartups")
+
+    def make_store(config, cohort):
+        return SnapshotStore(fetcher.table(BASE, TABLE),
+                             lambda records, partial: build_frame(records, cohort.names, partial))
+
+    cohort = Cohort(config, make_store, api=fetcher)
+    cohort._names = CohortNames()       # names read before the startup was named
+    snapshot = cohort.refresh()
+    assert cohort.names.startup("7") == "Acme"
+    assert snapshot.df.loc["rec1", "Startup Label"].startswith("Acme")
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from feedback_core.founder_tags import BONUS_STAR, RED_FLAG, TAG_FIELDS, parse_field, parse_frame
+
+FLAG_FIELD = next(f for f in TAG_FIELDS if f.metric == "Confidence")
+SCORE_FIELD = next(f for f in TAG_FIELDS if f.metric == "Purpose")
+
+
+def parse(spec, raw):
+    tags, errors = [], []
+    parse_field("7", spec, raw, tags, errors)
+    return tags, errors
+
+
+def test_flag_tags():
+    tags, errors = parse(FLAG_FIELD, "Ana Ruiz: Bonus Star, Luis  Gil : red flag")
+    assert errors == []
+    assert [(t.founder, t.value) for t in tags] == [("Ana Ruiz", BONUS_STAR), ("Luis Gil", RED_FLAG)]
+    assert {(t.startup_id, t.source, t.metric) for t in tags} == {("7", "Individual Contest", "Confidence")}
+
+
+def test_score_tags_from_a_lookup_list():
+    tags, errors = parse(SCORE_FIELD, ["Ana Ruiz: 3", "Luis Gil: 2.5, Ana Ruiz: -1"])
+    assert errors == []
+    assert [(t.founder, t.value) for t in tags] == [("Ana Ruiz", 3.0), ("Luis Gil", 2.5), ("Ana Ruiz", -1.0)]
+
+
+def test_malformed_entries_are_reported_not_raised():
+    tags, errors = parse(SCORE_FIELD, "Ana Ruiz: 3, Luis Gil 2, Eva: three, : 4, Pau: 1:2")
+    assert [(t.founder, t.value) for t in tags] == [("Ana Ruiz", 3.0)]
+    assert [(e.entry, e.reason) for e in errors] == [
+        ("Luis Gil 2", 'expected "Founder: value"'),
+        ("Eva: three", "expected a number, got 'three'"),
+        (": 4", 'expected "Founder: value"'),
+        ("Pau: 1:2", 'expected "Founder: value"'),
+    ]
+
+
+def test_flag_fields_only_take_flag_values():
+    tags, errors = parse(FLAG_FIELD, "Ana Ruiz: 3")
+    assert tags == []
+    assert errors[0].reason == "expected Bonus Star or Red Flag, got '3'"
+
+
+def test_non_text_entries():
+    tags, errors = parse(SCORE_FIELD, [{"id": "rec1"}])
+    assert tags == []
+    assert errors[0].reason == "not text"
+
+
+def test_parse_frame_skips_empty_cells_and_missing_fields():
+    df = pd.DataFrame({"Id": ["1", "2"], SCORE_FIELD.field: ["Ana: 4", float("nan")]})
+    tags, errors = parse_frame(df)
+    assert errors == []
+    assert [(t.startup_id, t.founder, t.metric, t.value) for t in tags] == [("1", "Ana", "Purpose", 4.0)]
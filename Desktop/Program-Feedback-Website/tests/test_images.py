@@ -0,0 +1,73 @@
+import io
+import os
+
+import requests
+from PIL import Image
+
+from feedback_core.images import ImageCache
+
+
+def png(seed):
+    im = Image.effect_noise((64, 64), 40 + seed).convert("RGB")
+    out = io.BytesIO()
+    im.save(out, "PNG")
+    return out.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        if self.content is None:
+            raise requests.HTTPError("410 Gone")
+
+
+class FakeSession:
+    """``url → bytes``; a missing URL answers 410 like an expired attachment."""
+
+    def __init__(self, images):
+        self.images = images
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        return FakeResponse(self.images.get(url))
+
+
+def attachment(name):
+    return {"id": f"att{name}", "url": f"https://example.com/{name}.png"}
+
+
+def test_least_recently_used_logo_is_evicted(tmp_path):
+    session = FakeSession({f"https://example.com/{n}.png": png(i) for i, n in enumerate("abc")})
+    cache = ImageCache(str(tmp_path), width=64, session=session)
+    size = os.path.getsize(cache.get(attachment("a")))
+    cache.max_bytes = int(size * 2.5)     # room for two logos
+
+    path_b = cache.get(attachment("b"))
+    cache.get(attachment("a"))            # a is now the most recently used
+    cache.get(attachment("c"))
+
+    assert not os.path.exists(path_b)
+    assert [os.path.basename(p) for p in cache._entries] == ["atta_64.webp", "attc_64.webp"]
+    assert cache.total_bytes <= cache.max_bytes
+    # A new cache finds the files left on disk
+    assert len(ImageCache(str(tmp_path), width=64, session=session)._entries) == 2
+
+
+def test_failed_url_is_not_retried_within_the_ttl(tmp_path):
+    session = FakeSession({})
+    cache = ImageCache(str(tmp_path), session=session, failure_ttl=300)
+    assert cache.get(attachment("gone")) is None
+    assert cache.get(attachment("gone")) is None
+    assert len(session.requested) == 1
+
+
+def test_offline_serves_only_cached_files(tmp_path):
+    session = FakeSession({"https://example.com/a.png": png(0)})
+    assert ImageCache(str(tmp_path), width=64, session=session).get(attachment("a"))
+    offline = ImageCache(str(tmp_path), width=64, session=session, offline=True)
+    assert offline.get(attachment("a"))
+    assert offline.get(attachment("b")) is None
+    assert len(session.requested) == 1
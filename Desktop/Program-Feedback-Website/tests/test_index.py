@@ -0,0 +1,29 @@
+import pandas as pd
+
+from feedback_core.cohorts import CohortNames
+from feedback_core.index import build_index
+
+
+def make_index():
+    df = pd.DataFrame({"Id": ["10", "2", "2", "x7", "3"]})
+    return df, build_index(df, CohortNames(startups={"2": "Acme", "10": "Zeta Labs", "x7": "Omega"}))
+
+
+def test_options_are_named_ids_in_numeric_order():
+    _, index = make_index()
+    assert index.options == ["2", "10", "x7"]
+    assert index.labels["10"] == "Zeta Labs"
+
+
+def test_row_is_the_first_row_of_the_id():
+    df, index = make_index()
+    assert index.row(df, "2").name == 1
+    assert index.row(df, "99") is None
+
+
+def test_find_by_name_or_id():
+    _, index = make_index()
+    assert index.find(" zeta labs ") == "10"
+    assert index.find("2") == "2"
+    assert index.find("3") == "3"       # an Id without a name
+    assert index.find("Nobody") is None
@@ -0,0 +1,52 @@
+from feedback_core.mentors import NameMatcher, normalize_name
+
+
+def names(matcher, text):
+    return [name for _, _, name in matcher.finditer(text)]
+
+
+def test_normalize_name():
+    assert normalize_name("  Anna \t Fedulow ") == "anna fedulow"
+
+
+def test_case_and_whitespace_insensitive():
+    matcher = NameMatcher(["Anna Fedulow"])
+    assert names(matcher, "ANNA   fedulow: great team") == ["Anna Fedulow"]
+    assert names(matcher, "anna\nFedulow") == ["Anna Fedulow"]
+
+
+def test_offsets_point_into_the_original_text():
+    matcher = NameMatcher(["Anna Fedulow", "Jaime Ruiz"])
+    text = "Notes  \n\n from   Anna    Fedulow: ok. Jaime\tRuiz"
+    hits = matcher.finditer(text)
+    assert [text[start:end] for start, end, _ in hits] == ["Anna    Fedulow", "Jaime\tRuiz"]
+    assert [name for _, _, name in hits] == ["Anna Fedulow", "Jaime Ruiz"]
+
+
+def test_aliases_report_the_canonical_name():
+    matcher = NameMatcher(["Elise Mitchell"], aliases={"Elise Mitchel": "Elise Mitchell"})
+    assert names(matcher, "Elise Mitchel: fine") == ["Elise Mitchell"]
+    assert matcher.canonical("elise  mitchel") == "Elise Mitchell"
+    assert matcher.canonical("Someone   Else") == "Someone Else"
+
+
+def test_word_boundary_after_the_name():
+    matcher = NameMatcher(["Jaime Ruiz"])
+    # Rollups glue the name to the next capitalised word
+    assert names(matcher, "Jaime RuizState of development: good") == ["Jaime Ruiz"]
+    assert names(matcher, "Jaime Ruiz: good") == ["Jaime Ruiz"]
+    assert names(matcher, "Jaime Ruiz") == ["Jaime Ruiz"]
+    assert names(matcher, "Jaime Ruizgarcia said") == []
+
+
+def test_leftmost_longest_without_overlaps():
+    matcher = NameMatcher(["Ana Maria", "Ana Maria Lopez", "Maria Lopez"])
+    assert names(matcher, "Ana Maria Lopez: yes") == ["Ana Maria Lopez"]
+    assert names(matcher, "Ana Maria: yes, Maria Lopez: no") == ["Ana Maria", "Maria Lopez"]
+
+
+def test_longer_lower_case_characters_keep_offsets():
+    matcher = NameMatcher(["Ivan Ruiz"])
+    text = "İ Ivan Ruiz"
+    [(start, end, name)] = matcher.finditer(text)
+    assert text[start:end] == "Ivan Ruiz"
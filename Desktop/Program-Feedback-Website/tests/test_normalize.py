@@ -0,0 +1,22 @@
+import math
+
+import pandas as pd
+
+from feedback_core.normalize import normalize_frame
+
+SPECIAL = {"specialValue": "NaN"}
+
+
+def test_special_values_in_mixed_columns():
+    df = pd.DataFrame({
+        "text": ["a", SPECIAL, "b"],
+        "lookup": [["x"], ["y"], SPECIAL],
+        "Average RISK": [2, SPECIAL, "3.5"],
+        "plain": ["a", "b", "c"],
+    })
+    out = normalize_frame(df)
+    assert out["text"].tolist()[::2] == ["a", "b"] and math.isnan(out["text"][1])
+    assert out["lookup"].tolist()[:2] == [["x"], ["y"]] and math.isnan(out["lookup"][2])
+    assert out["Average RISK"].dtype == "float64"
+    assert out["Average RISK"].tolist()[::2] == [2.0, 3.5] and math.isnan(out["Average RISK"][1])
+    assert out["plain"].tolist() == ["a", "b", "c"]
@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from feedback_core.records import SchemaError, check_schema
+
+
+def test_numbers_and_numeric_text_pass():
+    check_schema(pd.DataFrame({"Id": ["1", "2", "3"], "Average RISK": [2, "3.5", {"specialValue": "NaN"}]}))
+    check_schema(pd.DataFrame({"Id": ["1", "2"], "Average RISK": [2.0, None]}))
+
+
+def test_text_in_a_score_column():
+    df = pd.DataFrame({"Id": ["1", "2"], "Average RISK": [2, "high"]})
+    with pytest.raises(SchemaError, match="'Average RISK' should hold numbers, got 'high'"):
+        check_schema(df)
+
+
+def test_all_text_score_column():
+    df = pd.DataFrame({"Id": ["1", "2"], "Average RISK": ["high", "low"]})
+    with pytest.raises(SchemaError, match="Average RISK"):
+        check_schema(df)
+
+
+def test_records_without_id():
+    with pytest.raises(SchemaError, match="'Id'"):
+        check_schema(pd.DataFrame({"Average RISK": [2]}))
+
+
+def test_missing_score_fields_are_only_logged(caplog):
+    check_schema(pd.DataFrame({"Id": ["1"]}))
+    assert "No record has the fields" in caplog.text
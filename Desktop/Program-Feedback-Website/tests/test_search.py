@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from feedback_core import flags
+from feedback_core.mentors import NameMatcher
+from feedback_core.search import SOURCE_CALL, SOURCE_FLAG, SearchIndex, FeedbackEntry, words
+
+
+def entry(text, startup_id="1", mentor="Ana Ruiz", color="red", category=None, source=SOURCE_FLAG):
+    return FeedbackEntry(startup_id, mentor, source, color, category, text)
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([
+        entry("Regulation is the main risk", category="Market"),
+        entry("Strong regulatory moat", startup_id="2", color="green", category="Market"),
+        entry("Great team, good market momentum", mentor="Luis Gil", color="green", category="Team"),
+        entry("Market is huge", startup_id="2", mentor="Luis Gil", color="yellow"),
+        entry("Café con los fundadores: muy bien", mentor="Eva Pons", source=SOURCE_CALL, color=None),
+    ])
+
+
+def texts(found):
+    return [e.text for e in found]
+
+
+def test_words_fold_case_and_accents():
+    assert words("Café, NIÑO  go-to") == ["cafe", "nino", "go", "to"]
+
+
+def test_prefix_match(index):
+    assert texts(index.search("regul")) == ["Regulation is the main risk", "Strong regulatory moat"]
+    assert texts(index.search("REGULATION")) == ["Regulation is the main risk"]
+
+
+def test_short_words_only_match_whole_words(index):
+    assert texts(index.search("is")) == ["Regulation is the main risk", "Market is huge"]
+    assert index.search("hu") == []
+
+
+def test_every_word_must_match(index):
+    assert texts(index.search("market momentum")) == ["Great team, good market momentum"]
+    assert index.search("regulation momentum") == []
+
+
+def test_phrase_match(index):
+    assert texts(index.search('"market momentum"')) == ["Great team, good market momentum"]
+    assert index.search('"momentum market"') == []
+    assert texts(index.search('"main risk" regul')) == ["Regulation is the main risk"]
+
+
+def test_accents_are_ignored(index):
+    assert texts(index.search("cafe")) == ["Café con los fundadores: muy bien"]
+    assert texts(index.search("fundadóres")) == ["Café con los fundadores: muy bien"]
+
+
+def test_mentor_and_category_words_are_searchable(index):
+    assert texts(index.search("luis")) == ["Great team, good market momentum", "Market is huge"]
+    assert len(index.search("market")) == 4     # three texts plus the Market category
+
+
+def test_filters(index):
+    assert texts(index.search("market", colors=["green"])) == [
+        "Strong regulatory moat", "Great team, good market momentum"]
+    assert texts(index.search(categories=["Team"])) == ["Great team, good market momentum"]
+    assert texts(index.search(startups=["2"], mentors=["Luis Gil"])) == ["Market is huge"]
+    assert texts(index.search(sources=[SOURCE_CALL])) == ["Café con los fundadores: muy bien"]
+    assert index.search("market", colors=["purple"]) == []
+    assert index.search() == []
+    assert index.mentors == ["Ana Ruiz", "Eva Pons", "Luis Gil"]
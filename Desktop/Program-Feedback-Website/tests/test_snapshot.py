@@ -0,0 +1,92 @@
+from feedback_core.cohorts import CohortNames
+from feedback_core.frame import build_frame
+from feedback_core.schema import RECORD_VERSION_COLUMN
+from feedback_core.snapshot import SnapshotStore
+
+from .conftest import BASE, TABLE, record
+
+
+def make_store(fetcher, **options):
+    # ttl=0: every sync() is due; only the first get() is called, it syncs in place
+    options = {"ttl": 0, "deletion_check_interval": 3600, "full_sync_interval": 3600, **options}
+    return SnapshotStore(fetcher.table(BASE, TABLE),
+                         lambda records, partial: build_frame(records, CohortNames(), partial), **options)
+
+
+def sync(store):
+    """One sync, run here instead of on the background thread ``get()`` would start."""
+    store._background_sync()
+    assert store.last_error is None, store.last_error
+    return store._snapshot
+
+
+def test_incremental_sync_merges_changed_records(airtable, fetcher):
+    airtable.tables[BASE, TABLE] += [record("rec1", "1", **{"Average RISK": 2}),
+                                     record("rec2", "2", **{"Average RISK": 3})]
+    store = make_store(fetcher)
+    first = store.get()
+    assert sorted(first.df["Id"]) == ["1", "2"]
+
+    airtable.tables[BASE, TABLE][1] = record("rec2", "2", **{"Average RISK": 4})
+    airtable.tables[BASE, TABLE].append(record("rec3", "3", **{"Average RISK": 1}))
+    airtable.touch("rec2", "rec3")
+    second = sync(store)
+
+    assert second.version == first.version + 1
+    assert second.df.loc["rec2", "Average RISK"] == 4
+    assert second.df.loc["rec3", "Risk Level"] == "Low"
+    # Untouched records are not downloaded again
+    assert second.df.loc["rec1", RECORD_VERSION_COLUMN] == first.df.loc["rec1", RECORD_VERSION_COLUMN]
+    assert second.df.loc["rec2", RECORD_VERSION_COLUMN] != first.df.loc["rec2", RECORD_VERSION_COLUMN]
+    assert second.df.index.is_unique
+
+
+def test_unchanged_table_keeps_the_version(airtable, fetcher):
+    airtable.tables[BASE, TABLE].append(record("rec1", "1"))
+    store = make_store(fetcher)
+    first = store.get()
+    assert sync(store).version == first.version
+
+
+def test_record_that_lost_its_id_is_dropped(airtable, fetcher):
+    airtable.tables[BASE, TABLE] += [record("rec1", "1"), record("rec2", "2")]
+    store = make_store(fetcher)
+    store.get()
+
+    airtable.tables[BASE, TABLE][1] = record("rec2", Name="no Id any more")
+    airtable.touch("rec2")
+    df = sync(store).df
+    assert list(df.index) == ["rec1"]
+
+
+def test_deleted_records_are_detected(airtable, fetcher):
+    airtable.tables[BASE, TABLE] += [record("rec1", "1"), record("rec2", "2")]
+    store = make_store(fetcher, deletion_check_interval=0)
+    store.get()
+
+    del airtable.tables[BASE, TABLE][0]
+    assert list(sync(store).df.index) == ["rec2"]
+
+
+def test_periodic_full_sync_refreshes_computed_fields(airtable, fetcher):
+    airtable.tables[BASE, TABLE].append(record("rec1", "1", **{"Average RISK": 2}))
+    store = make_store(fetcher)
+    store.get()
+
+    # A rollup changed: LAST_MODIFIED_TIME() does not move, the delta misses it
+    airtable.tables[BASE, TABLE][0] = record("rec1", "1", **{"Average RISK": 4})
+    assert sync(store).df.loc["rec1", "Average RISK"] == 2
+
+    store.full_sync_interval = 0
+    assert sync(store).df.loc["rec1", "Average RISK"] == 4
+
+
+def test_full_sync_bumps_the_modified_field_version(airtable, fetcher):
+    airtable.tables[BASE, TABLE].append(record("rec1", "1", **{"Last Modified": "2025-01-01"}))
+    store = make_store(fetcher, modified_field="Last Modified")
+    before = store.get().df.loc["rec1", RECORD_VERSION_COLUMN]
+    assert before.startswith("2025-01-01@")
+
+    store.full_sync_interval = 0
+    airtable.tables[BASE, TABLE][0] = record("rec1", "1", **{"Last Modified": "2025-01-01", "Average RISK": 3})
+    assert sync(store).df.loc["rec1", RECORD_VERSION_COLUMN] != before
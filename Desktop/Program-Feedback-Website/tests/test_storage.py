@@ -0,0 +1,54 @@
+import math
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from feedback_core.snapshot import SnapshotStore
+from feedback_core.storage import load_frame, save_frame
+
+
+def test_parquet_round_trip(tmp_path):
+    path = tmp_path / "snapshot.parquet"
+    df = pd.DataFrame(
+        {
+            "Id": ["1", "2", "3"],
+            "Average RISK": [2.5, float("nan"), 4.0],
+            "Mentors": [["Ana", "Luis"], [], float("nan")],
+            "original logo": [[{"id": "att1", "url": "https://x/1.png"}], float("nan"), float("nan")],
+            "Mixed": ["text", 3, {"specialValue": "NaN"}],
+            "Notes": ["á é", None, "plain"],
+        },
+        index=pd.Index(["rec1", "rec2", "rec3"]),
+    )
+    watermark = datetime(2025, 5, 1, 12, 30, tzinfo=timezone.utc)
+    save_frame(df, str(path), watermark=watermark)
+
+    loaded, loaded_watermark = load_frame(str(path))
+    assert loaded_watermark == watermark
+    assert list(loaded.index) == ["rec1", "rec2", "rec3"]
+    assert list(loaded.columns) == list(df.columns)
+    assert loaded["Average RISK"].tolist()[::2] == [2.5, 4.0] and math.isnan(loaded.loc["rec2", "Average RISK"])
+    assert loaded.loc["rec1", "Mentors"] == ["Ana", "Luis"]
+    assert loaded.loc["rec2", "Mentors"] == []
+    assert math.isnan(loaded.loc["rec3", "Mentors"])
+    assert loaded.loc["rec1", "original logo"] == [{"id": "att1", "url": "https://x/1.png"}]
+    assert loaded["Mixed"].tolist() == ["text", 3, {"specialValue": "NaN"}]
+    assert loaded.loc["rec1", "Notes"] == "á é"
+
+
+def test_save_without_watermark(tmp_path):
+    path = str(tmp_path / "snapshot.parquet")
+    save_frame(pd.DataFrame({"Id": ["1"]}, index=["rec1"]), path)
+    assert load_frame(path)[1] is None
+
+
+def test_offline_store_serves_the_file(tmp_path):
+    path = str(tmp_path / "snapshot.parquet")
+    watermark = datetime(2025, 5, 1, tzinfo=timezone.utc)
+    save_frame(pd.DataFrame({"Id": ["1"]}, index=["rec1"]), path, watermark=watermark)
+
+    store = SnapshotStore(None, build_frame=None, path=path)
+    snapshot = store.get()
+    assert store.offline and store.ready
+    assert snapshot.synced_at == watermark
+    assert snapshot.df.loc["rec1", "Id"] == "1"